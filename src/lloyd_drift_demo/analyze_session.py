@@ -1,48 +1,256 @@
-import pandas as pd
-import matplotlib.pyplot as plt
+"""Drift journal summary — streamed, incremental, and plot-on-request.
+
+    python -m lloyd_drift_demo.analyze_session drift_journal.jsonl [--plot]
+
+The journal is read in binary chunks from the last checkpointed byte offset,
+so re-running over a growing journal only processes newly appended lines.
+Running aggregates live in a small JSON checkpoint next to the journal.
+Numeric fields (drift, drift_score, emphasis_score, tier) are read directly
+from each entry; matplotlib is only imported when a plot is requested.
+"""
+
+import os
+import sys
 import json
-from datetime import datetime
-
-# === Load session log ===
-file_path = "drift_journal.jsonl"
-
-# Parse JSONL entries
-with open(file_path, "r") as f:
-    records = [json.loads(line) for line in f if line.strip()]
-
-df = pd.DataFrame(records)
-
-# Ensure timestamp is datetime
-df["timestamp"] = pd.to_datetime(df["timestamp"])
-
-# === Print basic stats ===
-total = len(df)
-num_drift = df["drift"].sum()
-avg_emphasis = df["emphasis_score"].mean()
-avg_drift = df[df["drift"] == True]["rationale"].str.extract(r"Δ=([-0-9.]+)").astype(float).mean()[0]
-
-print("\n📊 Drift Journal Summary")
-print(f"Total entries: {total}")
-print(f"Drift events: {num_drift} ({num_drift/total:.1%})")
-print(f"Average emphasis score: {avg_emphasis:.3f}")
-print(f"Average Δ for drift entries: {avg_drift:.2f}")
-
-# === Top rationales (if any) ===
-print("\n🧠 Top Rationales:")
-print(df["rationale"].dropna().value_counts().head())
-
-# === Drift Score Over Time ===
-print("\n📈 Plotting drift score over time...")
-df_plot = df.copy()
-df_plot["drift_score"] = df_plot["rationale"].str.extract(r"Δ=([-0-9.]+)").astype(float)
-
-plt.figure(figsize=(10, 5))
-plt.plot(df_plot["timestamp"], df_plot["drift_score"], marker="o", linestyle="-")
-plt.axhline(y=0, color="gray", linestyle="--", linewidth=0.5)
-plt.title("Drift Score Over Time")
-plt.xlabel("Timestamp")
-plt.ylabel("Δ Drift Score")
-plt.xticks(rotation=45)
-plt.tight_layout()
-plt.grid(True)
-plt.show()
\ No newline at end of file
+import hashlib
+import argparse
+from dataclasses import dataclass, field, asdict
+from typing import Dict, Iterator, Optional, Tuple
+
+DEFAULT_JOURNAL = "drift_journal.jsonl"
+CHUNK_SIZE = 1 << 20
+HEAD_BYTES = 4096           # fingerprint of the file start, to detect rotation/truncation
+MAX_RATIONALES = 500        # rationale histogram is pruned to its top half beyond this
+DRIFT_SCORE_THRESHOLD = 70  # matches analyze_drift's drift cut-off for entries lacking "drift"
+
+
+# === Running aggregates ===
+@dataclass
+class SessionStats:
+    total: int = 0
+    drift_count: int = 0
+    emphasis_sum: float = 0.0
+    emphasis_count: int = 0
+    drift_score_sum: float = 0.0
+    drift_delta_sum: float = 0.0   # drift_score summed over drift entries only
+    labels: Dict[str, int] = field(default_factory=dict)
+    tiers: Dict[str, int] = field(default_factory=dict)
+    rationales: Dict[str, int] = field(default_factory=dict)
+    first_timestamp: Optional[str] = None
+    last_timestamp: Optional[str] = None
+    bad_lines: int = 0
+
+    def update(self, entry: dict):
+        result = entry.get("result") or {}
+        label = entry.get("label", result.get("label"))
+        score = entry.get("drift_score", result.get("drift_score"))
+        rationale = entry.get("rationale", result.get("rationale"))
+        drift = entry.get("drift")
+        if drift is None and score is not None:
+            drift = score >= DRIFT_SCORE_THRESHOLD
+
+        self.total += 1
+        if drift:
+            self.drift_count += 1
+            if score is not None:
+                self.drift_delta_sum += score
+        if score is not None:
+            self.drift_score_sum += score
+        emphasis = entry.get("emphasis_score")
+        if emphasis is not None:
+            self.emphasis_sum += emphasis
+            self.emphasis_count += 1
+        if label is not None:
+            self.labels[label] = self.labels.get(label, 0) + 1
+        tier = entry.get("tier")
+        if tier is None and score is not None:
+            tier = str(int(score) // 10)
+        if tier is not None:
+            self.tiers[str(tier)] = self.tiers.get(str(tier), 0) + 1
+        if rationale:
+            self.rationales[rationale] = self.rationales.get(rationale, 0) + 1
+            if len(self.rationales) > MAX_RATIONALES:
+                top = sorted(self.rationales.items(), key=lambda kv: kv[1], reverse=True)
+                self.rationales = dict(top[: MAX_RATIONALES // 2])
+        timestamp = entry.get("timestamp")
+        if timestamp:
+            self.first_timestamp = self.first_timestamp or timestamp
+            self.last_timestamp = timestamp
+
+    @property
+    def drift_rate(self) -> float:
+        return self.drift_count / self.total if self.total else 0.0
+
+    @property
+    def mean_emphasis(self) -> float:
+        return self.emphasis_sum / self.emphasis_count if self.emphasis_count else 0.0
+
+    @property
+    def mean_drift_delta(self) -> float:
+        return self.drift_delta_sum / self.drift_count if self.drift_count else 0.0
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SessionStats":
+        return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
+
+
+# === Journal streaming ===
+def _head_fingerprint(path: str, length: int) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read(length)).hexdigest()
+
+
+def iter_journal(path: str, offset: int = 0, chunk_size: int = CHUNK_SIZE) -> Iterator[Tuple[Optional[dict], int]]:
+    """Yield ``(entry, end_offset)`` for each complete line after ``offset``.
+
+    A trailing line without a newline is left for the next run. Lines that
+    are not valid JSON objects yield ``(None, end_offset)``.
+    """
+    with open(path, "rb") as f:
+        f.seek(offset)
+        pending = b""
+        position = offset
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            pending += chunk
+            lines = pending.split(b"\n")
+            pending = lines.pop()
+            for line in lines:
+                position += len(line) + 1
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    entry = None
+                yield (entry if isinstance(entry, dict) else None), position
+
+
+def default_checkpoint_path(journal_path: str) -> str:
+    return journal_path + ".stats.json"
+
+
+def update_session_stats(
+    journal_path: str = DEFAULT_JOURNAL,
+    checkpoint_path: Optional[str] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> SessionStats:
+    """Fold newly appended journal lines into the checkpointed aggregates.
+
+    Pass ``checkpoint_path=""`` to skip the checkpoint and scan from the start.
+    """
+    if checkpoint_path is None:
+        checkpoint_path = default_checkpoint_path(journal_path)
+
+    stats, offset = SessionStats(), 0
+    size = os.path.getsize(journal_path)
+
+    if checkpoint_path and os.path.exists(checkpoint_path):
+        with open(checkpoint_path, "r", encoding="utf-8") as f:
+            saved = json.load(f)
+        # A shorter file or a changed head means the journal was rotated or rewritten.
+        saved_offset = saved.get("offset", 0)
+        if saved_offset <= size and saved.get("head") == _head_fingerprint(
+            journal_path, min(saved_offset, HEAD_BYTES)
+        ):
+            stats = SessionStats.from_dict(saved.get("stats", {}))
+            offset = saved_offset
+
+    for entry, end in iter_journal(journal_path, offset, chunk_size):
+        if entry is None:
+            stats.bad_lines += 1
+        else:
+            stats.update(entry)
+        offset = end
+
+    if checkpoint_path:
+        head = _head_fingerprint(journal_path, min(offset, HEAD_BYTES))
+        tmp = checkpoint_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"journal": os.path.abspath(journal_path), "offset": offset,
+                       "head": head, "stats": stats.to_dict()}, f)
+        os.replace(tmp, checkpoint_path)
+    return stats
+
+
+# === Reporting ===
+def print_summary(stats: SessionStats, top: int = 5):
+    print("\n📊 Drift Journal Summary")
+    print(f"Total entries: {stats.total}")
+    print(f"Drift events: {stats.drift_count} ({stats.drift_rate:.1%})")
+    print(f"Average emphasis score: {stats.mean_emphasis:.3f}")
+    print(f"Average Δ for drift entries: {stats.mean_drift_delta:.2f}")
+    if stats.bad_lines:
+        print(f"Skipped malformed lines: {stats.bad_lines}")
+
+    print("\n🏷 Labels:")
+    for label, count in sorted(stats.labels.items(), key=lambda kv: kv[1], reverse=True):
+        print(f"  {label:<26}{count}")
+    print("\n🪜 Tiers:")
+    for tier, count in sorted(stats.tiers.items(), key=lambda kv: int(kv[0]) if kv[0].lstrip("-").isdigit() else 0):
+        print(f"  {tier:<6}{count}")
+    print("\n🧠 Top Rationales:")
+    for rationale, count in sorted(stats.rationales.items(), key=lambda kv: kv[1], reverse=True)[:top]:
+        print(f"  {count:>6}  {rationale}")
+
+
+def plot_drift(journal_path: str = DEFAULT_JOURNAL, max_points: int = 5000):
+    """Plot drift score over time, decimating long journals to ``max_points``."""
+    from datetime import datetime
+    import matplotlib.pyplot as plt
+
+    points = []
+    stride = 1
+    for i, (entry, _) in enumerate(iter_journal(journal_path)):
+        if entry is None or i % stride:
+            continue
+        score = entry.get("drift_score", (entry.get("result") or {}).get("drift_score"))
+        if score is None or "timestamp" not in entry:
+            continue
+        points.append((datetime.fromisoformat(entry["timestamp"]), score))
+        if len(points) >= 2 * max_points:
+            points = points[::2]
+            stride *= 2
+
+    print("\n📈 Plotting drift score over time...")
+    plt.figure(figsize=(10, 5))
+    plt.plot([p[0] for p in points], [p[1] for p in points], marker="o", linestyle="-")
+    plt.axhline(y=0, color="gray", linestyle="--", linewidth=0.5)
+    plt.title("Drift Score Over Time")
+    plt.xlabel("Timestamp")
+    plt.ylabel("Δ Drift Score")
+    plt.xticks(rotation=45)
+    plt.tight_layout()
+    plt.grid(True)
+    plt.show()
+
+
+def build_parser(parser: Optional[argparse.ArgumentParser] = None) -> argparse.ArgumentParser:
+    parser = parser or argparse.ArgumentParser(description="Summarize a drift journal incrementally.")
+    parser.add_argument("journal", nargs="?", default=DEFAULT_JOURNAL)
+    parser.add_argument("--checkpoint", help="checkpoint file (default: <journal>.stats.json)")
+    parser.add_argument("--no-checkpoint", action="store_true", help="rescan the whole journal, keep no state")
+    parser.add_argument("--plot", action="store_true", help="plot drift score over time (needs matplotlib)")
+    return parser
+
+
+def run(args: argparse.Namespace) -> int:
+    checkpoint = "" if args.no_checkpoint else args.checkpoint
+    stats = update_session_stats(args.journal, checkpoint_path=checkpoint)
+    print_summary(stats)
+    if args.plot:
+        plot_drift(args.journal)
+    return 0
+
+
+def main(argv: Optional[list] = None) -> int:
+    return run(build_parser().parse_args(argv))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,366 @@
+"""``lloyd-drift`` command line interface.
+
+    lloyd-drift score conversations.jsonl -o scored.jsonl --progress
+    lloyd-drift score conversations.jsonl -o scored.jsonl --alerts alerts.jsonl
+    cat export.csv | lloyd-drift score --format csv > scored.jsonl
+    lloyd-drift serve --port 8765
+    lloyd-drift --polarity-backend lexicon score conversations.jsonl
+    lloyd-drift document transcript.txt -o chunks.jsonl
+
+Input is read, scored and written one record at a time through a chain of
+generators. Nothing is read ahead of what the writer has consumed, so memory
+stays flat on multi-GB inputs and a slow consumer downstream of stdout
+naturally throttles the reader (backpressure through the pipe).
+"""
+
+import argparse
+import csv
+import io
+import json
+import sys
+import time
+from collections import OrderedDict
+from typing import IO, Any, Iterable, Iterator, Optional, Tuple
+
+from lloyd_drift_demo import analyze_session, server
+from lloyd_drift_demo.drift_types import DriftMemory
+from lloyd_drift_demo.engine.drift_engine import analyze_drift, analyze_document
+from lloyd_drift_demo.engine.escalation import DEFAULT_WINDOW, EscalationAlert, EscalationMonitor
+from lloyd_drift_demo.engine.polarity_backends import POLARITY_BACKENDS, set_polarity_backend
+
+RESULT_FIELDS = [
+    "conversation_id", "turn", "label", "drift", "drift_score",
+    "tier", "tone_badge", "rationale",
+]
+
+
+# ——————————————
+# Reading
+# ——————————————
+def read_records(stream: IO[str], fmt: str) -> Iterator[dict]:
+    """Yield one dict per JSONL line or CSV row; malformed JSON lines are skipped."""
+    for _, record in read_numbered_records(stream, fmt):
+        yield record
+
+
+def read_numbered_records(stream: IO[str], fmt: str) -> Iterator[Tuple[int, dict]]:
+    """``read_records`` with the line each record starts on, for error reports."""
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        reader.fieldnames  # reads the header row
+        line_no = reader.line_num + 1
+        for record in reader:
+            yield line_no, record
+            line_no = reader.line_num + 1
+        return
+    for line_no, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            print(f"[WARN] line {line_no}: invalid JSON ({e})", file=sys.stderr)
+            continue
+        if isinstance(record, dict):
+            yield line_no, record
+
+
+# ——————————————
+# Scoring
+# ——————————————
+def _blank(value: Any) -> bool:
+    # Empty CSV cells arrive as "", JSON nulls as None; both mean "not given"
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def score_records(
+    records: Iterable[dict],
+    text_field: str = "incoming",
+    baseline_field: str = "baseline",
+    conversation_field: str = "conversation_id",
+    max_conversations: int = 100_000,
+    include_text: bool = False,
+    monitor: Optional[EscalationMonitor] = None,
+    numbered: bool = False,
+) -> Iterator[dict]:
+    """Score records in order, carrying a DriftMemory per conversation.
+
+    A record without a baseline is scored against the previous turn of its
+    conversation; the first such turn only seeds the conversation. Idle
+    conversations beyond ``max_conversations`` are forgotten, oldest first.
+    With a ``monitor``, each scored turn of a conversation is also observed
+    for escalation before its row is yielded.
+
+    Blank fields count as missing. A record whose text or baseline is not a
+    string is reported on stderr and skipped; with ``numbered``, records
+    are ``(line, record)`` pairs (see ``read_numbered_records``) and the
+    report names the line.
+    """
+    conversations: "OrderedDict[str, list]" = OrderedDict()  # id -> [memory, last_text, turn]
+
+    for position, item in enumerate(records, 1):
+        if numbered:
+            line_no, record = item
+            where = f"line {line_no}"
+        else:
+            record, where = item, f"record {position}"
+        incoming = record.get(text_field)
+        baseline = record.get(baseline_field)
+        if _blank(incoming):
+            continue
+        bad = [name for name, value in ((text_field, incoming), (baseline_field, baseline))
+               if not _blank(value) and not isinstance(value, str)]
+        if bad:
+            print(f"[WARN] {where}: skipped, {' and '.join(repr(name) for name in bad)} must be text",
+                  file=sys.stderr)
+            continue
+        conversation_id = record.get(conversation_field)
+        if _blank(conversation_id):
+            conversation_id = None
+        key = str(conversation_id) if conversation_id is not None else None
+
+        state = None
+        if key is not None:
+            state = conversations.get(key)
+            if state is None:
+                state = conversations[key] = [DriftMemory(), None, 0]
+                if len(conversations) > max_conversations:
+                    conversations.popitem(last=False)
+            else:
+                conversations.move_to_end(key)
+
+        if _blank(baseline):
+            baseline = state[1] if state is not None else None
+
+        turn = state[2] if state is not None else None
+        if state is not None:
+            state[1] = incoming
+            state[2] += 1
+        if baseline is None:
+            continue
+
+        result = analyze_drift(baseline, incoming, memory=state[0] if state is not None else None)
+        if monitor is not None and key is not None:
+            monitor.observe(key, result, turn)
+        row = {
+            "conversation_id": conversation_id,
+            "turn": turn,
+            "label": result.label,
+            "drift": result.drift,
+            "drift_score": result.drift_score,
+            "tier": result.tier,
+            "tone_badge": result.tone_badge,
+            "rationale": result.rationale,
+        }
+        if include_text:
+            row["baseline"] = baseline
+            row["incoming"] = incoming
+        yield row
+
+
+# ——————————————
+# Writing
+# ——————————————
+class ProgressReporter:
+    def __init__(self, interval: float, stream: IO[str] = sys.stderr):
+        self.interval = interval
+        self.stream = stream
+        self.count = 0
+        self.started = time.perf_counter()
+        self._last = self.started
+
+    def tick(self):
+        self.count += 1
+        if self.interval <= 0:
+            return
+        now = time.perf_counter()
+        if now - self._last >= self.interval:
+            self._last = now
+            self.report(now)
+
+    def report(self, now: Optional[float] = None):
+        elapsed = (now or time.perf_counter()) - self.started
+        rate = self.count / elapsed if elapsed else 0.0
+        print(f"[lloyd-drift] {self.count:,} results in {elapsed:.1f}s ({rate:,.0f}/s)", file=self.stream)
+
+
+def write_results(
+    rows: Iterable[dict],
+    out: IO[str],
+    fmt: str = "jsonl",
+    flush_every: int = 1000,
+    flush_seconds: float = 1.0,
+    progress: Optional[ProgressReporter] = None,
+) -> int:
+    """Write rows as they arrive, flushing every N rows or T seconds."""
+    writer = None
+    fields = None
+    written = 0
+    last_flush = time.monotonic()
+
+    for row in rows:
+        if fmt == "csv":
+            if writer is None:
+                fields = RESULT_FIELDS + [k for k in row if k not in RESULT_FIELDS]
+                writer = csv.DictWriter(out, fieldnames=fields)
+                writer.writeheader()
+            writer.writerow(row)
+        else:
+            out.write(json.dumps(row, ensure_ascii=False) + "\n")
+        written += 1
+        if progress:
+            progress.tick()
+
+        if (flush_every and written % flush_every == 0) or (
+            flush_seconds and time.monotonic() - last_flush >= flush_seconds
+        ):
+            out.flush()
+            last_flush = time.monotonic()
+
+    out.flush()
+    return written
+
+
+# ——————————————
+# Entry point
+# ——————————————
+def _guess_format(path: Optional[str], explicit: Optional[str]) -> str:
+    if explicit:
+        return explicit
+    if path and path.lower().endswith(".csv"):
+        return "csv"
+    return "jsonl"
+
+
+def _alert_writer(out: IO[str]):
+    """on_alert callback writing each alert as a JSON line, flushed at once."""
+    def write(alert: EscalationAlert):
+        out.write(json.dumps(alert.to_dict(), ensure_ascii=False) + "\n")
+        out.flush()
+    return write
+
+
+def cmd_score(args: argparse.Namespace) -> int:
+    in_fmt = _guess_format(args.input if args.input != "-" else None, args.format)
+    out_fmt = _guess_format(args.output, args.output_format)
+
+    if args.input != "-":
+        source = open(args.input, "r", encoding="utf-8", newline="")
+    elif in_fmt == "csv" and hasattr(sys.stdin, "buffer"):
+        # The csv module needs untranslated line endings (quoted fields may span lines)
+        source = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", newline="")
+    else:
+        source = sys.stdin
+    sink = sys.stdout if args.output in (None, "-") else open(args.output, "w", encoding="utf-8", newline="")
+    progress = ProgressReporter(args.progress_interval) if args.progress else None
+    alerts = open(args.alerts, "w", encoding="utf-8") if args.alerts else None
+    # No idle TTL: records carry no event times, so alerts depend only on input order
+    monitor = EscalationMonitor(window=args.escalation_window, idle_ttl=None,
+                                on_alert=_alert_writer(alerts)) if alerts else None
+
+    try:
+        rows = score_records(
+            read_numbered_records(source, in_fmt),
+            text_field=args.text_field,
+            baseline_field=args.baseline_field,
+            conversation_field=args.conversation_field,
+            max_conversations=args.max_conversations,
+            include_text=args.include_text,
+            monitor=monitor,
+            numbered=True,
+        )
+        write_results(
+            rows, sink, out_fmt,
+            flush_every=args.flush_every,
+            flush_seconds=args.flush_seconds,
+            progress=progress,
+        )
+    except BrokenPipeError:
+        # Downstream closed early (e.g. `| head`); stop quietly.
+        sys.stderr.close()
+        return 0
+    finally:
+        if args.input != "-":
+            source.close()
+        elif source is not sys.stdin:
+            source.detach()     # leave sys.stdin's buffer open
+        if sink is not sys.stdout:
+            sink.close()
+        if alerts is not None:
+            alerts.close()
+
+    if progress:
+        progress.report()
+    return 0
+
+
+def cmd_document(args: argparse.Namespace) -> int:
+    source = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8")
+    sink = sys.stdout if args.output in (None, "-") else open(args.output, "w", encoding="utf-8")
+    try:
+        # stdin is read by line so chunks flow while a pipe is still open; files in blocks
+        text = iter(source.readline, "") if source is sys.stdin else source
+        for result in analyze_document(text, window=args.window):
+            sink.write(json.dumps(result, ensure_ascii=False) + "\n")
+    except BrokenPipeError:
+        sys.stderr.close()
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="lloyd-drift", description="L.L.O.Y.D. tone drift tools")
+    parser.add_argument("--polarity-backend", choices=sorted(POLARITY_BACKENDS), default="textblob",
+                        help="sentiment scorer; 'lexicon' matches textblob's scores without building TextBlob objects")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    score = sub.add_parser("score", help="Score a JSONL/CSV stream of conversation turns")
+    score.add_argument("input", nargs="?", default="-", help="input file, or - for stdin (default)")
+    score.add_argument("-o", "--output", help="output file (default: stdout)")
+    score.add_argument("--format", choices=["jsonl", "csv"], help="input format (default: from extension, else jsonl)")
+    score.add_argument("--output-format", choices=["jsonl", "csv"], help="output format (default: from extension, else jsonl)")
+    score.add_argument("--text-field", default="incoming")
+    score.add_argument("--baseline-field", default="baseline")
+    score.add_argument("--conversation-field", default="conversation_id")
+    score.add_argument("--max-conversations", type=int, default=100_000,
+                       help="conversation memories kept before the least recent is dropped")
+    score.add_argument("--include-text", action="store_true", help="echo baseline/incoming in each result")
+    score.add_argument("--flush-every", type=int, default=1000, help="flush output every N results (0 = off)")
+    score.add_argument("--flush-seconds", type=float, default=1.0, help="flush output at least every T seconds (0 = off)")
+    score.add_argument("--progress", action="store_true", help="report throughput on stderr")
+    score.add_argument("--progress-interval", type=float, default=5.0)
+    score.add_argument("--alerts", help="write escalation alerts for conversations to this JSONL file as they fire")
+    score.add_argument("--escalation-window", type=int, default=DEFAULT_WINDOW,
+                       help="with --alerts, turns in the sliding window")
+    score.set_defaults(func=cmd_score)
+
+    document = sub.add_parser("document", help="Stream chunk-by-chunk drift for a long text")
+    document.add_argument("input", nargs="?", default="-", help="text file, or - for stdin (default)")
+    document.add_argument("-o", "--output", help="JSONL output file (default: stdout)")
+    document.add_argument("--window", type=int, default=1,
+                          help="compare each chunk with the previous N chunks (0 = fixed baseline, like analyze_chunks)")
+    document.set_defaults(func=cmd_document)
+
+    session = sub.add_parser("session", help="Summarize a drift journal incrementally")
+    analyze_session.build_parser(session)
+    session.set_defaults(func=analyze_session.run)
+
+    serve = sub.add_parser("serve", help="Serve drift scoring over local HTTP with micro-batching")
+    server.build_parser(serve)
+    serve.set_defaults(func=server.run)
+    return parser
+
+
+def main(argv: Optional[list] = None) -> int:
+    args = build_parser().parse_args(argv)
+    set_polarity_backend(args.polarity_backend)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
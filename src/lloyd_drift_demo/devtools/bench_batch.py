@@ -0,0 +1,46 @@
+import sys
+import os
+import time
+import random
+
+# Add src/ to sys.path so lloyd_drift_demo is importable
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+# devtools/bench_batch.py — loop over analyze_drift vs analyze_drift_batch
+from lloyd_drift_demo.engine.drift_engine import analyze_drift, analyze_drift_batch
+from lloyd_drift_demo.engine.polarity_cache import POLARITY_CACHE
+from lloyd_drift_demo.engine.test_drift_cases import TEST_CASES
+
+EXTRA_INCOMING = ["ok", "thanks!!", "You are garbage.", "Fine...", "WHY??? 😡😡", "maybe later", "I hate this!"]
+
+
+def make_pairs(n: int, seed: int = 13) -> list:
+    rng = random.Random(seed)
+    baselines = [b for b, _ in TEST_CASES.values()]
+    incomings = [i for _, i in TEST_CASES.values()] + EXTRA_INCOMING
+    return [(rng.choice(baselines), rng.choice(incomings)) for _ in range(n)]
+
+
+def timed(fn) -> float:
+    POLARITY_CACHE.clear()
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main(n: int = 20_000):
+    pairs = make_pairs(n)
+    loop_results = []
+    loop_time = timed(lambda: loop_results.extend(analyze_drift(b, i) for b, i in pairs))
+    batch_results = []
+    batch_time = timed(lambda: batch_results.extend(analyze_drift_batch(pairs)))
+
+    assert loop_results == batch_results, "batch results diverge from the scalar path"
+    print(f"pairs       : {n}")
+    print(f"loop        : {loop_time:.3f}s ({n / loop_time:,.0f} pairs/s)")
+    print(f"batch       : {batch_time:.3f}s ({n / batch_time:,.0f} pairs/s)")
+    print(f"speedup     : {loop_time / batch_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
@@ -0,0 +1,44 @@
+import sys
+import os
+import time
+import random
+import tracemalloc
+
+# Add src/ to sys.path so lloyd_drift_demo is importable
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+# devtools/bench_escalation.py — EscalationMonitor throughput and memory over many conversations
+from lloyd_drift_demo.devtools.bench_batch import make_pairs
+from lloyd_drift_demo.engine.drift_engine import analyze_drift_batch
+from lloyd_drift_demo.engine.escalation import EscalationMonitor
+
+
+def main(n: int = 1_000_000, conversations: int = 200_000, cap: int = 100_000):
+    results = analyze_drift_batch(make_pairs(2_000))
+    rng = random.Random(7)
+    events = [(rng.randrange(conversations), rng.choice(results)) for _ in range(n)]
+
+    monitor = EscalationMonitor(max_conversations=cap)
+    start = time.perf_counter()
+    alerts = sum(len(monitor.observe(conversation_id, result)) for conversation_id, result in events)
+    elapsed = time.perf_counter() - start
+
+    # Separate run for memory; tracemalloc would distort the timing above
+    traced = EscalationMonitor(max_conversations=cap)
+    tracemalloc.start()
+    for conversation_id, result in events:
+        traced.observe(conversation_id, result)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    stats = monitor.stats()
+    assert stats["conversations"] <= cap, "monitor grew past max_conversations"
+    print(f"events      : {n:,} over {conversations:,} conversations (cap {cap:,})")
+    print(f"throughput  : {n / elapsed:,.0f} events/s ({elapsed / n * 1e6:.2f} µs/event)")
+    print(f"alerts      : {alerts:,}")
+    print(f"live        : {stats['conversations']:,} conversations, {stats['evictions']:,} evicted")
+    print(f"memory      : {retained / 2**20:.1f} MiB traced, {stats['approx_bytes'] / 2**20:.1f} MiB estimated")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
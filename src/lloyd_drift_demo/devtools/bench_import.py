@@ -0,0 +1,68 @@
+import sys
+import os
+import argparse
+import statistics
+import subprocess
+
+# devtools/bench_import.py — cold-import budget check via `python -X importtime`
+#
+#   python devtools/bench_import.py                       # default modules and budgets
+#   python devtools/bench_import.py --budget-ms 80 --runs 9
+#
+# Each module is imported in a fresh interpreter several times; the median
+# cumulative import time is compared with its budget, and the run fails if
+# any of the deferred heavy libraries were loaded at import.
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+# module -> budget in ms (cumulative, as reported by -X importtime)
+BUDGETS = {
+    "lloyd_drift_demo.engine.drift_engine": 60.0,
+    "lloyd_drift_demo.cli": 80.0,
+}
+DEFERRED = ("textblob", "nltk", "emoji", "sqlite3", "difflib", "matplotlib")
+
+
+def import_time_ms(module: str) -> float:
+    env = dict(os.environ, PYTHONPATH=SRC + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    for line in proc.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1]) / 1000
+    raise RuntimeError(f"{module} not found in -X importtime output")
+
+
+def loaded_heavy_modules(module: str) -> list:
+    code = f"import sys, {module}; print(' '.join(m for m in {DEFERRED!r} if m in sys.modules))"
+    env = dict(os.environ, PYTHONPATH=SRC + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True)
+    return proc.stdout.split()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Check cold-import time against a budget.")
+    parser.add_argument("modules", nargs="*", help="modules to check (default: engine and CLI)")
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--budget-ms", type=float, help="override the budget for every module")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for module in args.modules or BUDGETS:
+        budget = args.budget_ms or BUDGETS.get(module, 60.0)
+        samples = [import_time_ms(module) for _ in range(args.runs)]
+        median = statistics.median(samples)
+        heavy = loaded_heavy_modules(module)
+        ok = median <= budget and not heavy
+        failed |= not ok
+        print(f"{'ok  ' if ok else 'FAIL'} {module:<40} median {median:6.1f} ms "
+              f"(min {min(samples):.1f}, budget {budget:.0f})"
+              + (f"  eagerly loaded: {', '.join(heavy)}" if heavy else ""))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
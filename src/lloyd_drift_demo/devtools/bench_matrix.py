@@ -0,0 +1,45 @@
+import sys
+import os
+import time
+
+# Add src/ to sys.path so lloyd_drift_demo is importable
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+# devtools/bench_matrix.py — nested analyze_drift loops vs analyze_drift_matrix
+from lloyd_drift_demo.engine.drift_engine import analyze_drift, analyze_drift_matrix, warm_up
+from lloyd_drift_demo.engine.polarity_cache import POLARITY_CACHE
+from lloyd_drift_demo.devtools.bench_batch import make_pairs
+
+# The Streamlit app's persona baselines
+BASELINES = [
+    "Okay.", "Thanks again for your help!", "Why wasn’t this done earlier?", "I really appreciate this.",
+    "Whatever. Just do what you want.", "Fine.", "I'm doing fine.",
+]
+
+
+def timed(fn) -> float:
+    POLARITY_CACHE.clear()
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main(n: int = 2_000):
+    warm_up()
+    incomings = [incoming for _, incoming in make_pairs(n)]
+    loop_results = []
+    loop_time = timed(lambda: loop_results.extend(
+        [analyze_drift(baseline, incoming) for baseline in BASELINES] for incoming in incomings))
+    matrix = []
+    matrix_time = timed(lambda: matrix.append(analyze_drift_matrix(incomings, BASELINES)))
+
+    assert matrix[0].results == loop_results, "matrix cells diverge from analyze_drift"
+    cells = len(incomings) * len(BASELINES)
+    print(f"cells       : {len(incomings)} incomings × {len(BASELINES)} baselines = {cells}")
+    print(f"loop        : {loop_time:.3f}s ({cells / loop_time:,.0f} cells/s)")
+    print(f"matrix      : {matrix_time:.3f}s ({cells / matrix_time:,.0f} cells/s)")
+    print(f"speedup     : {loop_time / matrix_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000)
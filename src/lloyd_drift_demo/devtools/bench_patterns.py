@@ -0,0 +1,83 @@
+import sys
+import os
+import re
+import timeit
+
+# Add src/ to sys.path so lloyd_drift_demo is importable
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+# devtools/bench_patterns.py — per-call cost of the emphasis/emoji/regex helpers,
+# raw-pattern implementations (before) vs the compiled registry (after)
+import emoji
+from lloyd_drift_demo.engine import patterns
+from lloyd_drift_demo.engine.drift_engine import normalize, normalize_text
+from lloyd_drift_demo.engine.shared_utils import symbolic_emphasis_score, get_directional_target
+
+SAMPLES = [
+    "I SAID I'M FINE!!!",
+    "Sure 😂😂 whatever ❤️ 👨‍👩‍👧",
+    "Why wasn’t this done earlier? You never listen to me.",
+    "ok " * 200 + "😡😡",
+]
+
+
+# === Before: the pre-registry implementations ===
+def legacy_normalize(text):
+    text = text.lower().strip()
+    text = text.replace("​", "")
+    text = text.replace("\n", " ").replace("\r", " ")
+    text = re.sub(r"[^\w\s']", "", text)
+    return re.sub(r"\s+", " ", text)
+
+def legacy_normalize_text(text):
+    text = text.lower()
+    text = re.sub(r"\s+", " ", text)
+    text = re.sub(r"([!?])\1+", r"\1", text)
+    text = re.sub(r"\b(\w)\s+\1\b", r"\1", text)
+    return text.strip()
+
+def legacy_emphasis(text):
+    caps = sum(1 for c in text if c.isupper())
+    excl = text.count("!")
+    qmark = text.count("?")
+    emoji_count = len(re.findall(r"[😂🤣😡😢😍😭❤️]", text))
+    return 0.3 * caps + 0.5 * excl + 0.5 * qmark + 0.5 * emoji_count
+
+def legacy_emoji_count(text):
+    return sum(1 for char in text if emoji.is_emoji(char))
+
+def legacy_directional_target(text):
+    text = text.lower()
+    if re.search(r"\b(i|me|myself)\b", text):
+        return "self"
+    elif re.search(r"\b(you|your|you're|u)\b", text):
+        return "other"
+    elif re.search(r"\b(he|she|they|this|that|it)\b", text):
+        return "ambient"
+    return "unknown"
+
+
+CASES = [
+    ("normalize", legacy_normalize, normalize),
+    ("normalize_text", legacy_normalize_text, normalize_text),
+    ("emphasis_score", legacy_emphasis, symbolic_emphasis_score),
+    ("emoji_count", legacy_emoji_count, patterns.count_emoji),
+    ("directional_target", legacy_directional_target, get_directional_target),
+]
+
+
+def per_call_us(fn, number: int) -> float:
+    timer = timeit.Timer(lambda: [fn(s) for s in SAMPLES])
+    return min(timer.repeat(repeat=5, number=number)) / (number * len(SAMPLES)) * 1e6
+
+
+def main(number: int = 2000):
+    print(f"{'helper':<20}{'before µs':>12}{'after µs':>12}{'speedup':>10}")
+    for name, before, after in CASES:
+        b = per_call_us(before, number)
+        a = per_call_us(after, number)
+        print(f"{name:<20}{b:>12.2f}{a:>12.2f}{b / a:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
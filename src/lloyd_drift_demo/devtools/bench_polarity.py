@@ -0,0 +1,64 @@
+import sys
+import os
+import time
+import random
+import statistics
+
+# Add src/ to sys.path so lloyd_drift_demo is importable
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+# devtools/bench_polarity.py — LexiconBackend parity with TextBlob, and per-message cost
+from lloyd_drift_demo.engine.polarity_backends import LexiconBackend, TextBlobBackend
+from lloyd_drift_demo.devtools.benchmarks.corpus import CorpusGenerator
+
+# Fragments that exercise the tokenizer and assessment edge cases
+FRAGMENTS = [
+    "not", "no", "never", "very", "really", "is", "a", "the", "!", "(!)", "( ! )", ":)", ":-(", "; )",
+    "8 )", "<3", ":D", "xD", "don't", "isn't", "it's", "I'm", "n't've", "'s", "...", "..", ".", "?",
+    "\"", "'", "’", "“", "”", "Mr.", "U.S.", "e.g.", "(", "),", "\n\n", "\r\n", "\t", "\xa0", "—",
+]
+
+
+def make_texts(n: int, seed: int = 13) -> list:
+    """Corpus messages plus random mixes of lexicon words and FRAGMENTS."""
+    rng = random.Random(seed)
+    words = list(LexiconBackend().lexicon)
+    texts = CorpusGenerator(seed).phrases(n // 2)
+    while len(texts) < n:
+        count = rng.randint(1, 15)
+        pieces = [rng.choice(words) if rng.random() < 0.5 else rng.choice(FRAGMENTS) for _ in range(count)]
+        texts.append(rng.choice([" ", "", "  "]).join(pieces))
+    return texts
+
+
+def per_message_us(polarity, texts: list) -> tuple:
+    clock = time.perf_counter_ns
+    samples = []
+    for text in texts:
+        start = clock()
+        polarity(text)
+        samples.append(clock() - start)
+    return statistics.median(samples) / 1000, statistics.fmean(samples) / 1000
+
+
+def main(n: int = 50_000):
+    texts = make_texts(n)
+    textblob, lexicon = TextBlobBackend(), LexiconBackend()
+    textblob.polarity("warm-up")
+    lexicon.polarity("warm-up")
+
+    mismatches = [(t, a, b) for t in texts if (a := textblob.polarity(t)) != (b := lexicon.polarity(t))]
+    for text, expected, got in mismatches[:10]:
+        print(f"  ✗ {text!r}: textblob={expected} lexicon={got}")
+    assert not mismatches, f"{len(mismatches)} of {len(texts)} texts diverge from TextBlob"
+
+    blob_median, blob_mean = per_message_us(textblob.polarity, texts)
+    lex_median, lex_mean = per_message_us(lexicon.polarity, texts)
+    print(f"texts       : {len(texts)} (identical polarity on all)")
+    print(f"textblob    : median {blob_median:.1f} µs, mean {blob_mean:.1f} µs")
+    print(f"lexicon     : median {lex_median:.1f} µs, mean {lex_mean:.1f} µs")
+    print(f"speedup     : {blob_median / lex_median:.1f}x median, {blob_mean / lex_mean:.1f}x mean")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
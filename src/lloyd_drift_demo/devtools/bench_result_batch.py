@@ -0,0 +1,56 @@
+import sys
+import os
+import time
+import tempfile
+import tracemalloc
+
+# Add src/ to sys.path so lloyd_drift_demo is importable
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+# devtools/bench_result_batch.py — memory and save/load cost of DriftResult lists vs DriftResultBatch
+from lloyd_drift_demo.devtools.bench_batch import make_pairs
+from lloyd_drift_demo.engine.drift_engine import analyze_drift_batch
+from lloyd_drift_demo.engine.result_batch import DriftResultBatch
+
+
+def retained_bytes(build) -> tuple:
+    tracemalloc.start()
+    value = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, size
+
+
+def main(n: int = 200_000):
+    pairs = make_pairs(2_000)
+    results = analyze_drift_batch(pairs) * (n // len(pairs))
+    n = len(results)
+
+    # Copies, so the list holds n distinct objects as it would after scoring n real pairs
+    copies, list_bytes = retained_bytes(lambda: [type(r)(**{f: getattr(r, f) for f in r.__dataclass_fields__})
+                                                 for r in results])
+    batch, batch_bytes = retained_bytes(lambda: DriftResultBatch(results))
+    assert list(batch) == copies, "batch rows diverge from the results they were built from"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "results.bin")
+        start = time.perf_counter()
+        batch.save(path)
+        save_time = time.perf_counter() - start
+        start = time.perf_counter()
+        loaded = DriftResultBatch.load(path)
+        counts = loaded.label_counts()
+        load_time = time.perf_counter() - start
+        assert counts == batch.label_counts()
+        file_size = os.path.getsize(path)
+        loaded.close()
+
+    print(f"results     : {n:,}")
+    print(f"list        : {list_bytes / n:.0f} B/result ({list_bytes / 2**20:.1f} MiB)")
+    print(f"batch       : {batch_bytes / n:.1f} B/result ({batch_bytes / 2**20:.1f} MiB)")
+    print(f"file        : {file_size / 2**20:.1f} MiB, saved in {save_time * 1000:.0f} ms")
+    print(f"mmap load   : label counts in {load_time * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
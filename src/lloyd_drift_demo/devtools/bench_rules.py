@@ -0,0 +1,38 @@
+import sys
+import os
+import time
+
+# Add src/ to sys.path so lloyd_drift_demo is importable
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+# devtools/bench_rules.py — short-circuit rule planner vs exhaustive evaluation
+from lloyd_drift_demo.engine.drift_engine import analyze_drift, OVERRIDE_RULES
+from lloyd_drift_demo.engine.polarity_cache import POLARITY_CACHE
+from lloyd_drift_demo.devtools.bench_batch import make_pairs
+
+
+def run(pairs: list, full: bool):
+    POLARITY_CACHE.clear()
+    start = time.perf_counter()
+    results = [analyze_drift(b, i, full=full) for b, i in pairs]
+    elapsed = time.perf_counter() - start
+    return results, elapsed, POLARITY_CACHE.stats()["misses"]
+
+
+def main(n: int = 20_000):
+    # Distinct texts per pair so neither mode benefits from the polarity cache
+    pairs = [(f"{b} #{k}", f"{i} #{k}") for k, (b, i) in enumerate(make_pairs(n))]
+    print("plan        : " + " > ".join(f"{r.name}({r.weight:g}/{r.cost:g})" for r in OVERRIDE_RULES.plan))
+
+    full_results, full_time, full_parses = run(pairs, full=True)
+    plan_results, plan_time, plan_parses = run(pairs, full=False)
+    assert full_results == plan_results, "planner diverges from exhaustive evaluation"
+
+    print(f"pairs       : {n}")
+    print(f"full        : {full_time:.3f}s ({n / full_time:,.0f} pairs/s), {full_parses:,} sentiment parses")
+    print(f"planned     : {plan_time:.3f}s ({n / plan_time:,.0f} pairs/s), {plan_parses:,} sentiment parses")
+    print(f"speedup     : {full_time / plan_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
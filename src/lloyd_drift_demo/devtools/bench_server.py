@@ -0,0 +1,71 @@
+import sys
+import os
+import json
+import time
+import socket
+import threading
+import http.client
+
+# Add src/ to sys.path so lloyd_drift_demo is importable
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+# devtools/bench_server.py — concurrent keep-alive clients against the micro-batching server
+from lloyd_drift_demo.server import DriftServer
+from lloyd_drift_demo.devtools.bench_batch import make_pairs
+
+
+def client(port: int, pairs: list, latencies: list, statuses: dict, lock: threading.Lock):
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    conn.connect()
+    # http.client sends headers and body separately; without this Nagle adds ~40ms
+    conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    local = []
+    for baseline, incoming in pairs:
+        body = json.dumps({"baseline": baseline, "incoming": incoming})
+        start = time.perf_counter()
+        conn.request("POST", "/drift", body, {"Content-Type": "application/json"})
+        response = conn.getresponse()
+        response.read()
+        local.append(time.perf_counter() - start)
+        with lock:
+            statuses[response.status] = statuses.get(response.status, 0) + 1
+    conn.close()
+    with lock:
+        latencies.extend(local)
+
+
+def percentile(samples: list, p: float) -> float:
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(p / 100 * len(samples)))] * 1000
+
+
+def main(clients: int = 32, per_client: int = 200, max_batch: int = 64, max_wait_ms: float = 5.0):
+    server = DriftServer(("127.0.0.1", 0), max_batch=max_batch, max_wait=max_wait_ms / 1000)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+
+    pairs = make_pairs(clients * per_client)
+    latencies, statuses, lock = [], {}, threading.Lock()
+    threads = [
+        threading.Thread(target=client, args=(port, pairs[i::clients], latencies, statuses, lock))
+        for i in range(clients)
+    ]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    print(f"clients     : {clients} x {per_client} requests (keep-alive)")
+    print(f"throughput  : {len(latencies) / elapsed:,.0f} req/s")
+    print(f"client p50  : {percentile(latencies, 50):.2f} ms")
+    print(f"client p99  : {percentile(latencies, 99):.2f} ms")
+    print(f"statuses    : {statuses}")
+    print(f"server      : {server.stats()}")
+    server.shutdown()
+    server.server_close()
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
@@ -0,0 +1,80 @@
+"""Run the benchmark suite.
+
+    python -m lloyd_drift_demo.devtools.benchmarks -o bench_report.json
+    python -m lloyd_drift_demo.devtools.benchmarks --quick --baseline bench_baseline.json
+    python -m lloyd_drift_demo.devtools.benchmarks --save-baseline bench_baseline.json
+
+Exits 1 when any gated metric regressed past ``--threshold`` against the
+baseline report.
+"""
+
+import sys
+import os
+import argparse
+
+# Add src/ to sys.path so lloyd_drift_demo is importable when run as a script
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..")))
+
+from lloyd_drift_demo.devtools.benchmarks.suite import (
+    DEFAULT_REPEATS, DEFAULT_THRESHOLD, compare_reports, load_report, run_suite, write_report,
+)
+
+
+def print_report(report: dict):
+    meta = report["meta"]
+    print(f"\n⏱  LLOYD benchmark ({meta['size']}, seed {meta['seed']}, median of {meta['repeats']} runs, "
+          f"Python {meta['python']})")
+    print(f"corpus: {meta['corpus']}")
+    print("\nlatency (µs)          calls    mean     p50     p90     p99      max")
+    for fn, s in report["latency"].items():
+        print(f"  {fn:<18}{s['calls']:>8}{s['mean_us']:>8.0f}{s['p50_us']:>8.0f}"
+              f"{s['p90_us']:>8.0f}{s['p99_us']:>8.0f}{s['max_us']:>9.0f}")
+    print("\nthroughput")
+    for key, value in report["throughput"].items():
+        print(f"  {key:<22}{value:>12,.0f}")
+    print("\ncold cost per call (µs)")
+    for key, value in sorted(report["predicates_us"].items(), key=lambda kv: kv[1], reverse=True):
+        print(f"  {key:<36}{value:>10.2f}")
+    print(f"\npeak RSS: {report['memory']['peak_rss_mb']} MB")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m lloyd_drift_demo.devtools.benchmarks",
+                                     description="LLOYD engine benchmark suite")
+    parser.add_argument("-o", "--output", help="write the JSON report here")
+    parser.add_argument("--quick", action="store_true", help="smaller corpus for a fast check")
+    parser.add_argument("--seed", type=int, default=13)
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS,
+                        help=f"runs per timing; the median is reported (default {DEFAULT_REPEATS})")
+    parser.add_argument("--baseline", help="fail if this stored report is beaten by more than --threshold")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"tolerated fractional regression (default {DEFAULT_THRESHOLD})")
+    parser.add_argument("--save-baseline", help="also write the report as the new baseline")
+    args = parser.parse_args(argv)
+
+    report = run_suite("quick" if args.quick else "full", args.seed,
+                       progress=lambda stage: print(f"[bench] {stage}…", file=sys.stderr), repeats=args.repeats)
+    print_report(report)
+    if args.output:
+        write_report(report, args.output)
+    if args.save_baseline:
+        write_report(report, args.save_baseline)
+
+    if args.baseline:
+        baseline = load_report(args.baseline)
+        if baseline.get("meta", {}).get("size") != report["meta"]["size"]:
+            print("\n[bench] warning: baseline was recorded at a different size", file=sys.stderr)
+        if baseline.get("version") != report["version"]:
+            print("\n[bench] warning: baseline was recorded by another report version; re-save it", file=sys.stderr)
+        regressions = compare_reports(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} metric(s) regressed more than {args.threshold:.0%}:")
+            for r in regressions:
+                print(f"  {r['metric']:<44}{r['baseline']:>10} → {r['current']:<10} (+{r['change']:.0%})")
+            return 1
+        print(f"\n✅ no regressions beyond {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
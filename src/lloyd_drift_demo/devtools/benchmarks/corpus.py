@@ -0,0 +1,123 @@
+"""Seeded generator of synthetic conversation corpora for benchmarking.
+
+Conversations mix the message shapes that stress different engine paths:
+shouting, emoji floods (including ZWJ and skin-tone sequences), sarcasm
+markers, mocked echoes, hedges, hostile replies, long pasted messages and
+non-ASCII text. The same seed always yields the same corpus.
+"""
+
+import random
+from typing import Dict, List, Optional, Tuple
+
+# Relative frequency of each reply shape
+DEFAULT_MIX: Dict[str, float] = {
+    "plain": 30,
+    "shout": 8,
+    "emoji_flood": 8,
+    "sarcasm": 8,
+    "echo": 8,
+    "hedge": 8,
+    "hostile": 6,
+    "reversal": 8,
+    "non_ascii": 10,
+    "long": 2,
+}
+
+STATEMENTS = [
+    "I finished the report.", "Can you check the build?", "We should meet tomorrow.",
+    "Thanks for the update.", "The deploy went fine.", "I love this idea.",
+    "That was okay.", "Why wasn’t this done earlier?", "Let me know when you’ve fixed it.",
+    "I like the new layout.", "You helped a lot.", "It should work now.",
+    "We’re safe.", "Great job.", "I'm doing fine.", "The tests are green again.",
+    "Just checking in again on the ticket.", "Honestly, this is unacceptable.",
+    "No worries, I appreciate your help.", "Can someone explain what’s going on?",
+]
+HEDGES = ["Maybe", "Perhaps", "I guess", "I think", "Sort of", "Kind of"]
+HOSTILE = [
+    "You are garbage.", "This is useless!", "You're an idiot!!", "That is pathetic.",
+    "Stupid plan, totally stupid!", "I hate this so much!",
+]
+SARCASM = ["Great job...", "Sure. /s", "Oh wonderful 🙃", "Wow. That’s really helpful. 🙄", "Brilliant..."]
+REVERSALS = [
+    ("I love this.", "I hate this!"), ("I like it.", "I don’t like it."),
+    ("Yes, ship it.", "No, don't ship it."), ("This is good.", "This is bad."),
+    ("It was a success.", "It was a failure."),
+]
+EMOJI = ["😂", "🤣", "😡", "😢", "😍", "😭", "❤️", "👍🏽", "👨‍👩‍👧", "🇺🇸", "🙃", "🔥", "1️⃣", "🏳️‍🌈"]
+NON_ASCII = [
+    "Ça va très bien, merci.", "¿Por qué no funciona?", "Это не работает!", "これは素晴らしいです。",
+    "这太糟糕了！", "هذا رائع جدا", "Naïve café résumé — déjà vu.", "Schön, aber zu spät…",
+    "Δεν είναι καλό.", "정말 고마워요!",
+]
+
+
+class CorpusGenerator:
+    """Deterministic source of messages, conversations, pairs and documents."""
+
+    def __init__(self, seed: int = 13, mix: Optional[Dict[str, float]] = None, long_sentences: Tuple[int, int] = (40, 400)):
+        self.rng = random.Random(seed)
+        self.mix = dict(mix or DEFAULT_MIX)
+        self._shapes = list(self.mix)
+        self._weights = [self.mix[s] for s in self._shapes]
+        self.long_sentences = long_sentences
+
+    # === Messages ===
+    def statement(self) -> str:
+        return self.rng.choice(STATEMENTS)
+
+    def reply(self, previous: str, shape: Optional[str] = None) -> str:
+        rng = self.rng
+        shape = shape or rng.choices(self._shapes, self._weights)[0]
+        if shape == "shout":
+            return self.statement().upper().rstrip(".") + "!" * rng.randint(1, 4)
+        if shape == "emoji_flood":
+            return f"{self.statement()} " + "".join(rng.choice(EMOJI) for _ in range(rng.randint(2, 12)))
+        if shape == "sarcasm":
+            return rng.choice(SARCASM)
+        if shape == "echo":
+            return previous.upper().rstrip(".") + rng.choice(["!!!", "?!", "!!"])
+        if shape == "hedge":
+            return f"{rng.choice(HEDGES)} {self.statement()[0].lower()}{self.statement()[1:]}"
+        if shape == "hostile":
+            return rng.choice(HOSTILE)
+        if shape == "reversal":
+            return rng.choice(REVERSALS)[1]
+        if shape == "non_ascii":
+            text = rng.choice(NON_ASCII)
+            return text + (" " + rng.choice(EMOJI) if rng.random() < 0.3 else "")
+        if shape == "long":
+            count = rng.randint(*self.long_sentences)
+            return " ".join(self.reply(previous, rng.choice(["plain", "shout", "non_ascii", "hedge"])) for _ in range(count))
+        return self.statement()
+
+    # === Collections ===
+    def conversation(self, turns: int = 8) -> List[str]:
+        messages = [self.statement()]
+        for _ in range(turns - 1):
+            messages.append(self.reply(messages[-1]))
+        return messages
+
+    def conversations(self, count: int, turns: int = 8) -> List[List[str]]:
+        return [self.conversation(turns) for _ in range(count)]
+
+    def pairs(self, count: int) -> List[Tuple[str, str]]:
+        """(baseline, incoming) pairs: each reply against the message before it."""
+        out: List[Tuple[str, str]] = []
+        while len(out) < count:
+            messages = self.conversation(self.rng.randint(2, 10))
+            out.extend(zip(messages, messages[1:]))
+        return out[:count]
+
+    def phrases(self, count: int) -> List[str]:
+        return [incoming for _, incoming in self.pairs(count)]
+
+    def documents(self, count: int, sentences: Tuple[int, int] = (3, 40)) -> List[str]:
+        """Multi-sentence texts for analyze_chunks."""
+        return [
+            " ".join(self.conversation(self.rng.randint(*sentences)))
+            for _ in range(count)
+        ]
+
+
+def generate_pairs(count: int, seed: int = 13, mix: Optional[Dict[str, float]] = None) -> List[Tuple[str, str]]:
+    return CorpusGenerator(seed, mix).pairs(count)
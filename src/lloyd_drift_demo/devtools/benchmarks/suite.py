@@ -0,0 +1,259 @@
+"""Benchmark measurements, JSON reports and baseline regression gates."""
+
+import sys
+import json
+import time
+import platform
+import statistics
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence
+
+from lloyd_drift_demo.devtools.benchmarks.corpus import CorpusGenerator
+from lloyd_drift_demo.engine.drift_engine import (
+    AnalyzedText, OVERRIDE_RULES, analyze_chunks, analyze_drift, analyze_drift_batch, analyze_phrase, warm_up,
+)
+from lloyd_drift_demo.engine.polarity_cache import POLARITY_CACHE
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+REPORT_VERSION = 2
+DEFAULT_THRESHOLD = 0.20   # fractional slowdown tolerated before a metric counts as regressed
+DEFAULT_REPEATS = 5        # every timing is the median of this many runs
+MIN_P99_CALLS = 1000       # below this a p99 is a handful of outliers and is not gated
+
+# Absolute change a metric must also exceed to count as regressed; first suffix match wins
+NOISE_FLOORS = (
+    ("p99_us", 50.0),
+    ("_us", 2.0),
+    ("_mb", 10.0),
+)
+
+SIZES = {
+    "full": {"pairs": 5000, "phrases": 2000, "documents": 300, "rule_pairs": 2000},
+    "quick": {"pairs": 1000, "phrases": 400, "documents": 60, "rule_pairs": 400},
+}
+
+# Per-text features timed on their own, cold
+FEATURES = ["normalized", "lexicon_hits", "emphasis_score", "emoji_count", "polarity_score"]
+
+
+# === Measurement helpers ===
+def latency_summary(samples_ns: Sequence[int]) -> Dict[str, float]:
+    samples = sorted(samples_ns)
+    last = len(samples) - 1
+
+    def pct(p: float) -> float:
+        return round(samples[min(last, int(p / 100 * len(samples)))] / 1000, 2)
+
+    return {
+        "calls": len(samples),
+        "mean_us": round(statistics.fmean(samples) / 1000, 2),
+        "p50_us": pct(50),
+        "p90_us": pct(90),
+        "p99_us": pct(99),
+        "max_us": round(samples[-1] / 1000, 2),
+    }
+
+
+def median_summary(runs: Sequence[Dict[str, float]]) -> Dict[str, float]:
+    """Field-wise median of per-run ``latency_summary`` results (``calls`` is per run)."""
+    return {key: runs[0][key] if key == "calls" else round(statistics.median(run[key] for run in runs), 2)
+            for key in runs[0]}
+
+
+def time_calls(fn: Callable, args_list: Sequence[tuple]) -> List[int]:
+    clock = time.perf_counter_ns
+    samples = []
+    for args in args_list:
+        start = clock()
+        fn(*args)
+        samples.append(clock() - start)
+    return samples
+
+
+def peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+# === Benchmarks ===
+def bench_latency(pairs, phrases, documents, repeats: int = DEFAULT_REPEATS) -> Dict[str, dict]:
+    def repeated(fn, args_list) -> Dict[str, float]:
+        runs = []
+        for _ in range(repeats):
+            POLARITY_CACHE.clear()
+            runs.append(latency_summary(time_calls(fn, args_list)))
+        return median_summary(runs)
+
+    return {
+        "analyze_drift": repeated(analyze_drift, pairs),
+        "analyze_phrase": repeated(analyze_phrase, [(p,) for p in phrases]),
+        "analyze_chunks": repeated(analyze_chunks, [(d,) for d in documents]),
+    }
+
+
+def bench_throughput(pairs, repeats: int = DEFAULT_REPEATS) -> Dict[str, float]:
+    def rate(run) -> float:
+        POLARITY_CACHE.clear()
+        start = time.perf_counter()
+        run()
+        return len(pairs) / (time.perf_counter() - start)
+
+    def loop():
+        for baseline, incoming in pairs:
+            analyze_drift(baseline, incoming)
+
+    return {
+        "loop_pairs_per_s": round(statistics.median(rate(loop) for _ in range(repeats)), 1),
+        "batch_pairs_per_s": round(statistics.median(rate(lambda: analyze_drift_batch(pairs))
+                                                     for _ in range(repeats)), 1),
+    }
+
+
+def bench_predicates(pairs, repeats: int = DEFAULT_REPEATS) -> Dict[str, float]:
+    """Cold cost per call of each override rule and per-text feature, in µs.
+
+    Every measurement gets fresh AnalyzedText objects and an empty polarity
+    cache, so a rule is charged for the features it forces. One untimed pass
+    absorbs one-off costs (compiling a pattern, first-touch allocation), then
+    the median of ``repeats`` timed passes is kept.
+    """
+    clock = time.perf_counter_ns
+
+    def cold_cost(make_items, call) -> float:
+        elapsed = []
+        for attempt in range(repeats + 1):
+            items = make_items()
+            POLARITY_CACHE.clear()
+            start = clock()
+            for item in items:
+                call(item)
+            if attempt:
+                elapsed.append(clock() - start)
+        return round(statistics.median(elapsed) / len(items) / 1000, 2)
+
+    costs = {}
+    for rule in OVERRIDE_RULES.rules:
+        costs[f"rule.{rule.name}"] = cold_cost(
+            lambda: [(AnalyzedText(b), AnalyzedText(i)) for b, i in pairs],
+            lambda pair, check=rule.check: check(pair[0], pair[1], None),
+        )
+    texts = list({text for pair in pairs for text in pair})
+    for feature in FEATURES:
+        costs[f"feature.{feature}"] = cold_cost(
+            lambda: [AnalyzedText(t) for t in texts],
+            lambda item, name=feature: getattr(item, name),
+        )
+    return costs
+
+
+def run_suite(size: str = "full", seed: int = 13, progress: Callable[[str], None] = lambda _: None,
+              repeats: int = DEFAULT_REPEATS) -> dict:
+    sizes = SIZES[size]
+    generator = CorpusGenerator(seed)
+    pairs = generator.pairs(sizes["pairs"])
+    phrases = generator.phrases(sizes["phrases"])
+    documents = generator.documents(sizes["documents"])
+    rule_pairs = pairs[: sizes["rule_pairs"]]
+
+    warm_up()
+    progress("latency")
+    latency = bench_latency(pairs, phrases, documents, repeats)
+    progress("throughput")
+    throughput = bench_throughput(pairs, repeats)
+    progress("predicates")
+    predicates = bench_predicates(rule_pairs, repeats)
+
+    return {
+        "version": REPORT_VERSION,
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "size": size,
+            "seed": seed,
+            "repeats": repeats,
+            "corpus": {
+                "pairs": len(pairs),
+                "phrases": len(phrases),
+                "documents": len(documents),
+                "mean_pair_chars": round(statistics.fmean(len(b) + len(i) for b, i in pairs), 1),
+            },
+        },
+        "latency": latency,
+        "throughput": throughput,
+        "predicates_us": predicates,
+        "memory": {"peak_rss_mb": peak_rss_mb()},
+    }
+
+
+# === Regression gates ===
+def flatten_metrics(report: dict) -> Dict[str, float]:
+    """Gateable metrics as ``name -> value``; higher-is-better names end in ``_per_s``.
+
+    A p99 over fewer than ``MIN_P99_CALLS`` samples is left out.
+    """
+    metrics: Dict[str, float] = {}
+    for fn, summary in report.get("latency", {}).items():
+        for key in ("p50_us", "p99_us", "mean_us"):
+            if key == "p99_us" and summary.get("calls", 0) < MIN_P99_CALLS:
+                continue
+            metrics[f"latency.{fn}.{key}"] = summary[key]
+    for key, value in report.get("throughput", {}).items():
+        metrics[f"throughput.{key}"] = value
+    for key, value in report.get("predicates_us", {}).items():
+        metrics[f"predicates.{key}_us"] = value
+    rss = report.get("memory", {}).get("peak_rss_mb")
+    if rss is not None:
+        metrics["memory.peak_rss_mb"] = rss
+    return metrics
+
+
+def noise_floor(name: str) -> float:
+    for suffix, floor in NOISE_FLOORS:
+        if name.endswith(suffix):
+            return floor
+    return 0.0
+
+
+def compare_reports(report: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD,
+                    min_us: float = 5.0) -> List[dict]:
+    """Metrics that regressed past ``threshold`` against ``baseline``.
+
+    Timings under ``min_us`` in both reports are too noisy to gate and are
+    skipped, as is any change smaller than the metric's ``noise_floor``.
+    """
+    current, previous = flatten_metrics(report), flatten_metrics(baseline)
+    regressions = []
+    for name, old in previous.items():
+        new = current.get(name)
+        if new is None or not old:
+            continue
+        if name.endswith("_us") and old < min_us and new < min_us:
+            continue
+        if abs(new - old) < noise_floor(name):
+            continue
+        if name.endswith("_per_s"):
+            change = (old - new) / old
+        else:
+            change = (new - old) / old
+        if change > threshold:
+            regressions.append({"metric": name, "baseline": old, "current": new, "change": round(change, 3)})
+    return sorted(regressions, key=lambda r: r["change"], reverse=True)
+
+
+def load_report(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_report(report: dict, path: str):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+        f.write("\n")
@@ -1,11 +1,6 @@
 import sys
 from pathlib import Path
 import streamlit as st
-import pandas as pd
-from textblob import TextBlob
-import csv
-from datetime import datetime
-import os
 
 # === Path Setup ===
 APP_DIR = Path(__file__).resolve().parent
@@ -16,7 +11,10 @@ SRC_PATH = REPO_ROOT / "src"
 sys.path.insert(0, str(SRC_PATH))
 
 # === Import Drift Logic ===
-from lloyd_drift_demo.engine.drift_engine import analyze_drift
+from lloyd_drift_demo.engine.drift_engine import DriftEngine, warm_up
+from lloyd_drift_demo.engine.shared_utils import raw_polarity_score
+from lloyd_drift_demo.drift_types import DriftMemory
+from lloyd_drift_demo.devtools.sandbox_demo.drift_log import DriftLog
 import lloyd_drift_demo.engine.drift_engine as dbg
 print("🔥 Using drift_engine from:", dbg.__file__)
 
@@ -24,39 +22,31 @@ print("🔥 Using drift_engine from:", dbg.__file__)
 OUTPUTS_PATH = APP_DIR.parent / "outputs"
 OUTPUTS_PATH.mkdir(parents=True, exist_ok=True)
 LOG_FILE = OUTPUTS_PATH / "drift_log.csv"
+PAGE_SIZE = 50
 
-def compute_slope(history):
-    if len(history) < 2:
-        return 0.0
-    scores = [entry[1] for entry in history]
-    indices = list(range(len(scores)))
-    n = len(scores)
-    x_avg = sum(indices) / n
-    y_avg = sum(scores) / n
-    numerator = sum((x - x_avg) * (y - y_avg) for x, y in zip(indices, scores))
-    denominator = sum((x - x_avg) ** 2 for x in indices)
-    return numerator / denominator if denominator else 0.0
+# === Cached Resources (shared across reruns and sessions) ===
+@st.cache_resource
+def get_engine() -> DriftEngine:
+    warm_up()
+    return DriftEngine()
+
+@st.cache_resource
+def get_drift_log() -> DriftLog:
+    return DriftLog(LOG_FILE)
+
+engine = get_engine()
+drift_log = get_drift_log()
 
 def save_drift_log(row):
-    log_fields = [
-        "timestamp", "baseline", "incoming", "label", "drift_score",
-        "tier", "tone_badge", "rationale", "phrase", "polarity"
-    ]
-    row = {
-        "timestamp": datetime.now().isoformat(),
+    drift_log.append({
         "baseline": st.session_state.baseline_input,
         "incoming": row.get("phrase", ""),
         **row
-    }
-    write_header = not LOG_FILE.exists() or LOG_FILE.stat().st_size == 0
-    with open(LOG_FILE, "a", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=log_fields)
-        if write_header:
-            writer.writeheader()
-        writer.writerow(row)
+    })
 
 def get_sentiment_polarity(text: str) -> float:
-    return float(getattr(TextBlob(text).sentiment, "polarity", 0.0))
+    # Same backend and cache as the engine, so the text is not parsed twice
+    return raw_polarity_score(text)
 
 # === UI ===
 st.set_page_config(page_title="L.L.O.Y.D. Tone Drift", layout="centered")
@@ -93,20 +83,11 @@ clear_clicked = col2.button("🧹 Clear Drift Log", key="clear_log_button")
 # === Clear Drift Log ===
 if clear_clicked:
     if LOG_FILE.exists():
-        LOG_FILE.unlink()
+        drift_log.clear()
         st.success("✅ Drift log has been cleared.")
 
-# === Load drift history and compute slope ===
-history_rows = []
-if LOG_FILE.exists():
-    try:
-        df = pd.read_csv(LOG_FILE)
-        recent = df.tail(5)
-        history_rows = list(zip(recent["incoming"], recent["drift_score"]))
-    except Exception as e:
-        print("[ERROR] Couldn't load history for slope:", e)
-
-slope = compute_slope(history_rows + [(user_input, get_sentiment_polarity(user_input))])
+# Pick up rows appended since the last rerun (by this or any other session)
+drift_log.refresh()
 
 # === Analyze Input ===
 if analyze_clicked:
@@ -117,11 +98,16 @@ if analyze_clicked:
         print(f"[UI DEBUG] Incoming: '{user_input}'")
 
         polarity = get_sentiment_polarity(user_input)
-        result = analyze_drift(
+        result = engine.analyze_drift(
             st.session_state.baseline_input,
             user_input,
         )
 
+        # Least-squares slope over the last 5 logged turns plus the current input
+        slope_memory = DriftMemory(drift_log.recent_scores(5), capacity=6)
+        slope_memory.add(user_input, polarity)
+        slope = slope_memory.least_squares_slope
+
         st.subheader("📊 Drift Analysis")
         st.markdown(f"**Override Label:** `{result.label}`")
         st.markdown(f"**Drift Score:** `{result.drift_score}`")
@@ -130,6 +116,13 @@ if analyze_clicked:
         st.markdown(f"**Rationale:** {result.rationale}")
         st.markdown(f"**Drift Arc Slope:** `{round(slope, 3)}`")
 
+        with st.expander("🧭 Against every baseline"):
+            matrix = engine.analyze_against_baselines(user_input, BASELINE_OPTIONS.values())
+            st.dataframe([
+                {"baseline": name, "label": cell.label, "drift_score": cell.drift_score, "tier": cell.tier}
+                for name, cell in zip(BASELINE_OPTIONS, matrix.row())
+            ], use_container_width=True)
+
         log_row = {
             "phrase": user_input,
             "label": result.label,
@@ -140,15 +133,17 @@ if analyze_clicked:
             "polarity": polarity
         }
         save_drift_log(log_row)
+        drift_log.refresh()
 
 # === Display Log at Bottom ===
 st.markdown("---")
-if LOG_FILE.exists():
-    try:
-        df = pd.read_csv(LOG_FILE)
-        if not df.empty:
-            st.markdown("### 📜 Drift Log Preview")
-            st.dataframe(df[::-1], use_container_width=True)
-    except Exception as e:
-        st.error("⚠️ Could not read the drift log.")
-        print("[ERROR] Log load failed:", e)
\ No newline at end of file
+summary = drift_log.summary()
+if summary["rows"]:
+    st.markdown("### 📜 Drift Log Preview")
+    st.caption(
+        f"{summary['rows']:,} logged turns · mean drift score {summary['mean_drift_score']} · "
+        + ", ".join(f"{label}: {count}" for label, count in list(summary["labels"].items())[:5])
+    )
+    pages = (summary["rows"] + PAGE_SIZE - 1) // PAGE_SIZE
+    page = st.number_input("Page (newest first)", min_value=1, max_value=pages, value=1, step=1) - 1
+    st.dataframe(drift_log.page(page, PAGE_SIZE), use_container_width=True)
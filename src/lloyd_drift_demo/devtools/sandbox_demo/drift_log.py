@@ -0,0 +1,196 @@
+"""Append-only CSV drift log with an incrementally maintained tail and summary.
+
+Streamlit reruns the app script on every interaction, so the log must not
+be re-read in full each time. ``DriftLog`` remembers the byte offset it has
+consumed. ``refresh()``
+parses only the bytes appended since the last call, and keeps:
+
+- the last ``tail_size`` rows in memory;
+- running totals (row count, label counts, mean drift score);
+- a sparse index holding the byte offset of every ``INDEX_EVERY``-th row.
+
+With that index, any preview page is read with one seek plus at most
+``INDEX_EVERY + page_size`` rows, whatever the log length. A file that
+shrinks or is replaced is re-read from the start.
+"""
+
+import io
+import os
+import csv
+import threading
+from collections import Counter, deque
+from datetime import datetime
+from typing import Deque, Dict, List, Optional, Tuple
+
+LOG_FIELDS = [
+    "timestamp", "baseline", "incoming", "label", "drift_score",
+    "tier", "tone_badge", "rationale", "phrase", "polarity"
+]
+INDEX_EVERY = 1000
+DEFAULT_TAIL = 500
+
+
+def _record_complete(raw: bytes) -> bool:
+    # CSV doubles quotes inside quoted fields, so an odd count means a quoted newline is still open
+    return raw.count(b'"') % 2 == 0
+
+
+class DriftLog:
+    """Thread-safe reader/appender for the app's drift_log.csv."""
+
+    def __init__(self, path: str, tail_size: int = DEFAULT_TAIL, fields: Optional[List[str]] = None):
+        self.path = str(path)
+        self.fields = list(fields or LOG_FIELDS)
+        self.tail_size = tail_size
+        self._lock = threading.Lock()
+        self._writer_file = None
+        self._reset()
+
+    def _reset(self):
+        self.offset = 0                 # bytes consumed
+        self.rows = 0
+        self.header: Optional[List[str]] = None
+        self.tail: Deque[Dict[str, str]] = deque(maxlen=self.tail_size)
+        self.labels: Counter = Counter()
+        self.score_total = 0.0
+        self._index: List[int] = []     # byte offset of row k * INDEX_EVERY
+        self._identity: Optional[Tuple[int, int]] = None
+        self._pending = b""             # bytes of a record whose closing newline hasn't arrived
+
+    # === Reading ===
+    def refresh(self) -> int:
+        """Consume bytes appended since the last call; returns the number of new rows."""
+        with self._lock:
+            try:
+                stat = os.stat(self.path)
+            except FileNotFoundError:
+                if self.rows or self.offset:
+                    self._reset()
+                return 0
+            identity = (stat.st_dev, stat.st_ino)
+            if identity != self._identity or stat.st_size < self.offset:
+                self._reset()
+                self._identity = identity
+            if stat.st_size == self.offset:
+                return 0
+            with open(self.path, "rb") as f:
+                f.seek(self.offset)
+                data = f.read(stat.st_size - self.offset)
+            return self._consume(data)
+
+    def _consume(self, data: bytes) -> int:
+        added = 0
+        start = self.offset - len(self._pending)
+        record = self._pending
+        for line in data.splitlines(keepends=True):
+            record += line
+            if not line.endswith(b"\n") or not _record_complete(record):
+                continue
+            if self.header is None:
+                self.header = next(csv.reader(io.StringIO(record.decode("utf-8", "replace"))), None) or self.fields
+            else:
+                if self.rows % INDEX_EVERY == 0:
+                    self._index.append(start)
+                self._add_row(self._parse(record))
+                added += 1
+            start += len(record)
+            record = b""
+        self._pending = record
+        self.offset += len(data)
+        return added
+
+    def _parse(self, record: bytes) -> Dict[str, str]:
+        values = next(csv.reader(io.StringIO(record.decode("utf-8", "replace"), newline="")), [])
+        return dict(zip(self.header, values))
+
+    def _add_row(self, row: Dict[str, str]):
+        self.rows += 1
+        self.tail.append(row)
+        self.labels[row.get("label", "")] += 1
+        try:
+            self.score_total += float(row.get("drift_score") or 0.0)
+        except ValueError:
+            pass
+
+    def recent_scores(self, n: int = 5) -> List[Tuple[str, float]]:
+        """(incoming, drift_score) of the last ``n`` rows, oldest first."""
+        with self._lock:
+            rows = list(self.tail)[-n:] if n > 0 else []
+        out = []
+        for row in rows:
+            try:
+                out.append((row.get("incoming", ""), float(row.get("drift_score") or 0.0)))
+            except ValueError:
+                continue
+        return out
+
+    def summary(self) -> dict:
+        with self._lock:
+            return {
+                "rows": self.rows,
+                "labels": dict(self.labels.most_common()),
+                "mean_drift_score": round(self.score_total / self.rows, 2) if self.rows else 0.0,
+            }
+
+    def page(self, number: int = 0, size: int = 50) -> List[Dict[str, str]]:
+        """Rows of page ``number``, newest first; page 0 is the most recent ``size`` rows."""
+        with self._lock:
+            end = self.rows - number * size
+            start = max(0, end - size)
+            if end <= 0:
+                return []
+            tail_start = self.rows - len(self.tail)
+            if start >= tail_start:
+                rows = list(self.tail)[start - tail_start:end - tail_start]
+            else:
+                rows = self._read_rows(start, end - start)
+        return rows[::-1]
+
+    def _read_rows(self, first: int, count: int) -> List[Dict[str, str]]:
+        anchor = first // INDEX_EVERY
+        skip = first - anchor * INDEX_EVERY
+        rows: List[Dict[str, str]] = []
+        record = b""
+        with open(self.path, "rb") as f:
+            f.seek(self._index[anchor])
+            for line in f:
+                record += line
+                if not _record_complete(record):
+                    continue
+                if skip:
+                    skip -= 1
+                else:
+                    rows.append(self._parse(record))
+                    if len(rows) == count:
+                        break
+                record = b""
+        return rows
+
+    # === Writing ===
+    def append(self, row: Dict[str, object]):
+        """Append one row through a handle kept open between calls; picked up by the next refresh()."""
+        with self._lock:
+            if self._writer_file is None or not os.path.exists(self.path):
+                self._close_writer()
+                self._writer_file = open(self.path, "a", encoding="utf-8", newline="")
+            writer = csv.DictWriter(self._writer_file, fieldnames=self.fields, extrasaction="ignore")
+            if self._writer_file.tell() == 0:
+                writer.writeheader()
+            writer.writerow({"timestamp": datetime.now().isoformat(), **row})
+            self._writer_file.flush()
+
+    def clear(self):
+        with self._lock:
+            self._close_writer()
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            self._reset()
+
+    def _close_writer(self):
+        if self._writer_file is not None:
+            self._writer_file.close()
+            self._writer_file = None
+
+    def close(self):
+        with self._lock:
+            self._close_writer()
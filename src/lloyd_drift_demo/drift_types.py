@@ -1,7 +1,11 @@
-from dataclasses import dataclass, field
-from typing import Optional, List, Tuple
+import sys
+from dataclasses import dataclass
+from typing import Optional, List, Tuple, Iterable, Iterator
 
-@dataclass
+# Slotted where supported (3.10+): no per-instance __dict__ on hot result objects
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class DriftResult:
     drift_detected: bool
     label: str
@@ -13,14 +17,155 @@ class DriftResult:
     tier: Optional[str] = None
     drift: Optional[float] = None  # If you're accessing `.drift` elsewhere
 
-@dataclass
+DEFAULT_MEMORY_CAPACITY = 5
+DEFAULT_EWMA_ALPHA = 0.3
+_RESUM_EVERY = 1024     # evictions between exact re-summations (bounds float drift)
+_REBASE_AT = 1 << 20    # time index at which the origin is shifted back to 0
+
 class DriftMemory:
-    history: List[Tuple[str, float]] = field(default_factory=list)
+    """Fixed-capacity ring buffer of (text, score) turns with O(1) trend statistics.
+
+    Running sums over the window give the mean-difference slope (what
+    ``compute_slope`` returns) and the least-squares slope in constant time
+    per update; an EWMA tracks the longer-run tone trend. Pass
+    ``keep_text=False`` to store scores only when many memories are live.
+    """
 
+    __slots__ = (
+        "capacity", "ewma_alpha", "ewma", "_scores", "_texts", "_start", "_len",
+        "_sum_y", "_sum_ty", "_t_next", "_evictions",
+    )
+
+    def __init__(
+        self,
+        history: Optional[Iterable[Tuple[str, float]]] = None,
+        capacity: int = DEFAULT_MEMORY_CAPACITY,
+        ewma_alpha: float = DEFAULT_EWMA_ALPHA,
+        keep_text: bool = True,
+    ):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.ewma_alpha = ewma_alpha
+        self.ewma: Optional[float] = None
+        self._scores: List[float] = [0.0] * capacity
+        self._texts: Optional[List[Optional[str]]] = [None] * capacity if keep_text else None
+        self._start = 0
+        self._len = 0
+        self._sum_y = 0.0
+        self._sum_ty = 0.0   # Σ t·y, with t counted from the current origin
+        self._t_next = 0     # t of the next score to be added
+        self._evictions = 0
+        for text, score in history or ():
+            self.add(text, score)
+
+    # === Updates ===
     def add(self, text: str, score: float):
-        self.history.append((text, score))
-        if len(self.history) > 5:
-            self.history.pop(0)
+        cap = self.capacity
+        if self._len == cap:
+            oldest = self._scores[self._start]
+            self._sum_y -= oldest
+            self._sum_ty -= (self._t_next - cap) * oldest
+            slot = self._start
+            self._start = (self._start + 1) % cap
+            self._evictions += 1
+        else:
+            slot = (self._start + self._len) % cap
+            self._len += 1
+
+        self._scores[slot] = score
+        if self._texts is not None:
+            self._texts[slot] = text
+        self._sum_y += score
+        self._sum_ty += self._t_next * score
+        self._t_next += 1
+        self.ewma = score if self.ewma is None else self.ewma_alpha * score + (1 - self.ewma_alpha) * self.ewma
+
+        if self._t_next >= _REBASE_AT:
+            shift = self._t_next - self._len
+            self._sum_ty -= shift * self._sum_y
+            self._t_next -= shift
+        if self._evictions >= _RESUM_EVERY:
+            self._resum()
+
+    def _resum(self):
+        first_t = self._t_next - self._len
+        scores = list(self.scores())
+        self._sum_y = sum(scores)
+        self._sum_ty = sum((first_t + i) * y for i, y in enumerate(scores))
+        self._evictions = 0
+
+    def clear(self):
+        self._start = self._len = 0
+        self._sum_y = self._sum_ty = 0.0
+        self._t_next = self._evictions = 0
+        self.ewma = None
+
+    # === Access ===
+    def scores(self) -> Iterator[float]:
+        cap = self.capacity
+        for i in range(self._len):
+            yield self._scores[(self._start + i) % cap]
+
+    def __iter__(self) -> Iterator[Tuple[Optional[str], float]]:
+        cap = self.capacity
+        for i in range(self._len):
+            slot = (self._start + i) % cap
+            yield (self._texts[slot] if self._texts is not None else None), self._scores[slot]
+
+    def __len__(self) -> int:
+        return self._len
+
+    @property
+    def keep_text(self) -> bool:
+        return self._texts is not None
+
+    @property
+    def history(self) -> List[Tuple[Optional[str], float]]:
+        return list(self)
+
+    def get_recent(self, n: int = 5) -> List[Tuple[Optional[str], float]]:
+        items = list(self)
+        return items[-n:] if n > 0 else []
+
+    @property
+    def first_score(self) -> Optional[float]:
+        return self._scores[self._start] if self._len else None
+
+    @property
+    def last_score(self) -> Optional[float]:
+        return self._scores[(self._start + self._len - 1) % self.capacity] if self._len else None
+
+    # === Trend statistics (all O(1)) ===
+    @property
+    def mean(self) -> float:
+        return self._sum_y / self._len if self._len else 0.0
+
+    @property
+    def mean_diff_slope(self) -> float:
+        """Average step between consecutive scores; same quantity as compute_slope()."""
+        if self._len < 2:
+            return 0.0
+        return (self.last_score - self.first_score) / (self._len - 1)
+
+    def projected_slope(self, score: float) -> float:
+        """Mean-difference slope of the window plus one more score, without adding it."""
+        if self._len < 1:
+            return 0.0
+        return (score - self.first_score) / self._len
+
+    @property
+    def least_squares_slope(self) -> float:
+        n = self._len
+        if n < 2:
+            return 0.0
+        t_mean = self._t_next - (n + 1) / 2
+        sxx = n * (n * n - 1) / 12
+        return (self._sum_ty - t_mean * self._sum_y) / sxx
+
+    @property
+    def tone_trend(self) -> float:
+        return self.ewma if self.ewma is not None else 0.0
 
-    def get_recent(self, n: int = 5) -> List[Tuple[str, float]]:
-        return self.history[-n:]
\ No newline at end of file
+    def __repr__(self) -> str:
+        return f"DriftMemory(capacity={self.capacity}, history={self.history!r})"
@@ -0,0 +1,47 @@
+import json
+from dataclasses import dataclass, field, asdict
+from typing import FrozenSet, Optional
+
+DEFAULT_RARE_TAGS = frozenset({"lament", "awe", "reverence", "resignation"})
+
+
+@dataclass(frozen=True)
+class DriftEngineConfig:
+    """Tunable engine settings, passed explicitly instead of read from the CWD.
+
+    ``from_file`` and ``from_dict`` read ``drift_config.json``, accepting its
+    upper-case keys as well as the field names. Its ``POLARITY_THRESHOLD``
+    and ``EMPHASIS_OVERRIDE`` keys are ignored: no scoring path reads them.
+    """
+    rare_tags: FrozenSet[str] = field(default_factory=lambda: DEFAULT_RARE_TAGS)
+
+    def __post_init__(self):
+        object.__setattr__(self, "rare_tags", frozenset(tag.lower() for tag in self.rare_tags))
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DriftEngineConfig":
+        values = {}
+        for name in cls.__dataclass_fields__:
+            for key in (name, name.upper()):
+                if key in data:
+                    values[name] = data[key]
+                    break
+        return cls(**values)
+
+    @classmethod
+    def from_file(cls, path: str) -> "DriftEngineConfig":
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["rare_tags"] = sorted(self.rare_tags)
+        return data
+
+
+DEFAULT_ENGINE_CONFIG = DriftEngineConfig()
+
+
+def load_engine_config(path: Optional[str] = None) -> DriftEngineConfig:
+    """Config from ``path`` if given, else the built-in defaults."""
+    return DriftEngineConfig.from_file(path) if path else DEFAULT_ENGINE_CONFIG
@@ -1,22 +1,34 @@
-import re
+import os
 import json
+import time
+import hashlib
 import logging
-import difflib
-import inspect
-import emoji 
-from pathlib import Path
+from dataclasses import dataclass
 from datetime import datetime
-from textblob import TextBlob
-from typing import Optional, Dict, List, Union
+from functools import cached_property
 from collections import deque
+from typing import Optional, Dict, List, Union, Iterable, Iterator, Tuple, Hashable
 # In engine/drift_engine.py:
 # src/lloyd_drift_demo/engine/drift_engine.py
 from lloyd_drift_demo.drift_types import DriftResult, DriftMemory
 from lloyd_drift_demo.override_scores import OVERRIDE_WEIGHTS, OVERRIDE_MESSAGES
 from lloyd_drift_demo.engine.shared_utils import get_sentiment_polarity
+from lloyd_drift_demo.engine.lexicon import LEXICON_MATCHER, LexiconHits, ANTONYM_PAIRS
+from lloyd_drift_demo.engine import patterns
+from lloyd_drift_demo.engine.journal import DriftJournal, get_journal
+from lloyd_drift_demo.engine.memory_store import MemoryStore, MEMORY_STORE
+from lloyd_drift_demo.engine.config import DriftEngineConfig, DEFAULT_ENGINE_CONFIG
+from lloyd_drift_demo.engine.rules import RuleRegistry
+from lloyd_drift_demo.engine import similarity
+from lloyd_drift_demo.engine.similarity import ratio_exceeds
+from lloyd_drift_demo.engine.polarity_backends import get_polarity_backend
+from lloyd_drift_demo.engine.result_cache import RESULT_CACHE, result_key
+from lloyd_drift_demo.engine.instrumentation import INSTRUMENTS, DriftTrace, RuleTrace
+from lloyd_drift_demo.engine.heatmap import TokenHeatmap
 
 from .shared_utils import (
     get_polarity_score,
+    raw_polarity_score,
     symbolic_emphasis_score,
     detect_symbolic_override,
     is_mocked_echo,
@@ -29,54 +41,40 @@ from .shared_utils import (
     DRIFT_THRESHOLD,
     is_gray_zone_ambiguous,
 )
-def polarity(text: str) -> str:
+def polarity(text: "TextLike") -> str:
     """Basic polarity classifier — returns 'positive', 'negative', or 'neutral'."""
-    lower = text.lower()
-    if any(word in lower for word in ["love", "like", "enjoy", "great", "wonderful", "good"]):
+    hits = as_analyzed(text).lexicon_hits
+    if hits["positive"]:
         return "positive"
-    if any(word in lower for word in ["hate", "dislike", "awful", "bad", "terrible", "worse"]):
+    if hits["negative"]:
         return "negative"
     return "neutral"
 
-def shared_root(text1: str, text2: str) -> bool:
-    words1 = normalize(text1).split()
-    words2 = normalize(text2).split()
+def shared_root(text1: "TextLike", text2: "TextLike") -> bool:
+    words1 = as_analyzed(text1).tokens
+    words2 = as_analyzed(text2).tokens
     return bool(words1 and words2 and words1[0] == words2[0])
 
-def is_uppercase_yelling(text: str) -> bool:
-    return text.isupper() and len(text) > 3
+def is_uppercase_yelling(text: "TextLike") -> bool:
+    text = as_analyzed(text)
+    return text.is_upper and len(text.text) > 3
 
-def has_intensifiers(text: str) -> bool:
-    intensifiers = [
-        "really", "seriously", "actually", "fine", "very",
-        "absolutely", "completely", "totally", "so", "extremely",
-        "literally", "freaking", "fucking", "insanely", "incredibly"
-    ]
-    return "!" in text or "?" in text or any(word in text.lower() for word in intensifiers)
-
-ANTONYM_PAIRS = [
-    ("love", "hate"),
-    ("like", "dislike"),
-    ("happy", "sad"),
-    ("good", "bad"),
-    ("fine", "terrible"),
-    ("calm", "angry"),
-    ("right", "wrong"),
-    ("yes", "no"),
-    ("helpful", "useless"),
-    ("clean", "dirty"),
-]
-
-def is_antonymic_reversal(baseline: str, incoming: str) -> bool:
-    base = normalize(baseline).lower().split()
-    inc = normalize(incoming).lower().split()
+def has_intensifiers(text: "TextLike") -> bool:
+    text = as_analyzed(text)
+    return "!" in text.text or "?" in text.text or bool(text.lexicon_hits["intensifiers"])
+
+def is_antonymic_reversal(baseline: "TextLike", incoming: "TextLike") -> bool:
+    base = as_analyzed(baseline).lexicon_hits["antonyms"]
+    inc = as_analyzed(incoming).lexicon_hits["antonyms"]
+    if not base or not inc:
+        return False
     for a, b in ANTONYM_PAIRS:
         if (a in base and b in inc) or (b in base and a in inc):
             return True
     return False
-def is_reversed(baseline: str, incoming: str) -> bool:
-    baseline = baseline.lower()
-    incoming = incoming.lower()
+def is_reversed(baseline: "TextLike", incoming: "TextLike") -> bool:
+    baseline = as_analyzed(baseline).lexicon_hits["reversal_cues"]
+    incoming = as_analyzed(incoming).lexicon_hits["reversal_cues"]
     return (
         ("like" in baseline and "don’t like" in incoming)
         or ("love" in baseline and "hate" in incoming)
@@ -87,6 +85,9 @@ def is_reversed(baseline: str, incoming: str) -> bool:
 # ——————————————————
 # Config Loader
 # ——————————————————
+# Nothing is read from the working directory at import: module defaults come
+# from DriftEngineConfig, and tuned settings go to a DriftEngine instance
+# (e.g. DriftEngine(DriftEngineConfig.from_file("drift_config.json"))).
 DEFAULT_CONFIG = {
     "POLARITY_THRESHOLD": 0.15,
     "EMPHASIS_OVERRIDE": 1.0,
@@ -94,15 +95,19 @@ DEFAULT_CONFIG = {
 }
 
 def load_config(path: str = "drift_config.json") -> dict:
-    if Path(path).is_file():
+    if os.path.isfile(path):
         with open(path) as f:
             return json.load(f)
     return DEFAULT_CONFIG
 
-config = load_config()
-POLARITY_THRESHOLD = config["POLARITY_THRESHOLD"]
-EMPHASIS_OVERRIDE = config["EMPHASIS_OVERRIDE"]
-RARE_TAGS = set(config["RARE_TAGS"])
+# Kept for importers; no scoring path reads these two
+POLARITY_THRESHOLD = DEFAULT_CONFIG["POLARITY_THRESHOLD"]
+EMPHASIS_OVERRIDE = DEFAULT_CONFIG["EMPHASIS_OVERRIDE"]
+RARE_TAGS = set(DEFAULT_ENGINE_CONFIG.rare_tags)
+LEXICON_MATCHER.register("rare_tags", RARE_TAGS)
+# tag set -> (lexicon name, matcher version once it was registered)
+_RARE_TAG_LEXICONS = {frozenset(RARE_TAGS): ("rare_tags", LEXICON_MATCHER.version)}
+MIRROR_THRESHOLD = 0.85   # difflib ratio above which a reply counts as mirroring the baseline
 ACRONYM_WHITELIST = {"AI", "LLM", "GPT", "NASA", "CPU", "GPU", "URL", "PDF", "API", "SQL"}
 
 # ——————————————————
@@ -118,39 +123,157 @@ def normalize(text: str) -> str:
     text = text.lower().strip()
     text = text.replace("\u200b", "")
     text = text.replace("\n", " ").replace("\r", " ")
-    text = re.sub(r"[^\w\s']", "", text)
-    return re.sub(r"\s+", " ", text)
+    text = patterns.NON_WORD_KEEP_APOSTROPHE.sub("", text)
+    return patterns.WHITESPACE_RUN.sub(" ", text)
+
+class AnalyzedText:
+    """Per-message feature bundle: every signal is computed at most once, on first use."""
+
+    def __init__(self, text: str):
+        self.text = text
+
+    @cached_property
+    def lower(self) -> str:
+        return self.text.lower()
+
+    @cached_property
+    def stripped(self) -> str:
+        return self.text.strip()
+
+    @cached_property
+    def normalized(self) -> str:
+        return normalize(self.text)
+
+    @cached_property
+    def tokens(self) -> List[str]:
+        return self.normalized.split()
+
+    @cached_property
+    def word_count(self) -> int:
+        return len(self.text.split())
+
+    @cached_property
+    def is_upper(self) -> bool:
+        return self.text.isupper()
+
+    @cached_property
+    def has_upper(self) -> bool:
+        return any(char.isupper() for char in self.text)
+
+    @cached_property
+    def lexicon_hits(self) -> LexiconHits:
+        # One pass over the text for every registered keyword lexicon
+        return LEXICON_MATCHER.match(self.lower)
+
+    def lexicon_hits_since(self, version: int) -> LexiconHits:
+        """``lexicon_hits``, rescanned if they predate matcher ``version``."""
+        hits = self.lexicon_hits
+        if hits.version < version:
+            hits = self.__dict__["lexicon_hits"] = LEXICON_MATCHER.match(self.lower)
+        return hits
+
+    @cached_property
+    def emphasis_score(self) -> float:
+        return compute_emphasis_score(self.text)
+
+    @cached_property
+    def emoji_count(self) -> int:
+        return patterns.count_emoji(self.text)
+
+    @cached_property
+    def polarity_score(self) -> float:
+        return compute_polarity_score(self.text)
+
+    @cached_property
+    def sentiment_polarity(self) -> float:
+        # Same value get_sentiment_polarity() returns, without a second TextBlob parse
+        return round(self.polarity_score, 3)
+
+    @cached_property
+    def rule_outcomes(self) -> dict:
+        # Outcomes of incoming-only override rules, shared by every pair this text is scored in
+        return {}
+
+    @cached_property
+    def heatmap(self) -> TokenHeatmap:
+        # Columns are filled on first read, from the signals cached above
+        return TokenHeatmap(self)
+
+    def __repr__(self) -> str:
+        return f"AnalyzedText({self.text!r})"
+
+TextLike = Union[str, AnalyzedText]
+
+def as_analyzed(text: TextLike) -> AnalyzedText:
+    return text if isinstance(text, AnalyzedText) else AnalyzedText(text)
 
 def normalize_text(text: str) -> str:
     text = text.lower()
-    text = re.sub(r"\s+", " ", text)
-    text = re.sub(r"([!?])\1+", r"\1", text)
-    text = re.sub(r"\b(\w)\s+\1\b", r"\1", text)
+    text = patterns.WHITESPACE_RUN.sub(" ", text)
+    text = patterns.REPEATED_BANG_OR_QMARK.sub(r"\1", text)
+    text = patterns.SPACED_LETTER_REPEAT.sub(r"\1", text)
     return text.strip()
 
 # ——————————————————
 # Symbolic Tag Stub
 # ——————————————————
-def expand_symbolic_tags(text: str) -> Optional[str]:
-    lowered = text.lower()
-    for tag in RARE_TAGS:
-        if tag in lowered:
+def _is_rare_tag_lexicon(name: str) -> bool:
+    # Only expand_symbolic_tags reads these; drift scoring never does
+    return name == "rare_tags" or name.startswith("rare_tags:")
+
+def _rare_tag_lexicon(rare_tags: frozenset) -> Tuple[str, int]:
+    # Each distinct tag set gets its own lexicon in the shared matcher
+    entry = _RARE_TAG_LEXICONS.get(rare_tags)
+    if entry is None:
+        name = "rare_tags:" + ",".join(sorted(rare_tags))
+        LEXICON_MATCHER.register(name, rare_tags)
+        entry = _RARE_TAG_LEXICONS[rare_tags] = (name, LEXICON_MATCHER.version)
+    return entry
+
+def expand_symbolic_tags(text: TextLike, config: Optional[DriftEngineConfig] = None) -> Optional[str]:
+    rare_tags = config.rare_tags if config is not None else frozenset(RARE_TAGS)
+    # Registered before the scan; hits cached before this tag set existed are rescanned
+    name, registered = _rare_tag_lexicon(rare_tags)
+    tags = as_analyzed(text).lexicon_hits_since(registered)[name]
+    for tag in rare_tags:
+        if tag in tags:
             return "symbolic_" + tag
     return None
 
 # ——————————————————
-# Token Heatmap Stub
+# Token Heatmap
 # ——————————————————
-def attach_token_heatmap(text: str) -> Dict[str, List[Dict[str, Union[str, float]]]]:
-    tokens = text.split()
-    return {
-        "tokens": [{"word": tok, "score": round(len(tok) / 10, 2)} for tok in tokens]
-    }
+def attach_token_heatmap(text: TextLike) -> Dict[str, List[Dict[str, Union[str, float, int, list]]]]:
+    """Per-token word, offsets, score and signal breakdown; see engine/heatmap.py."""
+    return as_analyzed(text).heatmap.to_dict()
 
 # ——————————————————
 # Tone badge
 # ——————————————————
+# Badges and tiers come from small closed sets, so each string is built once
+# and every DriftResult shares it rather than formatting its own copy.
+_BADGES: Dict[str, str] = {}
+_TIERS: Dict[int, str] = {}
+_MAX_INTERNED = 1024
+
 def compute_tone_badge(label: str, is_drift: bool) -> str:
+    badge = _BADGES.get(label)
+    if badge is None:
+        badge = _format_tone_badge(label)
+        if len(_BADGES) < _MAX_INTERNED:
+            _BADGES[label] = badge
+    return badge
+
+def compute_tier(score: float) -> str:
+    key = int(score) // 10
+    tier = _TIERS.get(key)
+    if tier is None:
+        tier = str(key)
+        if len(_TIERS) < _MAX_INTERNED:
+            _TIERS[key] = tier
+    return tier
+
+def _format_tone_badge(label: str) -> str:
     if label in OVERRIDE_WEIGHTS:
         return f"🛳 override: {label}"
     if label == "reversal":
@@ -168,17 +291,20 @@ def compute_tone_badge(label: str, is_drift: bool) -> str:
 # ——————————————
 # Responsiveness
 # ——————————————
-def compute_responsiveness(baseline: str, incoming: str, label: str) -> str:
+def compute_responsiveness(baseline: TextLike, incoming: TextLike, label: str) -> str:
     if label == "mocked_echo":
         return "reactive"
     if label in {"emphasis_override", "emoji_emphasis_override"}:
-        if any(char.isupper() for char in incoming) and not is_mirrored(baseline, incoming):
+        if as_analyzed(incoming).has_upper and not is_mirrored(baseline, incoming):
             return "proactive"
     return "neutral"
 
-def is_mirrored(baseline: str, incoming: str) -> bool:
-    return normalize(incoming).startswith(normalize(baseline)) or \
-           difflib.SequenceMatcher(None, normalize(baseline), normalize(incoming)).ratio() > 0.85
+def is_mirrored(baseline: TextLike, incoming: TextLike) -> bool:
+    norm_base = as_analyzed(baseline).normalized
+    norm_inc = as_analyzed(incoming).normalized
+    if norm_inc.startswith(norm_base):
+        return True
+    return ratio_exceeds(norm_base, norm_inc, MIRROR_THRESHOLD)
 
 def compute_slope(pairs: list[tuple[str, float]]) -> float:
     if len(pairs) < 2:
@@ -190,152 +316,199 @@ def compute_slope(pairs: list[tuple[str, float]]) -> float:
 # ——————————————
 # Override Conditions
 # ——————————————
-def is_mocked_echo(baseline: str, incoming: str) -> bool:
-    norm_base = normalize(baseline)
-    norm_inc = normalize(incoming)
-
-    score_base = compute_emphasis_score(baseline)
-    score_inc = compute_emphasis_score(incoming)
-
-    return norm_base == norm_inc and (score_inc - score_base > 0.5)
+def is_mocked_echo(baseline: TextLike, incoming: TextLike) -> bool:
+    baseline = as_analyzed(baseline)
+    incoming = as_analyzed(incoming)
+    return baseline.normalized == incoming.normalized and \
+        (incoming.emphasis_score - baseline.emphasis_score > 0.5)
 
-def has_sarcasm_hint(incoming: str) -> bool:
-    return incoming.strip().endswith("...") or "/s" in incoming.lower()
+def has_sarcasm_hint(incoming: TextLike) -> bool:
+    incoming = as_analyzed(incoming)
+    return incoming.stripped.endswith("...") or "/s" in incoming.lower
 
-def is_negation_amplified(baseline: str, incoming: str) -> bool:
-    negators = r"\b(not|don’t|never|no|nothing|can't|won't|n't)\b"
-    return shared_root(baseline, incoming) and bool(re.search(negators, incoming.lower()))
+def is_negation_amplified(baseline: TextLike, incoming: TextLike) -> bool:
+    incoming = as_analyzed(incoming)
+    return shared_root(baseline, incoming) and bool(patterns.NEGATORS.search(incoming.lower))
 
-def is_emphasis_override(baseline: str, incoming: str) -> bool:
-    return is_uppercase_yelling(incoming) or "!!" in incoming or "???" in incoming
+def is_emphasis_override(baseline: TextLike, incoming: TextLike) -> bool:
+    incoming = as_analyzed(incoming)
+    return is_uppercase_yelling(incoming) or "!!" in incoming.text or "???" in incoming.text
 
-def is_emoji_override(baseline: str, incoming: str) -> bool:
-    count = sum(1 for char in incoming if emoji.is_emoji(char))
-    return count >= 2
+def is_emoji_override(baseline: TextLike, incoming: TextLike) -> bool:
+    return as_analyzed(incoming).emoji_count >= 2
 
-def is_hedge_override(baseline: str, incoming: str) -> bool:
-    return any(p in incoming.lower() for p in ["maybe", "perhaps", "kind of", "sort of", "i guess", "i think"])
+def is_hedge_override(baseline: TextLike, incoming: TextLike) -> bool:
+    return bool(as_analyzed(incoming).lexicon_hits["hedges"])
 
-def is_rhetorical_drift(baseline: str, incoming: str) -> bool:
-    return incoming.strip().endswith("?") and shared_root(baseline, incoming)
+def is_rhetorical_drift(baseline: TextLike, incoming: TextLike) -> bool:
+    incoming = as_analyzed(incoming)
+    return incoming.stripped.endswith("?") and shared_root(baseline, incoming)
 
-def is_sign_flip(baseline: str, incoming: str) -> bool:
-    base_score = compute_polarity_score(baseline)
-    inc_score = compute_polarity_score(incoming)
+def is_sign_flip(baseline: TextLike, incoming: TextLike) -> bool:
+    base_score = as_analyzed(baseline).polarity_score
+    inc_score = as_analyzed(incoming).polarity_score
     return base_score * inc_score < 0 and abs(base_score - inc_score) < 0.3
 
-def is_hostile_emphasis(baseline: str, incoming: str) -> bool:
-    incoming_lower = incoming.lower()
-    hostile_terms = [
-        "disgusted", "garbage", "trash", "hate", "worthless",
-        "awful", "literally", "useless", "ruined", "terrible",
-        "fuming", "furious", "crap", "filth", "shit", "junk"
-    ]
+def is_hostile_emphasis(baseline: TextLike, incoming: TextLike) -> bool:
+    incoming = as_analyzed(incoming)
+    hits = incoming.lexicon_hits
 
     # Style 1: Intensified hostile language
+    # (lexicon gate first, so texts without hostile terms skip the sentiment parse)
     hostile_by_emphasis = (
-        compute_polarity_score(incoming) <= -0.5 and
-        any(term in incoming_lower for term in hostile_terms) and
-        (has_intensifiers(incoming) or "!" in incoming)
+        hits["hostile"] and
+        incoming.polarity_score <= -0.5 and
+        (has_intensifiers(incoming) or "!" in incoming.text)
     )
 
     # Style 2: Short hostile evaluation using linking verbs
-    linking_verbs = ["is", "are", "you're", "you are", "this is", "that is"]
-    short_phrase = len(incoming.split()) <= 6
+    short_phrase = incoming.word_count <= 6
     is_structural_eval = (
-        any(verb in incoming_lower for verb in linking_verbs) and
-        any(term in incoming_lower for term in hostile_terms) and
-        (short_phrase or "!" in incoming)
+        hits["linking_verbs"] and
+        hits["hostile"] and
+        (short_phrase or "!" in incoming.text)
     )
 
-    return hostile_by_emphasis or is_structural_eval
+    return bool(hostile_by_emphasis or is_structural_eval)
 
 # ——————————————
 # Drift Analyzer Core
 # ——————————————
 def compute_emphasis_score(text: str) -> float:
-    caps = sum(1 for c in text if c.isupper())
-    excl = text.count("!")
-    qmark = text.count("?")
-    emoji_count = len(re.findall(r"[😂🤣😡😢😍😭❤️]", text))
-    return 0.3 * caps + 0.5 * excl + 0.5 * qmark + 0.5 * emoji_count
+    return symbolic_emphasis_score(text)
 
 def compute_polarity_score(text: str) -> float:
-    return float(getattr(TextBlob(text).sentiment, "polarity", 0.0) or 0.0)
-
-def analyze_drift(baseline: str, incoming: str, memory: Optional[DriftMemory] = None, verbose: bool = False) -> DriftResult:
-    base_score = compute_emphasis_score(baseline)
-    inc_score = compute_emphasis_score(incoming)
-    drift_score = inc_score - base_score
-
-    candidates = []
-
-    if is_reversed(baseline, incoming) and ("I" in incoming or "we" in incoming):
-        candidates.append(("reversal", 100, "Polarity reversal detected with strong personal negation."))
-
-    if is_antonymic_reversal(baseline, incoming):
-        candidates.append((
-        "reversal",
-        100,
-        "Incoming reverses polarity of baseline with strong antonymic contrast."
-    ))
-
-    if is_mocked_echo(baseline, incoming):
-        # Optional reassertion signal
-        if is_uppercase_yelling(incoming) or has_intensifiers(incoming):
-            candidates.append((
-                "reasserted_escalation",
-                OVERRIDE_WEIGHTS["reasserted_escalation"],
-                OVERRIDE_MESSAGES["reasserted_escalation"]
-            ))
+    return raw_polarity_score(text)
 
+# ——————————————
+# Override Rules
+# ——————————————
+# Registered in the order analyze_drift used to build its candidate list;
+# that order still breaks weight ties. Costs: ~1 string test, ~2-3 lexicon or
+# emphasis scan, ~10 difflib, ~50 TextBlob parse.
+OVERRIDE_RULES = RuleRegistry()
+
+@OVERRIDE_RULES.rule("personal_reversal", weight=100, cost=2, label="reversal",
+                     rationale="Polarity reversal detected with strong personal negation.")
+def _personal_reversal_rule(baseline, incoming, memory):
+    return is_reversed(baseline, incoming) and ("I" in incoming.text or "we" in incoming.text)
+
+@OVERRIDE_RULES.rule("antonymic_reversal", weight=100, cost=2, label="reversal",
+                     rationale="Incoming reverses polarity of baseline with strong antonymic contrast.")
+def _antonymic_reversal_rule(baseline, incoming, memory):
+    return is_antonymic_reversal(baseline, incoming)
+
+@OVERRIDE_RULES.rule("reasserted_escalation", weight=OVERRIDE_WEIGHTS["reasserted_escalation"], cost=3,
+                     rationale=OVERRIDE_MESSAGES["reasserted_escalation"])
+def _reasserted_escalation_rule(baseline, incoming, memory):
+    # Optional reassertion signal on top of a mocked echo
+    return is_mocked_echo(baseline, incoming) and (is_uppercase_yelling(incoming) or has_intensifiers(incoming))
+
+@OVERRIDE_RULES.rule("mocked_echo", weight=max(OVERRIDE_WEIGHTS["mocked_echo"], 85), cost=4)
+def _mocked_echo_rule(baseline, incoming, memory):
+    if not is_mocked_echo(baseline, incoming):
+        return None
     # Compute slope (memory-aware or fallback)
-        if memory and memory.history:
-            recent_history = memory.get_recent()
-            incoming_score = get_sentiment_polarity(incoming)
-            slope = compute_slope(recent_history + [(incoming, incoming_score)])
-        else:
-            slope = 0.0
-
+    if memory is not None and len(memory):
+        # O(1): mean-difference slope of the memory window plus this turn
+        slope = memory.projected_slope(incoming.sentiment_polarity)
+    else:
+        slope = 0.0
     # Apply gray zone override or fallback to mocked_echo
-        if is_gray_zone_ambiguous(baseline, incoming, slope):
-            candidates.append((
-                "gray_zone_ambiguous",
-                85,
-                "Ambiguous symbolic collapse phrase with directional slope detected."
-            ))
-        else:
-            candidates.append((
-                "mocked_echo",
-                OVERRIDE_WEIGHTS["mocked_echo"],
-                OVERRIDE_MESSAGES["mocked_echo"]
-            ))
-    if is_sign_flip(baseline, incoming):
-        candidates.append(("sign_flip", OVERRIDE_WEIGHTS["sign_flip"], "Polarity sign-flip detected"))
-    if is_rhetorical_drift(baseline, incoming):
-        candidates.append(("rhetorical_drift", OVERRIDE_WEIGHTS["rhetorical_drift"], OVERRIDE_MESSAGES["rhetorical_drift"]))
-    if has_sarcasm_hint(incoming):
-        candidates.append(("sarcasm_hint", OVERRIDE_WEIGHTS["sarcasm_hint"], OVERRIDE_MESSAGES["sarcasm_hint"]))
-    if is_emphasis_override(baseline, incoming) and not is_mirrored(baseline, incoming):
-        candidates.append(("emphasis_override", OVERRIDE_WEIGHTS["emphasis_override"], OVERRIDE_MESSAGES["emphasis_override"]))
-    if is_emoji_override(baseline, incoming):
-        candidates.append(("emoji_emphasis_override", OVERRIDE_WEIGHTS["emoji_emphasis_override"], OVERRIDE_MESSAGES["emoji_emphasis_override"]))
-    if is_hedge_override(baseline, incoming):
-        candidates.append(("stable_rationale", OVERRIDE_WEIGHTS["stable_rationale"], OVERRIDE_MESSAGES["stable_rationale"]))
-    if is_negation_amplified(baseline, incoming):
-        candidates.append(("negation_amplified", OVERRIDE_WEIGHTS["negation_amplified"], OVERRIDE_MESSAGES["negation_amplified"]))
-    if is_hostile_emphasis(baseline, incoming):
-        candidates.append(("hostile_emphasis", OVERRIDE_WEIGHTS["hostile_emphasis"], OVERRIDE_MESSAGES["hostile_emphasis"]))
-
-
-    if candidates:
-        if verbose:
+    if is_gray_zone_ambiguous(baseline.text, incoming.text, slope):
+        return ("gray_zone_ambiguous", 85, "Ambiguous symbolic collapse phrase with directional slope detected.")
+    return ("mocked_echo", OVERRIDE_WEIGHTS["mocked_echo"], OVERRIDE_MESSAGES["mocked_echo"])
+
+@OVERRIDE_RULES.rule("sign_flip", weight=OVERRIDE_WEIGHTS["sign_flip"], cost=50,
+                     rationale="Polarity sign-flip detected")
+def _sign_flip_rule(baseline, incoming, memory):
+    return is_sign_flip(baseline, incoming)
+
+@OVERRIDE_RULES.rule("rhetorical_drift", weight=OVERRIDE_WEIGHTS["rhetorical_drift"], cost=2,
+                     rationale=OVERRIDE_MESSAGES["rhetorical_drift"])
+def _rhetorical_drift_rule(baseline, incoming, memory):
+    return is_rhetorical_drift(baseline, incoming)
+
+@OVERRIDE_RULES.rule("sarcasm_hint", weight=OVERRIDE_WEIGHTS["sarcasm_hint"], cost=1,
+                     rationale=OVERRIDE_MESSAGES["sarcasm_hint"], incoming_only=True)
+def _sarcasm_hint_rule(baseline, incoming, memory):
+    return has_sarcasm_hint(incoming)
+
+@OVERRIDE_RULES.rule("emphasis_override", weight=OVERRIDE_WEIGHTS["emphasis_override"], cost=10,
+                     rationale=OVERRIDE_MESSAGES["emphasis_override"])
+def _emphasis_override_rule(baseline, incoming, memory):
+    return is_emphasis_override(baseline, incoming) and not is_mirrored(baseline, incoming)
+
+@OVERRIDE_RULES.rule("emoji_emphasis_override", weight=OVERRIDE_WEIGHTS["emoji_emphasis_override"], cost=3,
+                     rationale=OVERRIDE_MESSAGES["emoji_emphasis_override"], incoming_only=True)
+def _emoji_override_rule(baseline, incoming, memory):
+    return is_emoji_override(baseline, incoming)
+
+@OVERRIDE_RULES.rule("stable_rationale", weight=OVERRIDE_WEIGHTS["stable_rationale"], cost=2,
+                     rationale=OVERRIDE_MESSAGES["stable_rationale"], incoming_only=True)
+def _hedge_override_rule(baseline, incoming, memory):
+    return is_hedge_override(baseline, incoming)
+
+@OVERRIDE_RULES.rule("negation_amplified", weight=OVERRIDE_WEIGHTS["negation_amplified"], cost=2,
+                     rationale=OVERRIDE_MESSAGES["negation_amplified"])
+def _negation_amplified_rule(baseline, incoming, memory):
+    return is_negation_amplified(baseline, incoming)
+
+@OVERRIDE_RULES.rule("hostile_emphasis", weight=OVERRIDE_WEIGHTS["hostile_emphasis"], cost=20,
+                     rationale=OVERRIDE_MESSAGES["hostile_emphasis"], incoming_only=True)
+def _hostile_emphasis_rule(baseline, incoming, memory):
+    return is_hostile_emphasis(baseline, incoming)
+
+def analyze_drift(
+    baseline: TextLike,
+    incoming: TextLike,
+    memory: Optional[DriftMemory] = None,
+    verbose: bool = False,
+    conversation_id: Optional[Hashable] = None,
+    store: Optional[MemoryStore] = None,
+    full: bool = False,
+) -> DriftResult:
+    # Override rules are short-circuited by OVERRIDE_RULES' planner; ``full``
+    # (implied by ``verbose``) evaluates every rule, as the explain output needs.
+    #
+    # With a conversation_id (and no explicit memory) the turn is read from and
+    # recorded into the shared MemoryStore, or ``store`` if one is passed.
+    #
+    # When INSTRUMENTS is enabled the call is timed, counted and sometimes traced.
+    #
+    # With RESULT_CACHE enabled, stateless calls (no memory, no conversation)
+    # are memoized by content; calls that read or record memory never are.
+    if RESULT_CACHE.enabled and memory is None and conversation_id is None and not verbose:
+        return _cached_drift(baseline, incoming, full)
+    if INSTRUMENTS.enabled:
+        return _observed_drift(baseline, incoming, memory, verbose, conversation_id, store, full,
+                               INSTRUMENTS.should_trace())[0]
+    return _score_drift(baseline, incoming, memory, verbose, conversation_id, store, full)
+
+def _score_drift(baseline, incoming, memory, verbose, conversation_id, store, full, fire=None) -> DriftResult:
+    if memory is None and conversation_id is not None:
+        store = store if store is not None else MEMORY_STORE
+        memory = store.get(conversation_id)
+    else:
+        store = None
+
+    # Every predicate below reads from these two bundles, so each text is
+    # normalized, emphasis-scored and sentiment-parsed at most once per call.
+    baseline = as_analyzed(baseline)
+    incoming = as_analyzed(incoming)
+    if verbose or full:
+        candidates = OVERRIDE_RULES.evaluate_all(baseline, incoming, memory, fire)
+        if verbose and candidates:
             print(f"Override candidates: {[c[0] for c in candidates]}")
             for label_debug, score_debug, rationale_debug in candidates:
                 print(f"↳ Candidate: {label_debug} | Score: {score_debug} | Rationale: {rationale_debug}")
+        # Select the override with the highest score
+        best = max(candidates, key=lambda x: x[1]) if candidates else None
+    else:
+        best = OVERRIDE_RULES.best(baseline, incoming, memory, fire)
 
-    # Select the override with the highest score
-        label, score, rationale = max(candidates, key=lambda x: x[1])
+    if best is not None:
+        label, score, rationale = best
 
     else:
         polarity_changed = polarity(baseline) != polarity(incoming)
@@ -344,15 +517,17 @@ def analyze_drift(baseline: str, incoming: str, memory: Optional[DriftMemory] =
             score = 100.0
             rationale = "Polarity reversal detected with strong antonymic contrast."
         else:
-            score = inc_score - base_score
+            score = incoming.emphasis_score - baseline.emphasis_score
             label = "stable"
             rationale = f"Polarity shift within tolerance (Δ={round(score, 2)})"
 
     drift = score >= 70
     responsiveness = compute_responsiveness(baseline, incoming, label)
 
-    if memory:
-        memory.add(incoming, score)
+    if store is not None:
+        store.add(conversation_id, incoming.text, score)
+    elif memory is not None:
+        memory.add(incoming.text, score)
 
     return DriftResult(
         drift_detected=True,
@@ -361,19 +536,221 @@ def analyze_drift(baseline: str, incoming: str, memory: Optional[DriftMemory] =
         rationale=rationale,
         drift_score=round(score, 2),
         tone_badge=compute_tone_badge(label, drift),
-        tier = str(int(score) // 10)
+        tier=compute_tier(score)
     )
-    
+
+# Bump when a scoring change makes previously cached (or persisted) results stale
+RESULT_CACHE_VERSION = 1
+_FINGERPRINT: Optional[Tuple[tuple, bytes]] = None
+
+def config_fingerprint() -> bytes:
+    """Digest of the runtime settings a drift result depends on; part of every result cache key."""
+    global _FINGERPRINT
+    backend = get_polarity_backend()
+    # A rare-tag registration bumps the matcher version too; the digest is rebuilt
+    # but comes out the same, since only the lexicons scoring reads go into it.
+    stamp = (backend.name, getattr(backend, "path", None), OVERRIDE_RULES.version,
+             LEXICON_MATCHER.version, similarity.SIMILARITY_MAX_LENGTH)
+    cached = _FINGERPRINT
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    content = repr((
+        RESULT_CACHE_VERSION,
+        stamp[:2],
+        stamp[4],
+        [(r.name, r.weight, r.cost, r.label, r.rationale, r.check.__module__, r.check.__qualname__)
+         for r in OVERRIDE_RULES.rules],
+        sorted((name, sorted(terms)) for name, terms in LEXICON_MATCHER.lexicons().items()
+               if not _is_rare_tag_lexicon(name)),
+        sorted(OVERRIDE_WEIGHTS.items()),
+    ))
+    digest = hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+    _FINGERPRINT = (stamp, digest)
+    return digest
+
+def _cached_drift(baseline, incoming, full) -> DriftResult:
+    start = time.perf_counter_ns()
+    key = result_key(getattr(baseline, "text", baseline), getattr(incoming, "text", incoming), config_fingerprint())
+    cached = RESULT_CACHE.get(key)
+    if cached is not None:
+        result = DriftResult(*cached)
+        if INSTRUMENTS.enabled:
+            INSTRUMENTS.record([], result.label, result.tier, time.perf_counter_ns() - start, None)
+        return result
+    if INSTRUMENTS.enabled:
+        result = _observed_drift(baseline, incoming, None, False, None, None, full, INSTRUMENTS.should_trace())[0]
+    else:
+        result = _score_drift(baseline, incoming, None, False, None, None, full)
+    RESULT_CACHE.put(key, (
+        result.drift_detected, result.label, result.rationale, result.drift_score, result.phrase,
+        result.polarity, result.tone_badge, result.tier, result.drift,
+    ))
+    return result
+
+def _observed_drift(baseline, incoming, memory, verbose, conversation_id, store, full, tracing):
+    """_score_drift with per-rule timings recorded; a traced call evaluates every rule."""
+    timings: list = []
+    fire = INSTRUMENTS.timed_fire(OVERRIDE_RULES._fire, timings)
+    start = time.perf_counter_ns()
+    result = _score_drift(baseline, incoming, memory, verbose, conversation_id, store, full or tracing, fire)
+    elapsed = time.perf_counter_ns() - start
+
+    trace = None
+    if tracing:
+        rules = []
+        winner, winner_weight = None, None
+        for name, ns, candidate in timings:
+            if candidate is None:
+                rules.append(RuleTrace(name, False, round(ns / 1000, 2)))
+                continue
+            label, weight, rationale = candidate
+            rules.append(RuleTrace(name, True, round(ns / 1000, 2), label, weight, rationale))
+            if winner_weight is None or weight > winner_weight:
+                winner, winner_weight = name, weight
+        trace = DriftTrace(
+            baseline=getattr(baseline, "text", baseline),
+            incoming=getattr(incoming, "text", incoming),
+            rules=rules,
+            winner=winner,
+            label=result.label,
+            drift_score=result.drift_score,
+            tier=result.tier,
+            elapsed_us=round(elapsed / 1000, 2),
+            conversation_id=conversation_id,
+        )
+    if INSTRUMENTS.enabled:
+        INSTRUMENTS.record(timings, result.label, result.tier, elapsed, trace)
+    return result, trace
+
+def trace_drift(
+    baseline: TextLike,
+    incoming: TextLike,
+    memory: Optional[DriftMemory] = None,
+    conversation_id: Optional[Hashable] = None,
+    store: Optional[MemoryStore] = None,
+) -> Tuple[DriftResult, DriftTrace]:
+    """analyze_drift plus a DriftTrace of every rule's outcome — a structured ``verbose=True``."""
+    return _observed_drift(baseline, incoming, memory, False, conversation_id, store, True, True)
+
+# ——————————————
+# Batch Analyzer
+# ——————————————
+def analyze_texts(texts: Iterable[str]) -> Dict[str, AnalyzedText]:
+    """Deduplicate texts and compute their lexical and sentiment features in one pass."""
+    analyzed: Dict[str, AnalyzedText] = {}
+    for text in texts:
+        if text not in analyzed:
+            analyzed[text] = AnalyzedText(text)
+    for item in analyzed.values():
+        item.emphasis_score
+        item.polarity_score
+    return analyzed
+
+def analyze_drift_batch(
+    pairs: Iterable[Tuple[str, str]],
+    memory: Optional[DriftMemory] = None,
+    conversation_id: Optional[Hashable] = None,
+    store: Optional[MemoryStore] = None,
+) -> List[DriftResult]:
+    """Score many (baseline, incoming) pairs; results match a loop over analyze_drift.
+
+    Identical texts share one AnalyzedText, so each distinct string is
+    normalized, emphasis-scored and sentiment-parsed once per batch. When
+    ``memory`` or ``conversation_id`` is given, pairs are applied to it in
+    order, as the loop would.
+    """
+    pairs = list(pairs)
+    analyzed = analyze_texts(text for pair in pairs for text in pair)
+    return [
+        analyze_drift(analyzed[baseline], analyzed[incoming], memory=memory,
+                      conversation_id=conversation_id, store=store)
+        for baseline, incoming in pairs
+    ]
+
+# ——————————————
+# One-vs-Many Analyzer
+# ——————————————
+@dataclass
+class DriftMatrix:
+    """``results[i][j]`` scores ``incomings[i]`` against ``baselines[j]``."""
+    incomings: List[str]
+    baselines: List[str]
+    results: List[List[DriftResult]]
+
+    @property
+    def labels(self) -> List[List[str]]:
+        return [[result.label for result in row] for row in self.results]
+
+    @property
+    def scores(self) -> List[List[float]]:
+        return [[result.drift_score for result in row] for row in self.results]
+
+    def row(self, index: int = 0) -> List[DriftResult]:
+        return self.results[index]
+
+    def column(self, index: int = 0) -> List[DriftResult]:
+        return [row[index] for row in self.results]
+
+    def to_dict(self) -> dict:
+        return {
+            "incomings": self.incomings,
+            "baselines": self.baselines,
+            "labels": self.labels,
+            "scores": self.scores,
+        }
+
+def analyze_drift_matrix(incomings: Iterable[str], baselines: Iterable[str]) -> DriftMatrix:
+    """Score every incoming against every baseline; each cell matches analyze_drift(baseline, incoming).
+
+    Each distinct text gets one AnalyzedText, so its features are computed
+    at most once, on first use, and incoming-only override rules run once
+    per incoming. Only the pairwise checks (reversals, mirroring, mocked
+    echo, sign flip) run per cell. Cells are independent: no DriftMemory is
+    read or updated.
+    """
+    incomings, baselines = list(incomings), list(baselines)
+    analyzed = {text: AnalyzedText(text) for text in incomings + baselines}
+    results = [
+        [analyze_drift(analyzed[baseline], analyzed[incoming]) for baseline in baselines]
+        for incoming in incomings
+    ]
+    return DriftMatrix(incomings, baselines, results)
+
+def analyze_against_baselines(incoming: str, baselines: Iterable[str]) -> DriftMatrix:
+    """One incoming against many baselines (e.g. prior turns and persona baselines): a 1×N matrix."""
+    return analyze_drift_matrix([incoming], baselines)
+
+def analyze_incomings(incomings: Iterable[str], baseline: str) -> DriftMatrix:
+    """Many incomings against one baseline: an N×1 matrix."""
+    return analyze_drift_matrix(incomings, [baseline])
+
 # ——————————————
 # Drift Journal Logger
 # ——————————————
-def log_drift_result(baseline: str, incoming: str, result: DriftResult, heatmap: dict, path: Optional[str] = None):
-    if not path:
-        return
+def log_drift_result(
+    baseline: TextLike,
+    incoming: TextLike,
+    result: DriftResult,
+    heatmap: dict,
+    path: Optional[str] = None,
+    journal: Optional[DriftJournal] = None,
+):
+    """Append one result to a buffered drift journal (shared per path unless one is passed)."""
+    if journal is None:
+        if not path:
+            return
+        journal = get_journal(path)
+    incoming = as_analyzed(incoming)
     entry = {
         "timestamp": datetime.now().isoformat(),
-        "baseline": baseline,
-        "incoming": incoming,
+        "baseline": as_analyzed(baseline).text,
+        "incoming": incoming.text,
+        "label": result.label,
+        "drift": result.drift,
+        "drift_score": result.drift_score,
+        "tier": result.tier,
+        "emphasis_score": incoming.emphasis_score,
+        "rationale": result.rationale,
         "result": {
             "label": result.label,
             "rationale": result.rationale,
@@ -381,15 +758,21 @@ def log_drift_result(baseline: str, incoming: str, result: DriftResult, heatmap:
         },
         "heatmap": heatmap
     }
+    journal.write(entry)
 # ——————————————————
 # Compatibility: analyze_phrase + analyze_chunks for Streamlit
 # ——————————————————
-def analyze_phrase(phrase: str, simulated_polarity: Optional[float] = None) -> dict:
+def analyze_phrase(
+    phrase: str,
+    simulated_polarity: Optional[float] = None,
+    conversation_id: Optional[Hashable] = None,
+    store: Optional[MemoryStore] = None,
+) -> dict:
     polarity_score = simulated_polarity if simulated_polarity is not None else compute_polarity_score(phrase)
     dummy_baseline = "I’m doing fine."  # Placeholder for real conversational context
-    memory = DriftMemory()  # Dummy memory for now
 
-    result = analyze_drift(dummy_baseline, phrase, memory=memory)
+    # Memory-aware when a conversation_id is given; otherwise a one-off comparison
+    result = analyze_drift(dummy_baseline, phrase, conversation_id=conversation_id, store=store)
 
     # Response polarity direction
     delta = polarity_score - get_polarity_score(dummy_baseline)
@@ -416,25 +799,199 @@ def analyze_phrase(phrase: str, simulated_polarity: Optional[float] = None) -> d
     }
 
 def analyze_chunks(text: str) -> list:
-    chunks = re.split(r"(?<=[.!?])\s+|,|\band\b|\bor\b", text)
-    results = []
-    dummy_baseline = "I’m doing fine."
-
-    for chunk in chunks:
-        chunk = chunk.strip()
-        if not chunk:
-            continue
-
-        polarity_score = compute_polarity_score(chunk)
-        result = analyze_drift(dummy_baseline, chunk)
-        results.append({
-            "chunk": chunk,
-            "polarity": round(polarity_score, 3),
+    # Every chunk against the same placeholder baseline, no memory
+    return [
+        {
+            "chunk": chunk.text,
+            "polarity": round(chunk.polarity_score, 3),
             "closest_tone": result.label,
             "drift_score": result.drift_score,
             "status": "Flagged" if result.drift else "Stable"
-        })
+        }
+        for _, _, chunk, result in _score_chunks(iter_chunks(text), window=0, memory=None)
+    ]
 
-    return results
-    with open(path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(entry) + "\n")
\ No newline at end of file
+# ——————————————
+# Streaming Document Analyzer
+# ——————————————
+DEFAULT_READ_SIZE = 64 * 1024
+MAX_CHUNK_CHARS = 20_000   # a chunk with no separator for this long is cut at the last space
+DOCUMENT_BASELINE = "I’m doing fine."
+
+def _text_pieces(source: Union[str, Iterable[str]], read_size: int = DEFAULT_READ_SIZE) -> Iterator[str]:
+    if isinstance(source, str):
+        yield source
+    elif hasattr(source, "read"):
+        yield from iter(lambda: source.read(read_size), "")
+    else:
+        yield from source
+
+def iter_chunks(
+    source: Union[str, Iterable[str]],
+    max_chunk_chars: int = MAX_CHUNK_CHARS,
+) -> Iterator[Tuple[int, str]]:
+    r"""Yield ``(offset, chunk)`` for each stripped, non-empty chunk of ``source``.
+
+    ``source`` is a string, a text file object (read in blocks) or an
+    iterable of consecutive pieces of one text (such as a file's lines, with
+    their newlines). The chunks match ``patterns.CHUNK_SPLIT.split`` on the
+    whole text. A separator is only accepted once text follows it, because
+    ``\s+`` and ``\band\b`` can still change at the end of the buffer. So
+    only the unsplit tail is held in memory. The exception is a run longer
+    than ``max_chunk_chars`` with no separator: it is cut at its last space
+    (or hard at the cap) to keep that bound. ``offset`` is the chunk's
+    character position in the full text.
+    """
+    split = patterns.CHUNK_SPLIT
+    buffer = ""
+    base = 0   # offset of buffer[0] in the full text
+
+    def emit(piece: str, start: int):
+        stripped = piece.strip()
+        if stripped:
+            yield start + len(piece) - len(piece.lstrip()), stripped
+
+    for piece in _text_pieces(source):
+        buffer += piece
+        pos = 0
+        for match in split.finditer(buffer):
+            if match.end() >= len(buffer):
+                break
+            yield from emit(buffer[pos:match.start()], base + pos)
+            pos = match.end()
+        while len(buffer) - pos > max_chunk_chars:
+            cut = buffer.rfind(" ", pos, pos + max_chunk_chars)
+            cut = cut if cut > pos else pos + max_chunk_chars
+            yield from emit(buffer[pos:cut], base + pos)
+            pos = cut
+        buffer = buffer[pos:]
+        base += pos
+    # End of text: separators at the very end count now
+    pos = 0
+    for match in split.finditer(buffer):
+        yield from emit(buffer[pos:match.start()], base + pos)
+        pos = match.end()
+    yield from emit(buffer[pos:], base + pos)
+
+def _score_chunks(
+    chunks: Iterable[Tuple[int, str]],
+    window: int,
+    memory: Optional[DriftMemory],
+    baseline: TextLike = DOCUMENT_BASELINE,
+) -> Iterator[Tuple[int, int, "AnalyzedText", DriftResult]]:
+    # Each chunk is analyzed once: as incoming, then reused as the next baseline
+    first = as_analyzed(baseline)
+    recent: deque = deque(maxlen=max(window, 1))
+    for index, (offset, text) in enumerate(chunks):
+        chunk = AnalyzedText(text)
+        if window <= 0 or not recent:
+            base = first
+        elif window == 1:
+            base = recent[-1]
+        else:
+            base = AnalyzedText(" ".join(c.text for c in recent))
+        yield index, offset, chunk, analyze_drift(base, chunk, memory=memory)
+        recent.append(chunk)
+
+def analyze_document(
+    source: Union[str, Iterable[str]],
+    window: int = 1,
+    memory: Optional[DriftMemory] = None,
+    carry_memory: bool = True,
+    baseline: TextLike = DOCUMENT_BASELINE,
+    max_chunk_chars: int = MAX_CHUNK_CHARS,
+) -> Iterator[dict]:
+    """Stream drift results for a long text, one chunk at a time.
+
+    Chunks are split as in ``analyze_chunks``, but incrementally (see
+    ``iter_chunks``), and each is scored against the chunk before it (or the
+    previous ``window`` chunks joined). ``window=0`` scores every chunk
+    against ``baseline``, as ``analyze_chunks`` does. Turns are recorded in
+    ``memory``, a fresh DriftMemory unless one is passed or ``carry_memory``
+    is False, so escalation carries across the document. Results are
+    yielded as soon as each chunk is complete.
+    """
+    if memory is None and carry_memory:
+        memory = DriftMemory()
+    for index, offset, chunk, result in _score_chunks(
+        iter_chunks(source, max_chunk_chars), window, memory, baseline
+    ):
+        yield {
+            "index": index,
+            "offset": offset,
+            "chunk": chunk.text,
+            "polarity": round(chunk.polarity_score, 3),
+            "closest_tone": result.label,
+            "drift_score": result.drift_score,
+            "tier": result.tier,
+            "status": "Flagged" if result.drift else "Stable",
+        }
+
+def warm_up():
+    """Load the polarity backend (TextBlob/nltk by default), the emoji table and the lexicon regex ahead of the first request.
+
+    Importing the engine defers all of these; long-running services call
+    this at startup so the first scored message does not pay for them.
+    """
+    patterns.emoji_table()
+    analyze_drift("I'm doing fine.", "Warm-up message!")
+
+# ——————————————
+# Engine Instance
+# ——————————————
+class DriftEngine:
+    """Scoring entry points bound to one DriftEngineConfig and MemoryStore.
+
+    The module-level functions use the built-in defaults and the shared
+    MEMORY_STORE; an instance lets each caller carry its own settings. The
+    config's ``rare_tags`` drive ``expand_symbolic_tags``; drift scoring
+    itself has no tunables beyond the store.
+    """
+
+    def __init__(self, config: Optional[DriftEngineConfig] = None, store: Optional[MemoryStore] = None):
+        self.config = config if config is not None else DEFAULT_ENGINE_CONFIG
+        self.store = store if store is not None else MEMORY_STORE
+        _rare_tag_lexicon(self.config.rare_tags)
+
+    @classmethod
+    def from_config_file(cls, path: str, store: Optional[MemoryStore] = None) -> "DriftEngine":
+        return cls(DriftEngineConfig.from_file(path), store)
+
+    def analyze_drift(
+        self,
+        baseline: TextLike,
+        incoming: TextLike,
+        memory: Optional[DriftMemory] = None,
+        verbose: bool = False,
+        conversation_id: Optional[Hashable] = None,
+    ) -> DriftResult:
+        return analyze_drift(baseline, incoming, memory=memory, verbose=verbose,
+                             conversation_id=conversation_id, store=self.store)
+
+    def analyze_drift_batch(
+        self,
+        pairs: Iterable[Tuple[str, str]],
+        memory: Optional[DriftMemory] = None,
+        conversation_id: Optional[Hashable] = None,
+    ) -> List[DriftResult]:
+        return analyze_drift_batch(pairs, memory=memory, conversation_id=conversation_id, store=self.store)
+
+    def analyze_against_baselines(self, incoming: str, baselines: Iterable[str]) -> DriftMatrix:
+        return analyze_against_baselines(incoming, baselines)
+
+    def analyze_incomings(self, incomings: Iterable[str], baseline: str) -> DriftMatrix:
+        return analyze_incomings(incomings, baseline)
+
+    def analyze_phrase(self, phrase: str, simulated_polarity: Optional[float] = None,
+                       conversation_id: Optional[Hashable] = None) -> dict:
+        return analyze_phrase(phrase, simulated_polarity, conversation_id=conversation_id, store=self.store)
+
+    def analyze_chunks(self, text: str) -> list:
+        return analyze_chunks(text)
+
+    def analyze_document(self, source: Union[str, Iterable[str]], window: int = 1,
+                         memory: Optional[DriftMemory] = None) -> Iterator[dict]:
+        return analyze_document(source, window=window, memory=memory)
+
+    def expand_symbolic_tags(self, text: TextLike) -> Optional[str]:
+        return expand_symbolic_tags(text, self.config)
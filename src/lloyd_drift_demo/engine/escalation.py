@@ -0,0 +1,393 @@
+"""Streaming escalation monitor over per-conversation DriftResults.
+
+``EscalationMonitor.observe(conversation_id, result)`` folds one scored turn
+into two windows kept for its conversation and returns any alerts it
+triggers, so an escalation is reported on the message that causes it:
+
+- a **sliding** window over the last ``window`` turns. Scores live in a
+  score-only DriftMemory, so the mean and the least-squares slope are O(1)
+  per turn. A parallel byte ring remembers each turn's drift flag and
+  watched labels, so counts are updated by adding the new turn and
+  removing the one that fell out;
+- a **tumbling** window over consecutive blocks of ``tumble_events`` turns.
+  It has the same aggregates, kept as running sums, and is reset when a
+  block is complete.
+
+Windows count turns, not wall-clock time. The idle TTL, however, is
+measured on a clock: the monitor's own monotonic clock by default, or the
+event times passed as ``observe(..., timestamp=...)``. A replay alerts
+exactly as the live stream did when it passes the same event timestamps,
+or when the monitor runs with ``idle_ttl=None``. Otherwise a fast replay
+keeps conversations alive that the live stream expired, and a slow one
+does the reverse.
+
+Each window reports its drift rate, mean drift score, slope and the count of
+each watched label (``hostile_emphasis``, ``mocked_echo`` and ``reversal`` by
+default). ``EscalationThresholds`` sets the level at which each one alerts.
+Alerts are edge-triggered. A metric alerts when it reaches its threshold and
+re-arms once it drops back below; a tumbling window re-arms when it resets.
+
+Conversation state has a fixed size, so the monitor is bounded the way
+MemoryStore is: lock-striped LRU shards with an idle TTL, a conversation
+cap and an approximate byte budget. Conversations evicted under pressure
+start over with empty windows.
+"""
+
+import sys
+import time
+import threading
+from collections import OrderedDict, deque
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from lloyd_drift_demo.drift_types import DriftMemory, DriftResult
+
+# === Defaults ===
+DEFAULT_WINDOW = 10
+DEFAULT_TUMBLE_EVENTS = 20
+DEFAULT_SHARDS = 64
+DEFAULT_MAX_CONVERSATIONS = 500_000
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_IDLE_TTL = 6 * 60 * 60  # seconds; None disables idle expiry
+DEFAULT_RECENT_ALERTS = 1000
+WATCHED_LABELS = ("hostile_emphasis", "mocked_echo", "reversal")
+
+SLIDING = "sliding"
+TUMBLING = "tumbling"
+_DRIFT_BIT = 1                  # bit 0 of a turn's flags; watched label i is bit i + 1
+_ENTRY_OVERHEAD = 200           # OrderedDict node and key reference per conversation
+
+
+@dataclass
+class EscalationThresholds:
+    """Levels at which a window alerts; ``None`` turns a check off.
+
+    Rate, mean and slope checks wait until a window holds ``min_events``
+    turns, so a single hostile opener does not read as a 100% drift rate.
+    Label counts apply from the first turn.
+    """
+
+    drift_rate: Optional[float] = 0.6
+    mean_score: Optional[float] = 60.0
+    slope: Optional[float] = 10.0           # drift score points per turn, least squares
+    label_counts: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(WATCHED_LABELS, 2))
+    min_events: int = 3
+
+
+@dataclass
+class EscalationAlert:
+    conversation_id: Hashable
+    window: str         # "sliding" or "tumbling"
+    metric: str         # drift_rate, mean_score, slope or a label
+    value: float
+    threshold: float
+    events: int         # turns in the window when it fired
+    turn: int           # the firing turn: the caller's turn index, else 0-based among observed turns
+    timestamp: float
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class _Check:
+    __slots__ = ("bit", "window", "metric", "threshold", "label_index")
+
+    def __init__(self, bit: int, window: str, metric: str, threshold: float, label_index: int = -1):
+        self.bit = bit
+        self.window = window
+        self.metric = metric
+        self.threshold = threshold
+        self.label_index = label_index    # index into the window's counts; -1 for rate/mean/slope
+
+
+class _Windows:
+    """One conversation's sliding and tumbling aggregates."""
+
+    __slots__ = ("scores", "flags", "seen", "counts", "t_n", "t_sum_y", "t_sum_iy", "t_counts",
+                 "armed", "last_access")
+
+    def __init__(self, window: int, n_counts: int, now: float):
+        self.scores = DriftMemory(capacity=window, keep_text=False)
+        self.flags = bytearray(window)
+        self.seen = 0                       # turns observed in this conversation
+        self.counts = [0] * n_counts        # sliding: drifts, then each watched label
+        self.t_n = 0
+        self.t_sum_y = 0.0
+        self.t_sum_iy = 0.0                 # Σ i·score, i counted from the block start
+        self.t_counts = [0] * n_counts
+        self.armed = 0                      # bits of the checks currently at or above threshold
+        self.last_access = now
+
+
+def _slope(n: int, sum_y: float, sum_iy: float) -> float:
+    """Least-squares slope of scores at i = 0..n-1, from their running sums."""
+    if n < 2:
+        return 0.0
+    return (sum_iy - (n - 1) / 2 * sum_y) / (n * (n * n - 1) / 12)
+
+
+class _Shard:
+    __slots__ = ("lock", "entries", "events", "alerts", "evictions", "expirations")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries: "OrderedDict[Hashable, _Windows]" = OrderedDict()
+        self.events = self.alerts = self.evictions = self.expirations = 0
+
+
+class EscalationMonitor:
+    """Per-conversation windowed drift aggregates with threshold alerts.
+
+    ``observe`` is O(1) in the window sizes and the number of conversations.
+    Only the conversation's shard is locked. Alerts are returned, passed to
+    each ``on_alert`` callback (outside the lock) and kept in ``recent``.
+    """
+
+    def __init__(
+        self,
+        thresholds: Optional[EscalationThresholds] = None,
+        window: int = DEFAULT_WINDOW,
+        tumble_events: int = DEFAULT_TUMBLE_EVENTS,
+        labels: Tuple[str, ...] = WATCHED_LABELS,
+        shards: int = DEFAULT_SHARDS,
+        max_conversations: int = DEFAULT_MAX_CONVERSATIONS,
+        max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+        idle_ttl: Optional[float] = DEFAULT_IDLE_TTL,
+        on_alert: Optional[Callable[[EscalationAlert], None]] = None,
+        recent_alerts: int = DEFAULT_RECENT_ALERTS,
+    ):
+        if window < 1 or tumble_events < 1:
+            raise ValueError("window and tumble_events must be at least 1")
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        if len(labels) > 7:
+            raise ValueError("at most 7 labels can be watched (one flag byte per turn)")
+        self.thresholds = thresholds or EscalationThresholds()
+        self.window = window
+        self.tumble_events = tumble_events
+        self.labels = tuple(labels)
+        self._label_bits = {label: 1 << (i + 1) for i, label in enumerate(self.labels)}
+        self.idle_ttl = idle_ttl
+        self.callbacks: List[Callable[[EscalationAlert], None]] = [on_alert] if on_alert else []
+        self.recent: "deque[EscalationAlert]" = deque(maxlen=recent_alerts)
+        self._checks, self._tumbling_bits = self._build_checks()
+        self._shards = [_Shard() for _ in range(shards)]
+        self.state_bytes = self._estimate_state_bytes()
+        self.max_conversations = max_conversations
+        self.max_bytes = max_bytes
+        self._split_limits()
+
+    def _build_checks(self) -> Tuple[List[_Check], int]:
+        t = self.thresholds
+        metrics = [(name, value) for name, value in
+                   (("drift_rate", t.drift_rate), ("mean_score", t.mean_score), ("slope", t.slope))
+                   if value is not None]
+        checks: List[_Check] = []
+        for window in (SLIDING, TUMBLING):
+            for name, value in metrics:
+                checks.append(_Check(len(checks), window, name, value))
+            for label, value in t.label_counts.items():
+                if value is not None and label in self.labels:
+                    checks.append(_Check(len(checks), window, label, value, self.labels.index(label) + 1))
+        tumbling_bits = sum(1 << check.bit for check in checks if check.window == TUMBLING)
+        return checks, tumbling_bits
+
+    def _estimate_state_bytes(self) -> int:
+        """Approximate bytes held by one conversation with a full window."""
+        state = _Windows(self.window, len(self.labels) + 1, 0.0)
+        return (_ENTRY_OVERHEAD + sys.getsizeof(state) + sys.getsizeof(state.scores)
+                + sys.getsizeof(state.scores._scores) + 24 * self.window
+                + sys.getsizeof(state.flags) + 2 * sys.getsizeof(state.counts))
+
+    def _split_limits(self):
+        n = len(self._shards)
+        limit = self.max_conversations
+        if self.max_bytes is not None:
+            limit = min(limit, self.max_bytes // self.state_bytes)
+        self._shard_max_conversations = max(1, limit // n)
+
+    def resize(self, max_conversations: Optional[int] = None, max_bytes: Optional[int] = None):
+        """Change the limits; existing shards are trimmed on their next write."""
+        if max_conversations is not None:
+            self.max_conversations = max_conversations
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+        self._split_limits()
+
+    def _shard(self, conversation_id: Hashable) -> _Shard:
+        return self._shards[hash(conversation_id) % len(self._shards)]
+
+    # === Events ===
+    def observe(self, conversation_id: Hashable, result: DriftResult,
+                turn: Optional[int] = None, timestamp: Optional[float] = None) -> List[EscalationAlert]:
+        """Fold one scored turn into its conversation's windows; returns the alerts it fired.
+
+        ``timestamp`` is the event time in seconds. When given, idle expiry
+        runs on event time and alerts carry it. Pass it for every event or
+        for none: the two clocks do not mix.
+        """
+        flags = _DRIFT_BIT if result.drift else 0
+        flags |= self._label_bits.get(result.label, 0)
+        score = result.drift_score
+        shard = self._shard(conversation_id)
+        now = time.monotonic() if timestamp is None else timestamp
+        with shard.lock:
+            state = self._live_state(shard, conversation_id, now)
+            self._add(state, score, flags)
+            alerts = self._evaluate(conversation_id, state, state.seen - 1 if turn is None else turn,
+                                    time.time() if timestamp is None else timestamp)
+            shard.events += 1
+            shard.alerts += len(alerts)
+            self._enforce(shard, now)
+        if alerts:
+            self.recent.extend(alerts)
+            for callback in self.callbacks:
+                for alert in alerts:
+                    callback(alert)
+        return alerts
+
+    def _add(self, state: _Windows, score: float, flags: int):
+        counts, t_counts = state.counts, state.t_counts
+        if state.t_n == self.tumble_events:
+            state.t_n = 0
+            state.t_sum_y = state.t_sum_iy = 0.0
+            for i in range(len(t_counts)):
+                t_counts[i] = 0
+            state.armed &= ~self._tumbling_bits
+
+        slot = state.seen % self.window
+        if state.seen >= self.window:
+            old = state.flags[slot]
+            if old:
+                for i in range(len(counts)):
+                    if old >> i & 1:
+                        counts[i] -= 1
+        state.flags[slot] = flags
+        state.scores.add(None, score)
+        state.t_sum_iy += state.t_n * score
+        state.t_sum_y += score
+        state.t_n += 1
+        state.seen += 1
+        if flags:
+            for i in range(len(counts)):
+                if flags >> i & 1:
+                    counts[i] += 1
+                    t_counts[i] += 1
+
+    def _metric(self, state: _Windows, check: _Check) -> Tuple[Optional[float], int]:
+        """``(value, events)`` of a check's metric, or ``(None, events)`` while the window is too short."""
+        if check.window == SLIDING:
+            n = len(state.scores)
+            counts = state.counts
+        else:
+            n = state.t_n
+            counts = state.t_counts
+        if check.label_index >= 0:
+            return counts[check.label_index], n
+        if n < self.thresholds.min_events:
+            return None, n
+        if check.metric == "drift_rate":
+            return counts[0] / n, n
+        if check.metric == "mean_score":
+            return (state.scores.mean if check.window == SLIDING else state.t_sum_y / n), n
+        if check.window == SLIDING:
+            return state.scores.least_squares_slope, n
+        return _slope(n, state.t_sum_y, state.t_sum_iy), n
+
+    def _evaluate(self, conversation_id: Hashable, state: _Windows, turn: int,
+                  timestamp: float) -> List[EscalationAlert]:
+        alerts: List[EscalationAlert] = []
+        for check in self._checks:
+            value, events = self._metric(state, check)
+            bit = 1 << check.bit
+            if value is None or value < check.threshold:
+                state.armed &= ~bit
+            elif not state.armed & bit:
+                state.armed |= bit
+                alerts.append(EscalationAlert(
+                    conversation_id=conversation_id, window=check.window, metric=check.metric,
+                    value=value, threshold=check.threshold, events=events,
+                    turn=turn, timestamp=timestamp,
+                ))
+        return alerts
+
+    # === Lookup ===
+    def windows(self, conversation_id: Hashable) -> Optional[Dict[str, dict]]:
+        """Current aggregates of a live conversation, or ``None``."""
+        shard = self._shard(conversation_id)
+        with shard.lock:
+            state = shard.entries.get(conversation_id)
+            if state is None:
+                return None
+            summary = {}
+            for window, n, counts in ((SLIDING, len(state.scores), state.counts),
+                                      (TUMBLING, state.t_n, state.t_counts)):
+                summary[window] = {
+                    "events": n,
+                    "drift_rate": counts[0] / n if n else 0.0,
+                    "mean_score": (state.scores.mean if window == SLIDING
+                                   else state.t_sum_y / n if n else 0.0),
+                    "slope": (state.scores.least_squares_slope if window == SLIDING
+                              else _slope(n, state.t_sum_y, state.t_sum_iy)),
+                    "labels": dict(zip(self.labels, counts[1:])),
+                }
+            return summary
+
+    def __len__(self) -> int:
+        return sum(len(shard.entries) for shard in self._shards)
+
+    def discard(self, conversation_id: Hashable) -> bool:
+        shard = self._shard(conversation_id)
+        with shard.lock:
+            return shard.entries.pop(conversation_id, None) is not None
+
+    def clear(self):
+        for shard in self._shards:
+            with shard.lock:
+                shard.entries.clear()
+                shard.events = shard.alerts = shard.evictions = shard.expirations = 0
+        self.recent.clear()
+
+    # === Shard internals (caller holds shard.lock) ===
+    def _live_state(self, shard: _Shard, conversation_id: Hashable, now: float) -> _Windows:
+        state = shard.entries.get(conversation_id)
+        if state is not None and self.idle_ttl is not None and now - state.last_access > self.idle_ttl:
+            del shard.entries[conversation_id]
+            shard.expirations += 1
+            state = None
+        if state is None:
+            state = shard.entries[conversation_id] = _Windows(self.window, len(self.labels) + 1, now)
+        else:
+            state.last_access = now
+            shard.entries.move_to_end(conversation_id)
+        return state
+
+    def _enforce(self, shard: _Shard, now: float):
+        entries = shard.entries
+        if self.idle_ttl is not None:
+            # Entries are in access order, so expired ones are all at the front.
+            while entries and now - next(iter(entries.values())).last_access > self.idle_ttl:
+                entries.popitem(last=False)
+                shard.expirations += 1
+        while len(entries) > self._shard_max_conversations:
+            entries.popitem(last=False)
+            shard.evictions += 1
+
+    # === Introspection ===
+    def stats(self) -> Dict[str, float]:
+        totals = dict.fromkeys(("conversations", "events", "alerts", "evictions", "expirations"), 0)
+        for shard in self._shards:
+            with shard.lock:
+                totals["conversations"] += len(shard.entries)
+                totals["events"] += shard.events
+                totals["alerts"] += shard.alerts
+                totals["evictions"] += shard.evictions
+                totals["expirations"] += shard.expirations
+        totals.update(
+            approx_bytes=totals["conversations"] * self.state_bytes,
+            max_conversations=self.max_conversations,
+            max_bytes=self.max_bytes,
+            window=self.window,
+            tumble_events=self.tumble_events,
+        )
+        return totals
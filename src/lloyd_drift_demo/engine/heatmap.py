@@ -0,0 +1,178 @@
+"""Token-level drift heatmap, built lazily from a message's cached signals.
+
+``AnalyzedText.heatmap`` returns a ``TokenHeatmap``. Nothing is computed until
+one of its columns is read, so scoring never pays for it. On first access,
+one pass over the whitespace tokens fills typed arrays:
+
+- ``starts`` / ``ends``: character offsets of each token in the message;
+- ``emphasis``: the emphasis formula (caps, ``!``, ``?``, emotive emoji)
+  applied to the token's span. The column sums to the message's
+  ``emphasis_score``;
+- ``polarity``: the pattern-lexicon polarity of the word, flipped and halved
+  after a negation as TextBlob does. No sentence is re-parsed;
+- ``lexicons``: a bitmask over ``lexicon_names`` for the keyword lexicons
+  that hit. These are read from the message's existing ``lexicon_hits``,
+  so the text is not scanned again.
+
+``score = emphasis + |polarity| + LEXICON_WEIGHT × lexicons hit``. Dicts
+are only built by ``to_dict()``.
+"""
+
+import re
+from array import array
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+
+from lloyd_drift_demo.engine import patterns
+from lloyd_drift_demo.engine.polarity_backends import NEGATIONS, word_lexicon
+
+# === Weights ===
+CAPS_WEIGHT = 0.3
+MARK_WEIGHT = 0.5       # each "!" or "?"
+EMOJI_WEIGHT = 0.5      # each emotive emoji (patterns.EMPHASIS_EMOJI)
+LEXICON_WEIGHT = 0.5    # each keyword lexicon the token belongs to
+MAX_LEXICONS = 64       # bits in a lexicons mask; further lexicons hit by one message are not marked
+
+TOKEN = re.compile(r"\S+")
+_WORD_EDGES = ".,;:!?()[]{}\"'`“”‘’*_-…"
+
+
+class TokenHeatmap:
+    """Array-backed per-token scores for one AnalyzedText; computed on first access."""
+
+    __slots__ = ("_source", "lexicon_names", "_starts", "_ends", "_emphasis", "_polarity", "_lexicons")
+
+    def __init__(self, source):
+        self._source = source    # the AnalyzedText whose cached signals are reused
+        self.lexicon_names: List[str] = []
+        self._starts: Optional[array] = None
+
+    # === Columns ===
+    @property
+    def starts(self) -> array:
+        return self._built()._starts
+
+    @property
+    def ends(self) -> array:
+        return self._built()._ends
+
+    @property
+    def emphasis(self) -> array:
+        return self._built()._emphasis
+
+    @property
+    def polarity(self) -> array:
+        return self._built()._polarity
+
+    @property
+    def lexicons(self) -> array:
+        return self._built()._lexicons
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def score(self, index: int) -> float:
+        self._built()
+        return (self._emphasis[index] + abs(self._polarity[index])
+                + LEXICON_WEIGHT * bin(self._lexicons[index]).count("1"))
+
+    def word(self, index: int) -> str:
+        self._built()
+        return self._source.text[self._starts[index]: self._ends[index]]
+
+    def lexicons_of(self, index: int) -> List[str]:
+        mask = self.lexicons[index]
+        return [name for bit, name in enumerate(self.lexicon_names) if mask >> bit & 1]
+
+    def hottest(self, n: int = 5) -> List[Tuple[int, int, float]]:
+        """``(start, end, score)`` of the ``n`` highest-scoring tokens, hottest first."""
+        ranked = sorted(range(len(self)), key=self.score, reverse=True)[:n]
+        return [(self._starts[i], self._ends[i], self.score(i)) for i in ranked]
+
+    def to_dict(self) -> Dict[str, List[dict]]:
+        return {"tokens": [
+            {
+                "word": self.word(i),
+                "start": self._starts[i],
+                "end": self._ends[i],
+                "score": round(self.score(i), 2),
+                "emphasis": round(self._emphasis[i], 2),
+                "polarity": round(self._polarity[i], 3),
+                "lexicons": self.lexicons_of(i),
+            }
+            for i in range(len(self))
+        ]}
+
+    # === Build ===
+    def _built(self) -> "TokenHeatmap":
+        if self._starts is None:
+            self._build()
+        return self
+
+    def _build(self):
+        source = self._source
+        text = source.text
+        matches = list(TOKEN.finditer(text))
+        tokens = [m.group() for m in matches]
+        words = [token.lower().strip(_WORD_EDGES) for token in tokens]
+        is_upper = str.isupper
+        emphasis = array("d", [
+            (0 if token.islower() else CAPS_WEIGHT * sum(map(is_upper, token)))
+            + MARK_WEIGHT * (token.count("!") + token.count("?"))
+            for token in tokens
+        ])
+        starts = array("I", [m.start() for m in matches])
+        ends = array("I", [m.end() for m in matches])
+        polarity = array("d", self._word_polarity(words))
+        lexicons = array("Q", [0]) * len(words)
+
+        # Emoji never straddle whitespace, so each belongs to the last token starting at or before it
+        for offset in patterns.emoji_offsets(text, patterns.EMPHASIS_EMOJI):
+            emphasis[bisect_right(starts, offset) - 1] += EMOJI_WEIGHT
+
+        hits = source.lexicon_hits
+        if hits:
+            self._mark_lexicons(words, hits, lexicons)
+        self._starts, self._ends, self._emphasis, self._polarity, self._lexicons = (
+            starts, ends, emphasis, polarity, lexicons)
+
+    @staticmethod
+    def _word_polarity(words: List[str]) -> List[float]:
+        lexicon = word_lexicon()
+        scores = []
+        negated = False
+        for word in words:
+            entry = lexicon.get(word)
+            if entry is not None:
+                scores.append(entry[0] * -0.5 if negated else entry[0])
+                negated = False
+                continue
+            scores.append(0.0)
+            if word in NEGATIONS or word.endswith("n't") or word.endswith("n’t"):
+                negated = True
+            elif len(word) > 1:
+                negated = False
+        return scores
+
+    def _mark_lexicons(self, words: List[str], hits, lexicons: array):
+        single: Dict[str, int] = {}
+        phrases: List[Tuple[List[str], int]] = []
+        for bit, (name, terms) in enumerate(sorted(hits.items())[:MAX_LEXICONS]):
+            self.lexicon_names.append(name)
+            for term in terms:
+                parts = term.split()
+                if len(parts) == 1:
+                    single[term] = single.get(term, 0) | 1 << bit
+                else:
+                    phrases.append((parts, 1 << bit))
+        for i, word in enumerate(words):
+            mask = single.get(word)
+            if mask:
+                lexicons[i] |= mask
+        for parts, mask in phrases:
+            width = len(parts)
+            for i in range(len(words) - width + 1):
+                if words[i: i + width] == parts:
+                    for j in range(i, i + width):
+                        lexicons[j] |= mask
+
@@ -0,0 +1,212 @@
+"""Opt-in hot-path instrumentation for analyze_drift.
+
+    from lloyd_drift_demo.engine.instrumentation import INSTRUMENTS, enable_instrumentation
+    enable_instrumentation(trace_rate=0.01)
+    ...
+    INSTRUMENTS.snapshot()      # dict
+    INSTRUMENTS.prometheus()    # Prometheus text exposition format
+
+Disabled (the default), analyze_drift pays one attribute test per call.
+Enabled, it records per-rule call counts, cumulative time and fire counts,
+per-label and per-tier result counters, and TextBlob parses; the shared
+polarity cache, result cache and memory store report their own hit rates. A sampled
+fraction of calls is traced in full — every rule evaluated, timed, and
+kept as a ``DriftTrace`` instead of printed.
+"""
+
+import time
+import random
+import threading
+from collections import deque
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from typing import Callable, Deque, Dict, List, Optional
+
+DEFAULT_TRACE_BUFFER = 256
+
+
+@dataclass
+class RuleTrace:
+    rule: str
+    fired: bool
+    elapsed_us: float
+    label: Optional[str] = None
+    weight: Optional[float] = None
+    rationale: Optional[str] = None
+
+
+@dataclass
+class DriftTrace:
+    """Every override rule's outcome for one analyze_drift call."""
+    baseline: str
+    incoming: str
+    rules: List[RuleTrace] = field(default_factory=list)
+    winner: Optional[str] = None
+    label: Optional[str] = None
+    drift_score: Optional[float] = None
+    tier: Optional[str] = None
+    elapsed_us: float = 0.0
+    conversation_id: Optional[str] = None
+    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    @property
+    def candidates(self) -> List[RuleTrace]:
+        return [r for r in self.rules if r.fired]
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class Instrumentation:
+    """Counters and sampled traces for the scoring hot path (thread-safe)."""
+
+    def __init__(self, trace_rate: float = 0.0, trace_buffer: int = DEFAULT_TRACE_BUFFER):
+        self.enabled = False
+        self.trace_rate = trace_rate
+        self.on_trace: Optional[Callable[[DriftTrace], None]] = None
+        self._lock = threading.Lock()
+        self._traces: Deque[DriftTrace] = deque(maxlen=trace_buffer)
+        self._random = random.Random()
+        self.textblob_parses = 0   # counted even when disabled; one increment per parse
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.calls = 0
+            self.elapsed_ns = 0
+            self.rule_calls: Dict[str, int] = {}
+            self.rule_ns: Dict[str, int] = {}
+            self.rule_fired: Dict[str, int] = {}
+            self.labels: Dict[str, int] = {}
+            self.tiers: Dict[str, int] = {}
+            self.traced = 0
+            self._traces.clear()
+        self.textblob_parses = 0
+
+    # === Recording (called from analyze_drift's instrumented path) ===
+    def should_trace(self) -> bool:
+        return self.trace_rate > 0 and self._random.random() < self.trace_rate
+
+    def timed_fire(self, fire: Callable, timings: list) -> Callable:
+        """Wrap a registry's rule-firing function so each call lands in ``timings``."""
+        clock = time.perf_counter_ns
+
+        def timed(rule, baseline, incoming, memory):
+            start = clock()
+            candidate = fire(rule, baseline, incoming, memory)
+            timings.append((rule.name, clock() - start, candidate))
+            return candidate
+
+        return timed
+
+    def record(self, timings: list, label: str, tier: Optional[str], elapsed_ns: int,
+               trace: Optional[DriftTrace] = None):
+        with self._lock:
+            self.calls += 1
+            self.elapsed_ns += elapsed_ns
+            for name, ns, candidate in timings:
+                self.rule_calls[name] = self.rule_calls.get(name, 0) + 1
+                self.rule_ns[name] = self.rule_ns.get(name, 0) + ns
+                if candidate is not None:
+                    self.rule_fired[name] = self.rule_fired.get(name, 0) + 1
+            self.labels[label] = self.labels.get(label, 0) + 1
+            if tier is not None:
+                self.tiers[tier] = self.tiers.get(tier, 0) + 1
+            if trace is not None:
+                self.traced += 1
+                self._traces.append(trace)
+        if trace is not None and self.on_trace is not None:
+            self.on_trace(trace)
+
+    # === Export ===
+    def traces(self) -> List[DriftTrace]:
+        with self._lock:
+            return list(self._traces)
+
+    def snapshot(self) -> dict:
+        from .polarity_cache import POLARITY_CACHE
+        from .polarity_backends import get_polarity_backend
+        from .memory_store import MEMORY_STORE
+        from .result_cache import RESULT_CACHE
+
+        with self._lock:
+            rules = {
+                name: {
+                    "calls": calls,
+                    "seconds": self.rule_ns.get(name, 0) / 1e9,
+                    "mean_us": round(self.rule_ns.get(name, 0) / calls / 1000, 3) if calls else 0.0,
+                    "fired": self.rule_fired.get(name, 0),
+                }
+                for name, calls in self.rule_calls.items()
+            }
+            data = {
+                "enabled": self.enabled,
+                "calls": self.calls,
+                "seconds": self.elapsed_ns / 1e9,
+                "rules": rules,
+                "labels": dict(self.labels),
+                "tiers": dict(self.tiers),
+                "traced": self.traced,
+            }
+        data["textblob_parses"] = self.textblob_parses
+        data["polarity_backend"] = get_polarity_backend().name
+        data["caches"] = {"polarity": POLARITY_CACHE.stats(), "result": RESULT_CACHE.stats(),
+                          "memory_store": MEMORY_STORE.stats()}
+        return data
+
+    def prometheus(self, prefix: str = "lloyd") -> str:
+        """Snapshot rendered in the Prometheus text exposition format."""
+        snap = self.snapshot()
+        lines: List[str] = []
+
+        def metric(name: str, kind: str, help_text: str, samples):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            for labels, value in samples:
+                label_text = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+                lines.append(f"{prefix}_{name}{{{label_text}}} {value}" if label_text else f"{prefix}_{name} {value}")
+
+        metric("drift_calls_total", "counter", "analyze_drift calls observed.", [({}, snap["calls"])])
+        metric("drift_seconds_total", "counter", "Time spent in analyze_drift.", [({}, snap["seconds"])])
+        rules = snap["rules"]
+        metric("rule_calls_total", "counter", "Override rule evaluations.",
+               [({"rule": n}, r["calls"]) for n, r in sorted(rules.items())])
+        metric("rule_seconds_total", "counter", "Time spent evaluating override rules.",
+               [({"rule": n}, r["seconds"]) for n, r in sorted(rules.items())])
+        metric("rule_fired_total", "counter", "Override rules that produced a candidate.",
+               [({"rule": n}, r["fired"]) for n, r in sorted(rules.items())])
+        metric("label_total", "counter", "Results by label.",
+               [({"label": k}, v) for k, v in sorted(snap["labels"].items())])
+        metric("tier_total", "counter", "Results by tier.",
+               [({"tier": k}, v) for k, v in sorted(snap["tiers"].items())])
+        metric("textblob_parses_total", "counter", "TextBlob sentiment parses.", [({}, snap["textblob_parses"])])
+
+        for cache, stats in snap["caches"].items():
+            metric(f"{cache}_cache_hits_total", "counter", f"{cache} cache hits.", [({}, stats["hits"])])
+            metric(f"{cache}_cache_misses_total", "counter", f"{cache} cache misses.", [({}, stats["misses"])])
+            metric(f"{cache}_cache_evictions_total", "counter", f"{cache} cache evictions.", [({}, stats["evictions"])])
+            metric(f"{cache}_cache_hit_ratio", "gauge", f"{cache} cache hit ratio.", [({}, stats["hit_rate"])])
+            size = stats.get("size", stats.get("conversations"))
+            metric(f"{cache}_cache_entries", "gauge", f"{cache} cache entries.", [({}, size)])
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+INSTRUMENTS = Instrumentation()
+
+
+def enable_instrumentation(trace_rate: Optional[float] = None,
+                           on_trace: Optional[Callable[[DriftTrace], None]] = None) -> Instrumentation:
+    if trace_rate is not None:
+        INSTRUMENTS.trace_rate = trace_rate
+    if on_trace is not None:
+        INSTRUMENTS.on_trace = on_trace
+    INSTRUMENTS.enabled = True
+    return INSTRUMENTS
+
+
+def disable_instrumentation():
+    INSTRUMENTS.enabled = False
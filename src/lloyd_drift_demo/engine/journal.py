@@ -0,0 +1,215 @@
+import os
+import json
+import atexit
+import logging
+import threading
+import time
+from typing import Dict, List, Optional
+
+# === Defaults ===
+DEFAULT_MAX_BUFFER = 1000        # entries held before a flush is forced
+DEFAULT_FLUSH_INTERVAL = 1.0     # seconds between time-based flushes
+DEFAULT_MAX_PENDING = 100_000    # producer blocks beyond this many unwritten entries
+DEFAULT_BACKUP_COUNT = 5
+
+logger = logging.getLogger("DriftJournal")
+
+
+class DriftJournal:
+    """Append-only JSONL drift journal with buffered, batched writes.
+
+    One file handle stays open for the journal's lifetime. Entries are
+    buffered in memory and written in bulk once ``max_buffer`` entries are
+    waiting or ``flush_interval`` seconds have passed. With ``background=True``
+    a writer thread does the serialization and disk I/O, so callers only pay
+    for a list append. The file rotates to ``path.1`` … ``path.N`` once it
+    grows past ``max_bytes``. ``close()`` (also run at exit) drains the buffer
+    and fsyncs.
+
+    A write error never stops the writer. Entries that cannot be serialized,
+    and batches whose write fails, are logged and counted in ``dropped``. If
+    the writer thread still dies, ``write`` raises instead of waiting for
+    room that will never come.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_buffer: int = DEFAULT_MAX_BUFFER,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_bytes: Optional[int] = None,
+        backup_count: int = DEFAULT_BACKUP_COUNT,
+        background: bool = True,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        fsync_on_flush: bool = False,
+    ):
+        self.path = path
+        self.max_buffer = max_buffer
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.max_pending = max_pending
+        self.fsync_on_flush = fsync_on_flush
+
+        self._buffer: List[dict] = []
+        self._cond = threading.Condition()
+        self._io_lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+        self._last_flush = time.monotonic()
+        self._closed = False
+        self.written = 0
+        self.dropped = 0
+        self.rotations = 0
+        self._writer_error: Optional[BaseException] = None
+
+        self._thread: Optional[threading.Thread] = None
+        if background:
+            self._thread = threading.Thread(target=self._run, name="drift-journal", daemon=True)
+            self._thread.start()
+
+    # === Producer side ===
+    def write(self, entry: dict):
+        with self._cond:
+            if self._closed:
+                raise ValueError("write to closed DriftJournal")
+            while self._thread is not None and len(self._buffer) >= self.max_pending:
+                if self._writer_error is not None:
+                    raise RuntimeError("DriftJournal writer thread died") from self._writer_error
+                self._cond.wait(timeout=self.flush_interval)
+            self._buffer.append(entry)
+            due = len(self._buffer) >= self.max_buffer or (
+                time.monotonic() - self._last_flush >= self.flush_interval
+            )
+            if due and self._thread is not None:
+                self._cond.notify_all()
+        if due and self._thread is None:
+            self.flush()
+
+    def flush(self, fsync: bool = False):
+        """Write everything buffered so far."""
+        self._drain(fsync=fsync or self.fsync_on_flush)
+
+    # === Writer side ===
+    def _run(self):
+        try:
+            while True:
+                with self._cond:
+                    if not self._closed and len(self._buffer) < self.max_buffer:
+                        self._cond.wait(timeout=self.flush_interval)
+                    closing = self._closed
+                try:
+                    self._drain(fsync=self.fsync_on_flush)
+                except Exception:
+                    logger.exception("journal %s: flush failed", self.path)
+                if closing:
+                    return
+        except BaseException as e:
+            # Producers blocked on a full buffer must not wait for this thread any longer
+            with self._cond:
+                self._writer_error = e
+                self._cond.notify_all()
+            raise
+
+    def _drain(self, fsync: bool = False):
+        # Holding the I/O lock across the swap keeps batches in write order.
+        with self._io_lock:
+            with self._cond:
+                batch, self._buffer = self._buffer, []
+                self._last_flush = time.monotonic()
+                self._cond.notify_all()
+            # Written in max_buffer slices so rotation overshoots by at most one slice
+            step = max(1, self.max_buffer)
+            for start in range(0, len(batch), step):
+                lines = self._serialize(batch[start:start + step])
+                try:
+                    self._file.write("".join(lines))
+                except OSError as e:
+                    self.dropped += len(lines)
+                    logger.error("journal %s: dropped %d entries, write failed: %s", self.path, len(lines), e)
+                    continue
+                self.written += len(lines)
+                if self.max_bytes and self._file.tell() >= self.max_bytes:
+                    try:
+                        self._rotate()
+                    except OSError as e:
+                        logger.error("journal %s: rotation failed, still appending: %s", self.path, e)
+            try:
+                self._file.flush()
+                if fsync:
+                    os.fsync(self._file.fileno())
+            except OSError as e:
+                logger.error("journal %s: flush failed: %s", self.path, e)
+
+    def _serialize(self, entries: List[dict]) -> List[str]:
+        lines = []
+        for entry in entries:
+            try:
+                lines.append(json.dumps(entry, ensure_ascii=False) + "\n")
+            except (TypeError, ValueError) as e:
+                self.dropped += 1
+                logger.warning("journal %s: dropped an entry that is not JSON-serializable: %s", self.path, e)
+        return lines
+
+    def _rotate(self):
+        self._file.close()
+        try:
+            if self.backup_count > 0:
+                for i in range(self.backup_count - 1, 0, -1):
+                    src = f"{self.path}.{i}"
+                    if os.path.exists(src):
+                        os.replace(src, f"{self.path}.{i + 1}")
+                os.replace(self.path, f"{self.path}.1")
+            else:
+                os.remove(self.path)
+            self.rotations += 1
+        finally:
+            # Reopened even when a rename failed, so later batches still have a file to go to
+            self._file = open(self.path, "a", encoding="utf-8")
+
+    # === Shutdown ===
+    def close(self):
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush(fsync=True)
+        with self._io_lock:
+            self._file.close()
+        key = os.path.abspath(self.path)
+        with _JOURNALS_LOCK:
+            if _JOURNALS.get(key) is self:
+                del _JOURNALS[key]
+
+    def __enter__(self) -> "DriftJournal":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ——————————————
+# Shared journals (one per path)
+# ——————————————
+_JOURNALS: Dict[str, DriftJournal] = {}
+_JOURNALS_LOCK = threading.Lock()
+
+
+def get_journal(path: str, **kwargs) -> DriftJournal:
+    """Return the process-wide journal for ``path``, opening it on first use."""
+    key = os.path.abspath(path)
+    with _JOURNALS_LOCK:
+        journal = _JOURNALS.get(key)
+        if journal is None:
+            journal = _JOURNALS[key] = DriftJournal(path, **kwargs)
+        return journal
+
+
+def close_all_journals():
+    for journal in list(_JOURNALS.values()):
+        journal.close()
+
+
+atexit.register(close_all_journals)
@@ -0,0 +1,165 @@
+import re
+import threading
+from typing import Dict, FrozenSet, Iterable, Optional, Pattern, Tuple
+
+# === Built-in Lexicons ===
+POSITIVE_WORDS = ["love", "like", "enjoy", "great", "wonderful", "good"]
+NEGATIVE_WORDS = ["hate", "dislike", "awful", "bad", "terrible", "worse"]
+
+INTENSIFIERS = [
+    "really", "seriously", "actually", "fine", "very",
+    "absolutely", "completely", "totally", "so", "extremely",
+    "literally", "freaking", "fucking", "insanely", "incredibly"
+]
+
+ANTONYM_PAIRS = [
+    ("love", "hate"),
+    ("like", "dislike"),
+    ("happy", "sad"),
+    ("good", "bad"),
+    ("fine", "terrible"),
+    ("calm", "angry"),
+    ("right", "wrong"),
+    ("yes", "no"),
+    ("helpful", "useless"),
+    ("clean", "dirty"),
+]
+
+# Cue words is_reversed() looks for on either side of the pair
+REVERSAL_CUES = ["like", "don’t like", "love", "hate", "yes", "no", "i", "not"]
+
+HEDGES = ["maybe", "perhaps", "kind of", "sort of", "i guess", "i think"]
+
+HOSTILE_TERMS = [
+    "disgusted", "garbage", "trash", "hate", "worthless",
+    "awful", "literally", "useless", "ruined", "terrible",
+    "fuming", "furious", "crap", "filth", "shit", "junk"
+]
+
+LINKING_VERBS = ["is", "are", "you're", "you are", "this is", "that is"]
+
+GRAY_ZONE_TERMS = [
+    "dead right", "i'm dying", "kill me", "rip me", "drop dead", "just shoot me",
+    "lol i'm dead", "dead inside", "bury me", "i'm toast", "end me", "rip my soul",
+    "you're killing me", "he's killing me", "this is killing me"
+]
+
+EMPTY_HITS: FrozenSet[str] = frozenset()
+
+
+class LexiconHits(dict):
+    """Lexicon name → matched terms. Unmatched lexicons read as an empty set.
+
+    ``version`` is the matcher version the scan ran against; lexicons
+    registered after it are not reflected.
+    """
+
+    version = -1
+
+    def __missing__(self, key: str) -> FrozenSet[str]:
+        return EMPTY_HITS
+
+
+class LexiconMatcher:
+    """All registered lexicons compiled into one regex, scanned once per text.
+
+    Terms match whole words/phrases only (``"so"`` no longer fires inside
+    ``"also"``). The pattern is a zero-width lookahead tried at every
+    position, so overlapping terms are all reported; shorter terms that are
+    a word-prefix of a longer match (``"i"`` inside ``"i think"``) are
+    credited from a table built at compile time. Registering another
+    lexicon recompiles the single pattern, so scan cost does not grow with
+    the number of lexicons. Compilation is deferred to the first scan after
+    a change, so importing the engine and registering lexicons cost nothing
+    up front.
+    """
+
+    def __init__(self, lexicons: Optional[Dict[str, Iterable[str]]] = None):
+        self._lexicons: Dict[str, FrozenSet[str]] = {}
+        self._lock = threading.Lock()
+        # (pattern, credits), swapped as one reference; None until first scan
+        self._compiled: Optional[Tuple[Optional[Pattern[str]], Dict[str, tuple]]] = None
+        self.version = 0  # bumped on every registration
+        for name, terms in (lexicons or {}).items():
+            self._lexicons[name] = frozenset(t.lower() for t in terms)
+
+    def register(self, name: str, terms: Iterable[str]):
+        """Add or replace a lexicon; takes effect for every subsequent scan."""
+        with self._lock:
+            self._lexicons[name] = frozenset(t.lower() for t in terms)
+            self._compiled = None
+            self.version += 1
+
+    def lexicon(self, name: str) -> FrozenSet[str]:
+        return self._lexicons.get(name, EMPTY_HITS)
+
+    def lexicons(self) -> Dict[str, FrozenSet[str]]:
+        with self._lock:
+            return dict(self._lexicons)
+
+    def _compile(self) -> Tuple[Optional[Pattern[str]], Dict[str, tuple]]:
+        with self._lock:
+            if self._compiled is None:
+                self._compiled = self._build()
+            return self._compiled
+
+    def _build(self) -> Tuple[Optional[Pattern[str]], Dict[str, tuple]]:
+        owners: Dict[str, set] = {}
+        for name, terms in self._lexicons.items():
+            for term in terms:
+                owners.setdefault(term, set()).add(name)
+
+        terms = sorted(owners, key=len, reverse=True)
+        credits = {}
+        for term in terms:
+            credited = []
+            for other in terms:
+                if term.startswith(other) and (
+                    len(other) == len(term) or not _is_word_char(term[len(other)])
+                ):
+                    credited.extend((name, other) for name in owners[other])
+            credits[term] = tuple(credited)
+
+        if not terms:
+            return None, credits
+        alternation = "|".join(re.escape(t) for t in terms)
+        return re.compile(rf"(?=(?<!\w)({alternation})(?!\w))"), credits
+
+    def match(self, lowered: str) -> LexiconHits:
+        """Scan already-lowercased text once and return every lexicon hit."""
+        hits: Dict[str, set] = {}
+        version = self.version    # read first: a registration racing the scan only makes this older
+        pattern, credits = self._compiled or self._compile()
+        if pattern is not None:
+            for found in pattern.finditer(lowered):
+                for name, term in credits[found.group(1)]:
+                    hits.setdefault(name, set()).add(term)
+        result = LexiconHits((name, frozenset(terms)) for name, terms in hits.items())
+        result.version = version
+        return result
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+LEXICON_MATCHER = LexiconMatcher({
+    "positive": POSITIVE_WORDS,
+    "negative": NEGATIVE_WORDS,
+    "intensifiers": INTENSIFIERS,
+    "antonyms": [word for pair in ANTONYM_PAIRS for word in pair],
+    "reversal_cues": REVERSAL_CUES,
+    "hedges": HEDGES,
+    "hostile": HOSTILE_TERMS,
+    "linking_verbs": LINKING_VERBS,
+    "gray_zone": GRAY_ZONE_TERMS,
+})
+
+
+def register_lexicon(name: str, terms: Iterable[str]):
+    """Register an operator-supplied lexicon with the shared matcher."""
+    LEXICON_MATCHER.register(name, terms)
+
+
+def match_lexicons(text: str) -> LexiconHits:
+    return LEXICON_MATCHER.match(text.lower())
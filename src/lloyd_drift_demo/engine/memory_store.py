@@ -0,0 +1,427 @@
+"""Process-wide DriftMemory store keyed by conversation id.
+
+Conversations are spread over lock-striped shards, so threads scoring
+different conversations rarely contend. Each shard is an LRU; conversations
+idle longer than ``idle_ttl`` are dropped, and the store as a whole is held
+under ``max_conversations`` and an approximate ``max_bytes`` budget.
+``snapshot``/``restore`` write and read a compact zlib-compressed binary
+file so a restarted worker keeps its tone trajectories.
+"""
+
+import os
+import sys
+import zlib
+import logging
+import struct
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterator, List, Optional, Tuple
+
+from lloyd_drift_demo.drift_types import DriftMemory, DEFAULT_MEMORY_CAPACITY, DEFAULT_EWMA_ALPHA
+
+# === Defaults ===
+DEFAULT_SHARDS = 64
+DEFAULT_MAX_CONVERSATIONS = 500_000
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_IDLE_TTL = 6 * 60 * 60  # seconds; None disables idle expiry
+
+# === Snapshot format ===
+SNAPSHOT_MAGIC = b"LDMS"
+SNAPSHOT_VERSION = 2
+_HEADER = struct.Struct("<4sBI")          # magic, version, entry count
+_ENTRY = struct.Struct("<IdIBddI")        # key length, idle age, capacity, flags, alpha, ewma, n scores
+_ENTRY_V1 = struct.Struct("<HdHBddH")     # version 1: 16-bit lengths, still readable
+_TEXT_LEN = struct.Struct("<I")
+_NO_TEXT = 0xFFFFFFFF
+_FLAG_KEEP_TEXT = 1
+_FLAG_HAS_EWMA = 2
+_FLAG_INT_KEY = 4
+
+logger = logging.getLogger("MemoryStore")
+
+# Fixed per-conversation overhead beyond the memory itself: OrderedDict node,
+# the [memory, size, last_access] entry list and its float.
+_ENTRY_OVERHEAD = 200
+
+
+def estimate_memory_size(memory: DriftMemory) -> int:
+    """Approximate bytes held by one DriftMemory (object, ring lists, score floats, texts)."""
+    size = sys.getsizeof(memory) + sys.getsizeof(memory._scores) + 24 * len(memory)
+    if memory._texts is not None:
+        size += sys.getsizeof(memory._texts)
+        size += sum(sys.getsizeof(text) for text in memory._texts if text is not None)
+    return size
+
+
+class _Shard:
+    __slots__ = ("lock", "entries", "bytes", "hits", "misses", "evictions", "expirations")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # key -> [memory, estimated size, last access (monotonic)]
+        self.entries: "OrderedDict[Hashable, list]" = OrderedDict()
+        self.bytes = 0
+        self.reset_counters()
+
+    def reset_counters(self):
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+
+class MemoryStore:
+    """Sharded LRU of conversation id → DriftMemory with idle-TTL and a memory budget.
+
+    ``get`` returns the live memory (or ``None``); ``add`` records a turn,
+    creating the conversation on first use. Limits are split evenly across
+    shards, so eviction stays shard-local and never takes more than one lock.
+    """
+
+    def __init__(
+        self,
+        shards: int = DEFAULT_SHARDS,
+        max_conversations: int = DEFAULT_MAX_CONVERSATIONS,
+        max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+        idle_ttl: Optional[float] = DEFAULT_IDLE_TTL,
+        capacity: int = DEFAULT_MEMORY_CAPACITY,
+        ewma_alpha: float = DEFAULT_EWMA_ALPHA,
+        keep_text: bool = True,
+    ):
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        self.capacity = capacity
+        self.ewma_alpha = ewma_alpha
+        self.keep_text = keep_text
+        self.idle_ttl = idle_ttl
+        self._shards = [_Shard() for _ in range(shards)]
+        self.max_conversations = max_conversations
+        self.max_bytes = max_bytes
+        self.snapshot_skipped = 0    # conversations left out of the last snapshot (ids not str/int)
+        self._split_limits()
+
+    def _split_limits(self):
+        n = len(self._shards)
+        self._shard_max_conversations = max(1, self.max_conversations // n)
+        self._shard_max_bytes = max(1, self.max_bytes // n) if self.max_bytes is not None else None
+
+    def resize(self, max_conversations: Optional[int] = None, max_bytes: Optional[int] = None):
+        """Change the limits; existing shards are trimmed on their next write."""
+        if max_conversations is not None:
+            self.max_conversations = max_conversations
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+        self._split_limits()
+
+    def _shard(self, conversation_id: Hashable) -> _Shard:
+        return self._shards[hash(conversation_id) % len(self._shards)]
+
+    # === Lookup ===
+    def _live_entry(self, shard: _Shard, conversation_id: Hashable, now: float) -> Optional[list]:
+        entry = shard.entries.get(conversation_id)
+        if entry is None:
+            return None
+        if self.idle_ttl is not None and now - entry[2] > self.idle_ttl:
+            self._remove(shard, conversation_id)
+            shard.expirations += 1
+            return None
+        entry[2] = now
+        shard.entries.move_to_end(conversation_id)
+        return entry
+
+    def get(self, conversation_id: Hashable) -> Optional[DriftMemory]:
+        """Return the conversation's memory if it is live, refreshing its recency."""
+        shard = self._shard(conversation_id)
+        with shard.lock:
+            entry = self._live_entry(shard, conversation_id, time.monotonic())
+            if entry is None:
+                shard.misses += 1
+                return None
+            shard.hits += 1
+            return entry[0]
+
+    def get_or_create(self, conversation_id: Hashable) -> DriftMemory:
+        shard = self._shard(conversation_id)
+        now = time.monotonic()
+        with shard.lock:
+            entry = self._live_entry(shard, conversation_id, now)
+            if entry is None:
+                entry = self._insert(shard, conversation_id, self._new_memory(), now)
+        return entry[0]
+
+    def __contains__(self, conversation_id: Hashable) -> bool:
+        return self.get(conversation_id) is not None
+
+    def __len__(self) -> int:
+        return sum(len(shard.entries) for shard in self._shards)
+
+    # === Updates ===
+    def add(self, conversation_id: Hashable, text: str, score: float) -> DriftMemory:
+        """Append a turn to the conversation's memory and re-account its size."""
+        shard = self._shard(conversation_id)
+        now = time.monotonic()
+        with shard.lock:
+            entry = self._live_entry(shard, conversation_id, now)
+            if entry is None:
+                entry = self._insert(shard, conversation_id, self._new_memory(), now)
+            memory = entry[0]
+            memory.add(text, score)
+            size = estimate_memory_size(memory) + _ENTRY_OVERHEAD
+            shard.bytes += size - entry[1]
+            entry[1] = size
+            self._enforce(shard, now)
+        return memory
+
+    def put(self, conversation_id: Hashable, memory: DriftMemory):
+        shard = self._shard(conversation_id)
+        now = time.monotonic()
+        with shard.lock:
+            self._remove(shard, conversation_id)
+            self._insert(shard, conversation_id, memory, now)
+
+    def discard(self, conversation_id: Hashable) -> bool:
+        shard = self._shard(conversation_id)
+        with shard.lock:
+            return self._remove(shard, conversation_id)
+
+    def clear(self):
+        for shard in self._shards:
+            with shard.lock:
+                shard.entries.clear()
+                shard.bytes = 0
+                shard.reset_counters()
+
+    def expire(self) -> int:
+        """Drop every idle-expired conversation now; returns how many were dropped."""
+        if self.idle_ttl is None:
+            return 0
+        dropped = 0
+        now = time.monotonic()
+        for shard in self._shards:
+            with shard.lock:
+                dropped += self._expire_shard(shard, now)
+        return dropped
+
+    def _new_memory(self) -> DriftMemory:
+        return DriftMemory(capacity=self.capacity, ewma_alpha=self.ewma_alpha, keep_text=self.keep_text)
+
+    # === Shard internals (caller holds shard.lock) ===
+    def _insert(self, shard: _Shard, conversation_id: Hashable, memory: DriftMemory, last_access: float) -> list:
+        entry = [memory, estimate_memory_size(memory) + _ENTRY_OVERHEAD, last_access]
+        shard.entries[conversation_id] = entry
+        shard.bytes += entry[1]
+        self._enforce(shard, time.monotonic())
+        return entry
+
+    def _remove(self, shard: _Shard, conversation_id: Hashable) -> bool:
+        entry = shard.entries.pop(conversation_id, None)
+        if entry is None:
+            return False
+        shard.bytes -= entry[1]
+        return True
+
+    def _expire_shard(self, shard: _Shard, now: float) -> int:
+        # Entries are in access order, so expired ones are all at the front.
+        dropped = 0
+        while shard.entries:
+            entry = next(iter(shard.entries.values()))
+            if now - entry[2] <= self.idle_ttl:
+                break
+            shard.entries.popitem(last=False)
+            shard.bytes -= entry[1]
+            dropped += 1
+        shard.expirations += dropped
+        return dropped
+
+    def _enforce(self, shard: _Shard, now: float):
+        if self.idle_ttl is not None:
+            self._expire_shard(shard, now)
+        # The entry just written is most recent, so keeping one entry means it
+        # is never its own victim.
+        while len(shard.entries) > 1 and (
+            len(shard.entries) > self._shard_max_conversations
+            or (self._shard_max_bytes is not None and shard.bytes > self._shard_max_bytes)
+        ):
+            _, entry = shard.entries.popitem(last=False)
+            shard.bytes -= entry[1]
+            shard.evictions += 1
+
+    # === Snapshots ===
+    def _iter_entries(self, now: float) -> Iterator[Tuple[Hashable, DriftMemory, float]]:
+        for shard in self._shards:
+            with shard.lock:
+                items = [(key, entry[0], now - entry[2]) for key, entry in shard.entries.items()]
+            yield from items
+
+    def snapshot(self, path: str) -> int:
+        """Write every live conversation to ``path`` atomically; returns the count.
+
+        Each shard is copied under its own lock, so the file is consistent per
+        shard rather than as a whole — turns scored mid-snapshot may or may not
+        be included. Only str and int ids can be written; conversations under
+        other ids (tuples, bools) are counted in ``snapshot_skipped`` and logged.
+        """
+        now = time.monotonic()
+        entries = []
+        skipped = 0
+        for item in self._iter_entries(now):
+            if self.idle_ttl is not None and item[2] > self.idle_ttl:
+                continue
+            if _snapshot_key(item[0]):
+                entries.append(item)
+            else:
+                skipped += 1
+        self.snapshot_skipped = skipped
+        if skipped:
+            logger.warning("memory snapshot %s: skipped %d conversations whose ids are not str or int",
+                           path, skipped)
+        compressor = zlib.compressobj(6)
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(entries)))
+            for conversation_id, memory, idle_age in entries:
+                f.write(compressor.compress(_encode_entry(conversation_id, memory, idle_age)))
+            f.write(compressor.flush())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        return len(entries)
+
+    def restore(self, path: str) -> int:
+        """Load a snapshot into the store, honouring idle TTL and limits; returns the count.
+
+        Conversations already in the store are replaced. Entries are inserted
+        least-recently-used first so the restored LRU order matches the original.
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < _HEADER.size:
+            raise ValueError(f"{path}: truncated memory snapshot")
+        magic, version, count = _HEADER.unpack_from(data)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"{path}: not a memory snapshot")
+        if version not in (1, SNAPSHOT_VERSION):
+            raise ValueError(f"{path}: unsupported snapshot version {version}")
+        entry_struct = _ENTRY_V1 if version == 1 else _ENTRY
+        body = memoryview(zlib.decompress(data[_HEADER.size:]))
+
+        decoded = []
+        offset = 0
+        for _ in range(count):
+            conversation_id, memory, idle_age, offset = _decode_entry(body, offset, entry_struct)
+            if self.idle_ttl is None or idle_age <= self.idle_ttl:
+                decoded.append((idle_age, conversation_id, memory))
+        decoded.sort(key=lambda item: item[0], reverse=True)
+
+        now = time.monotonic()
+        for idle_age, conversation_id, memory in decoded:
+            shard = self._shard(conversation_id)
+            with shard.lock:
+                self._remove(shard, conversation_id)
+                self._insert(shard, conversation_id, memory, now - idle_age)
+        return len(decoded)
+
+    # === Introspection ===
+    def stats(self) -> Dict[str, float]:
+        totals = dict.fromkeys(("conversations", "approx_bytes", "hits", "misses", "evictions", "expirations"), 0)
+        for shard in self._shards:
+            with shard.lock:
+                totals["conversations"] += len(shard.entries)
+                totals["approx_bytes"] += shard.bytes
+                totals["hits"] += shard.hits
+                totals["misses"] += shard.misses
+                totals["evictions"] += shard.evictions
+                totals["expirations"] += shard.expirations
+        lookups = totals["hits"] + totals["misses"]
+        totals.update(
+            max_conversations=self.max_conversations,
+            max_bytes=self.max_bytes,
+            shards=len(self._shards),
+            snapshot_skipped=self.snapshot_skipped,
+            hit_rate=totals["hits"] / lookups if lookups else 0.0,
+        )
+        return totals
+
+
+# ——————————————
+# Snapshot encoding
+# ——————————————
+def _snapshot_key(conversation_id) -> bool:
+    # bool is an int subclass, but "True" would not decode back through int()
+    return isinstance(conversation_id, str) or type(conversation_id) is int
+
+
+def _decode_int_key(key: str) -> Hashable:
+    if key in ("True", "False"):
+        return key == "True"    # written by snapshots that took bools for ints
+    return int(key)
+
+
+def _encode_entry(conversation_id, memory: DriftMemory, idle_age: float) -> bytes:
+    flags = 0
+    if type(conversation_id) is int:
+        flags |= _FLAG_INT_KEY
+        key = str(conversation_id).encode("ascii")
+    else:
+        key = conversation_id.encode("utf-8")
+    if memory.keep_text:
+        flags |= _FLAG_KEEP_TEXT
+    if memory.ewma is not None:
+        flags |= _FLAG_HAS_EWMA
+    items = memory.history
+    parts: List[bytes] = [
+        _ENTRY.pack(len(key), idle_age, memory.capacity, flags, memory.ewma_alpha,
+                    memory.ewma if memory.ewma is not None else 0.0, len(items)),
+        key,
+        struct.pack(f"<{len(items)}d", *(score for _, score in items)),
+    ]
+    if memory.keep_text:
+        for text, _ in items:
+            if text is None:
+                parts.append(_TEXT_LEN.pack(_NO_TEXT))
+            else:
+                encoded = text.encode("utf-8")
+                parts.append(_TEXT_LEN.pack(len(encoded)))
+                parts.append(encoded)
+    return b"".join(parts)
+
+
+def _decode_entry(body: memoryview, offset: int,
+                  entry_struct: struct.Struct = _ENTRY) -> Tuple[Hashable, DriftMemory, float, int]:
+    key_len, idle_age, capacity, flags, alpha, ewma, n = entry_struct.unpack_from(body, offset)
+    offset += entry_struct.size
+    key = bytes(body[offset:offset + key_len]).decode("utf-8")
+    offset += key_len
+    conversation_id: Hashable = _decode_int_key(key) if flags & _FLAG_INT_KEY else key
+    scores = struct.unpack_from(f"<{n}d", body, offset)
+    offset += 8 * n
+
+    texts: List[Optional[str]] = [None] * n
+    if flags & _FLAG_KEEP_TEXT:
+        for i in range(n):
+            (length,) = _TEXT_LEN.unpack_from(body, offset)
+            offset += _TEXT_LEN.size
+            if length != _NO_TEXT:
+                texts[i] = bytes(body[offset:offset + length]).decode("utf-8")
+                offset += length
+
+    memory = DriftMemory(zip(texts, scores), capacity=capacity, ewma_alpha=alpha,
+                         keep_text=bool(flags & _FLAG_KEEP_TEXT))
+    memory.ewma = ewma if flags & _FLAG_HAS_EWMA else None
+    return conversation_id, memory, idle_age, offset
+
+
+MEMORY_STORE = MemoryStore()
+
+
+def configure_memory_store(
+    max_conversations: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    idle_ttl: Optional[float] = None,
+    snapshot_path: Optional[str] = None,
+) -> MemoryStore:
+    """Adjust the shared store's limits and/or restore it from a snapshot file."""
+    MEMORY_STORE.resize(max_conversations, max_bytes)
+    if idle_ttl is not None:
+        MEMORY_STORE.idle_ttl = idle_ttl
+    if snapshot_path is not None and os.path.exists(snapshot_path):
+        MEMORY_STORE.restore(snapshot_path)
+    return MEMORY_STORE
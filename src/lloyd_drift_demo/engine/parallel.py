@@ -0,0 +1,229 @@
+"""Multi-process execution mode for analyze_drift and analyze_chunks.
+
+Each worker owns its own inbox, so every turn of a conversation is routed to
+the same process and its DriftMemory sees turns in order. Work is dispatched
+in chunks, the number of chunks in flight is bounded (a generator input is
+never drained ahead of the workers), and results stream back ordered or
+unordered.
+"""
+
+import os
+import zlib
+import traceback
+import multiprocessing as mp
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+DEFAULT_CHUNKSIZE = 64
+INFLIGHT_PER_WORKER = 4
+
+
+# ——————————————
+# Worker side
+# ——————————————
+def _worker_main(inbox, outbox, polarity_backend=None, result_cache=None, polarity_cache=None):
+    from lloyd_drift_demo.engine.drift_engine import analyze_drift, analyze_chunks, warm_up
+    from lloyd_drift_demo.engine.memory_store import MemoryStore
+    from lloyd_drift_demo.engine.polarity_backends import set_polarity_backend
+    from lloyd_drift_demo.engine.polarity_cache import POLARITY_CACHE, configure_polarity_cache
+    from lloyd_drift_demo.engine.result_cache import RESULT_CACHE, configure_result_cache
+
+    if polarity_backend is not None:
+        set_polarity_backend(polarity_backend)  # spawned workers don't inherit the parent's choice
+    if result_cache is not None:
+        configure_result_cache(**result_cache)  # same settings; a sqlite path is shared by every worker
+    if polarity_cache is not None and polarity_cache["path"] != POLARITY_CACHE.path:
+        configure_polarity_cache(**polarity_cache)  # spawned workers; forked ones reconnect on first use
+    warm_up()  # pay TextBlob/emoji first-use costs once per worker
+    store = MemoryStore()
+    outbox.put(("ready", None, None))
+
+    while True:
+        message = inbox.get()
+        if message is None:
+            RESULT_CACHE.close()  # workers exit without atexit; write pending results first
+            POLARITY_CACHE.close()
+            break
+        kind, chunk_id, items = message
+        try:
+            if kind == "drift":
+                results = []
+                for seq, conversation_id, baseline, incoming in items:
+                    result = analyze_drift(baseline, incoming, conversation_id=conversation_id, store=store)
+                    results.append((seq, result))
+            elif kind == "chunks":
+                results = [(seq, analyze_chunks(text)) for seq, text in items]
+            else:
+                raise ValueError(f"Unknown task kind: {kind}")
+            outbox.put((chunk_id, results, None))
+        except Exception:
+            outbox.put((chunk_id, None, traceback.format_exc()))
+
+
+# ——————————————
+# Parent side
+# ——————————————
+class ParallelDriftEngine:
+    """Pool of warmed-up scoring processes with conversation-affine routing.
+
+    Use as a context manager. Conversation memories live in a MemoryStore in
+    each worker for the lifetime of the engine (subject to the store's idle
+    TTL and limits), so successive ``map_drift`` calls continue the same
+    conversations.
+    """
+
+    def __init__(self, workers: Optional[int] = None, chunksize: int = DEFAULT_CHUNKSIZE):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunksize = max(1, chunksize)
+        self.max_inflight = self.workers * INFLIGHT_PER_WORKER
+        self._ctx = mp.get_context()
+        self._inboxes: List[Any] = []
+        self._procs: List[Any] = []
+        self._outbox = None
+        self._next_chunk = 0
+        self._round_robin = 0
+
+    # === Lifecycle ===
+    def start(self) -> "ParallelDriftEngine":
+        from lloyd_drift_demo.engine.polarity_backends import get_polarity_backend
+        from lloyd_drift_demo.engine.polarity_cache import POLARITY_CACHE
+        from lloyd_drift_demo.engine.result_cache import RESULT_CACHE
+
+        if self._procs:
+            return self
+        backend = get_polarity_backend()
+        RESULT_CACHE.flush()  # workers opening the same file see what the parent has cached
+        result_cache = RESULT_CACHE.settings()
+        POLARITY_CACHE.flush()
+        polarity_cache = POLARITY_CACHE.settings()
+        self._outbox = self._ctx.Queue()
+        for _ in range(self.workers):
+            inbox = self._ctx.Queue()
+            proc = self._ctx.Process(target=_worker_main, args=(inbox, self._outbox, backend, result_cache, polarity_cache),
+                                     daemon=True)
+            proc.start()
+            self._inboxes.append(inbox)
+            self._procs.append(proc)
+        for _ in range(self.workers):
+            self._outbox.get()  # wait until every worker is warm
+        return self
+
+    def close(self):
+        for inbox in self._inboxes:
+            inbox.put(None)
+        for proc in self._procs:
+            proc.join()
+        self._inboxes, self._procs = [], []
+
+    def __enter__(self) -> "ParallelDriftEngine":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # === Routing ===
+    def _route(self, conversation_id: Optional[Hashable]) -> int:
+        if conversation_id is None:
+            self._round_robin = (self._round_robin + 1) % self.workers
+            return self._round_robin
+        key = conversation_id if isinstance(conversation_id, str) else repr(conversation_id)
+        return zlib.crc32(key.encode("utf-8")) % self.workers
+
+    # === Streaming core ===
+    def _run(self, kind: str, tasks: Iterable[Tuple[Optional[Hashable], tuple]], ordered: bool) -> Iterator[Any]:
+        self.start()
+        buffers: List[list] = [[] for _ in range(self.workers)]
+        reorder: Dict[int, Any] = {}
+        pending = set()
+        state = {"inflight": 0, "next_seq": 0}
+
+        def dispatch(worker: int):
+            self._inboxes[worker].put((kind, self._next_chunk, buffers[worker]))
+            pending.add(self._next_chunk)
+            self._next_chunk += 1
+            buffers[worker] = []
+            state["inflight"] += 1
+
+        def drain_one() -> Iterator[Any]:
+            chunk_id, results, error = self._outbox.get()
+            while chunk_id not in pending:  # left over from an abandoned earlier run
+                chunk_id, results, error = self._outbox.get()
+            pending.discard(chunk_id)
+            state["inflight"] -= 1
+            if error:
+                raise RuntimeError(f"Drift worker failed:\n{error}")
+            if not ordered:
+                for _, result in results:
+                    yield result
+                return
+            reorder.update(results)
+            while state["next_seq"] in reorder:
+                yield reorder.pop(state["next_seq"])
+                state["next_seq"] += 1
+
+        def wait_for_slot() -> Iterator[Any]:
+            while state["inflight"] >= self.max_inflight:
+                yield from drain_one()
+
+        seq = 0
+        for conversation_id, payload in tasks:
+            worker = self._route(conversation_id)
+            buffers[worker].append((seq,) + payload)
+            seq += 1
+            if len(buffers[worker]) >= self.chunksize:
+                yield from wait_for_slot()
+                dispatch(worker)
+            elif ordered and len(reorder) > self.chunksize * self.max_inflight:
+                # A quiet worker is holding back the next in-order result.
+                for w, buf in enumerate(buffers):
+                    if buf and buf[0][0] <= state["next_seq"]:
+                        yield from wait_for_slot()
+                        dispatch(w)
+
+        for worker, buf in enumerate(buffers):
+            if buf:
+                yield from wait_for_slot()
+                dispatch(worker)
+        while state["inflight"]:
+            yield from drain_one()
+
+    # === Public API ===
+    def map_drift(self, items: Iterable[tuple], ordered: bool = True) -> Iterator[Any]:
+        """Score ``(baseline, incoming)`` or ``(conversation_id, baseline, incoming)`` items.
+
+        Items that carry a conversation id are scored against that
+        conversation's DriftMemory, inside the worker that owns it.
+        """
+        def tasks():
+            for item in items:
+                if len(item) == 3:
+                    conversation_id, baseline, incoming = item
+                else:
+                    conversation_id = None
+                    baseline, incoming = item
+                yield conversation_id, (conversation_id, baseline, incoming)
+
+        return self._run("drift", tasks(), ordered)
+
+    def map_chunks(self, texts: Iterable[str], ordered: bool = True) -> Iterator[list]:
+        """Run analyze_chunks over each text, yielding one result list per text."""
+        return self._run("chunks", ((None, (text,)) for text in texts), ordered)
+
+
+def analyze_drift_parallel(
+    items: Iterable[tuple],
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    ordered: bool = True,
+) -> Iterator[Any]:
+    with ParallelDriftEngine(workers=workers, chunksize=chunksize) as engine:
+        yield from engine.map_drift(items, ordered=ordered)
+
+
+def analyze_chunks_parallel(
+    texts: Iterable[str],
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    ordered: bool = True,
+) -> Iterator[list]:
+    with ParallelDriftEngine(workers=workers, chunksize=chunksize) as engine:
+        yield from engine.map_chunks(texts, ordered=ordered)
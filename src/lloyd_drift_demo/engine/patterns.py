@@ -0,0 +1,164 @@
+import re
+from typing import Dict, FrozenSet, Iterator, NamedTuple, Optional, Pattern, Tuple
+
+# ——————————————————
+# Compiled Pattern Registry
+# ——————————————————
+# Every regex used on the scoring hot path is compiled once here instead of
+# handing a raw pattern string to re.* on each call.
+NON_WORD_KEEP_APOSTROPHE = re.compile(r"[^\w\s']")
+NON_WORD = re.compile(r"[^\w\s]")
+WHITESPACE_RUN = re.compile(r"\s+")
+REPEATED_BANG_OR_QMARK = re.compile(r"([!?])\1+")
+SPACED_LETTER_REPEAT = re.compile(r"\b(\w)\s+\1\b")
+NEGATORS = re.compile(r"\b(not|don’t|never|no|nothing|can't|won't|n't)\b")
+NEGATORS_STRICT = re.compile(r"\b(don’t|not|never)\b")
+SYMBOLIC_OVERRIDE = re.compile(r"\b(OMG|WTF|awe|wonder|divine|miracle|sacred|heavens?)\b")
+SARCASM_MARKERS = re.compile(r"/s\b|🙃|sure\.")
+TARGET_SELF = re.compile(r"\b(i|me|myself)\b")
+TARGET_OTHER = re.compile(r"\b(you|your|you're|u)\b")
+TARGET_AMBIENT = re.compile(r"\b(he|she|they|this|that|it)\b")
+CHUNK_SPLIT = re.compile(r"(?<=[.!?])\s+|,|\band\b|\bor\b")
+
+PATTERNS: Dict[str, Pattern[str]] = {
+    "non_word_keep_apostrophe": NON_WORD_KEEP_APOSTROPHE,
+    "non_word": NON_WORD,
+    "whitespace_run": WHITESPACE_RUN,
+    "repeated_bang_or_qmark": REPEATED_BANG_OR_QMARK,
+    "spaced_letter_repeat": SPACED_LETTER_REPEAT,
+    "negators": NEGATORS,
+    "negators_strict": NEGATORS_STRICT,
+    "symbolic_override": SYMBOLIC_OVERRIDE,
+    "sarcasm_markers": SARCASM_MARKERS,
+    "target_self": TARGET_SELF,
+    "target_other": TARGET_OTHER,
+    "target_ambient": TARGET_AMBIENT,
+    "chunk_split": CHUNK_SPLIT,
+}
+
+# ——————————————————
+# Emoji Lookup Table
+# ——————————————————
+# Full emoji sequences (ZWJ families, skin tones, flags, "❤️" with its
+# variation selector) are matched as one grapheme, longest first. The table
+# comes from the ``emoji`` package and is built on first use, so importing
+# the engine does not pay for loading it.
+
+
+def _char_class(chars, max_gap: int = 1) -> str:
+    """Build a regex character class from code-point ranges.
+
+    ``re`` tests a class member by member, so a class of ~1,400 literal emoji
+    starters is slow. Merging points closer than ``max_gap`` keeps the class
+    to a handful of ranges; callers then confirm candidates against a set.
+    """
+    points = sorted({ord(c) for c in chars})
+    ranges = []
+    for point in points:
+        if ranges and point - ranges[-1][1] <= max_gap:
+            ranges[-1][1] = point
+        else:
+            ranges.append([point, point])
+    parts = []
+    for low, high in ranges:
+        parts.append(re.escape(chr(low)) if low == high else f"{re.escape(chr(low))}-{re.escape(chr(high))}")
+    return "[" + "".join(parts) + "]"
+
+
+class EmojiTable(NamedTuple):
+    sequences: FrozenSet[str]
+    max_len: int
+    first_chars: FrozenSet[str]
+    start: Pattern[str]     # coarse candidate scan, confirmed against first_chars
+
+
+_EMOJI_TABLE: Optional[EmojiTable] = None
+
+
+def emoji_table() -> EmojiTable:
+    global _EMOJI_TABLE
+    if _EMOJI_TABLE is None:
+        import emoji
+
+        sequences = frozenset(emoji.EMOJI_DATA)
+        first_chars = frozenset(seq[0] for seq in sequences)
+        # ASCII starters (#, *, digits) only begin a keycap sequence
+        start = re.compile(
+            _char_class((c for c in first_chars if not c.isascii()), max_gap=1024)
+            + "|" + _char_class(c for c in first_chars if c.isascii())
+            + "(?=[\ufe0f\u20e3])"
+        )
+        _EMOJI_TABLE = EmojiTable(sequences, max(map(len, sequences)), first_chars, start)
+    return _EMOJI_TABLE
+
+
+_LAZY_EMOJI_ATTRS = {
+    "EMOJI_SEQUENCES": "sequences",
+    "EMOJI_MAX_LEN": "max_len",
+    "EMOJI_FIRST_CHARS": "first_chars",
+    "EMOJI_START": "start",
+}
+
+
+def __getattr__(name: str):
+    # Module-level EMOJI_* names resolve to the lazily built table
+    if name in _LAZY_EMOJI_ATTRS:
+        return getattr(emoji_table(), _LAZY_EMOJI_ATTRS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# The emotive emoji that count toward the emphasis score
+EMPHASIS_EMOJI: FrozenSet[str] = frozenset({"😂", "🤣", "😡", "😢", "😍", "😭", "❤️", "❤"})
+
+
+def iter_emoji(text: str) -> Iterator[Tuple[int, int, str]]:
+    """Yield ``(start, end, sequence)`` for each emoji grapheme in ``text``."""
+    table = emoji_table()
+    pos = 0
+    length = len(text)
+    while True:
+        found = table.start.search(text, pos)
+        if found is None:
+            return
+        start = found.start()
+        if text[start] not in table.first_chars:
+            pos = start + 1
+            continue
+        for end in range(min(start + table.max_len, length), start, -1):
+            seq = text[start:end]
+            if seq in table.sequences:
+                yield start, end, seq
+                pos = end
+                break
+        else:
+            pos = start + 1
+
+
+_SUBSET_PATTERNS: Dict[FrozenSet[str], Pattern[str]] = {}
+
+
+def _subset_pattern(subset: FrozenSet[str]) -> Pattern[str]:
+    # Longest sequence first; a match followed by a ZWJ, variation selector or
+    # skin-tone modifier is the head of a larger grapheme and does not count.
+    pattern = _SUBSET_PATTERNS.get(subset)
+    if pattern is None:
+        alternation = "|".join(re.escape(seq) for seq in sorted(subset, key=len, reverse=True))
+        pattern = re.compile(rf"(?:{alternation})(?![\u200d\ufe0f\U0001F3FB-\U0001F3FF])")
+        _SUBSET_PATTERNS[subset] = pattern
+    return pattern
+
+
+def count_emoji(text: str, subset: Optional[FrozenSet[str]] = None) -> int:
+    """Count emoji graphemes, optionally only those in ``subset``."""
+    if text.isascii():  # every emoji sequence contains a non-ASCII code point
+        return 0
+    if subset is None:
+        return sum(1 for _ in iter_emoji(text))
+    return len(_subset_pattern(subset).findall(text))
+
+
+def emoji_offsets(text: str, subset: FrozenSet[str]) -> Iterator[int]:
+    """Start offsets of the emoji that ``count_emoji(text, subset)`` counts."""
+    if text.isascii():
+        return iter(())
+    return (found.start() for found in _subset_pattern(subset).finditer(text))
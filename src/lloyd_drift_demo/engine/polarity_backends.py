@@ -0,0 +1,320 @@
+"""Pluggable polarity scoring behind raw_polarity_score / get_polarity_score.
+
+    from lloyd_drift_demo.engine.polarity_backends import set_polarity_backend
+    set_polarity_backend("lexicon")      # or "textblob" (default), or any PolarityBackend
+
+``TextBlobBackend`` builds a ``TextBlob`` per text and reads
+``.sentiment.polarity``. ``LexiconBackend`` returns the same number without
+TextBlob or nltk. It loads textblob's own ``en-sentiment.xml`` once into a
+flat ``word -> (polarity, intensity, is_modifier)`` dict and reimplements
+pattern's tokenizer and assessment pass: modifiers ("very good"),
+negations ("not good"), "!" boosts, the "(!)" irony mark and emoticons.
+The tokenizer constants below are copied from pattern.text, so importing
+this module does not import textblob.
+"""
+
+import os
+import re
+import importlib.util
+from typing import Dict, List, Optional, Tuple, Union
+
+from .instrumentation import INSTRUMENTS
+from .polarity_cache import POLARITY_CACHE
+
+
+class PolarityBackend:
+    """Maps a text to a polarity in [-1.0, 1.0]."""
+    name = "base"
+
+    def polarity(self, text: str) -> float:
+        raise NotImplementedError
+
+
+class TextBlobBackend(PolarityBackend):
+    name = "textblob"
+
+    def polarity(self, text: str) -> float:
+        # Imported here: textblob pulls in nltk, which dominates engine import time
+        from textblob import TextBlob
+
+        INSTRUMENTS.textblob_parses += 1
+        return float(getattr(TextBlob(text).sentiment, "polarity", 0.0) or 0.0)
+
+
+# === pattern.text tokenizer constants (as shipped in textblob._text) ===
+PUNCTUATION = ".,;:!?()[]{}`''\"@#$^&*+-|=~_"
+_LEADING_CHARS = frozenset(PUNCTUATION) - {"."}
+_TRAILING_CHARS = frozenset(PUNCTUATION)
+ABBREVIATIONS = frozenset((
+    "a.", "adj.", "adv.", "al.", "a.m.", "c.", "cf.", "comp.", "conf.", "def.", "ed.", "e.g.",
+    "esp.", "etc.", "ex.", "f.", "fig.", "gen.", "id.", "i.e.", "int.", "l.", "m.", "Med.",
+    "Mil.", "Mr.", "n.", "n.q.", "orig.", "pl.", "pred.", "pres.", "p.m.", "ref.", "v.", "vs.", "w/",
+))
+RE_ABBR1 = re.compile(r"^[A-Za-z]\.$")
+RE_ABBR2 = re.compile(r"^([A-Za-z]\.)+$")
+RE_ABBR3 = re.compile("^[A-Z][" + "|".join("bcdfghjklmnpqrstvwxz") + "]+.$")
+EMOTICONS = {
+    ("love", +1.00): {"<3", "♥"},
+    ("grin", +1.00): {">:D", ":-D", ":D", "=-D", "=D", "X-D", "x-D", "XD", "xD", "8-D"},
+    ("taunt", +0.75): {">:P", ":-P", ":P", ":-p", ":p", ":-b", ":b", ":c)", ":o)", ":^)"},
+    ("smile", +0.50): {">:)", ":-)", ":)", "=)", "=]", ":]", ":}", ":>", ":3", "8)", "8-)"},
+    ("wink", +0.25): {">;]", ";-)", ";)", ";-]", ";]", ";D", ";^)", "*-)", "*)"},
+    ("gasp", +0.05): {">:o", ":-O", ":O", ":o", ":-o", "o_O", "o.O", "°O°", "°o°"},
+    ("worry", -0.25): {">:/", ":-/", ":/", ":\\", ">:\\", ":-.", ":-s", ":s", ":S", ":-S", ">.>"},
+    ("frown", -0.75): {">:[", ":-(", ":(", "=(", ":-[", ":[", ":{", ":-<", ":c", ":-c", "=/"},
+    ("cry", -1.00): {":'(", ":'''(", ";'("},
+}
+RE_EMOTICONS = re.compile(r"(%s)($|\s)" % "|".join(
+    r" ?".join(re.escape(ch) for ch in e) for faces in EMOTICONS.values() for e in faces
+))
+RE_SARCASM = re.compile(r"\( ?\! ?\)")
+REPLACEMENTS = {"'d": " 'd", "'m": " 'm", "'s": " 's", "'ll": " 'll", "'re": " 're", "'ve": " 've", "n't": " n't"}
+# One pass instead of pattern's seven; the keys never overlap, so the result is the same
+RE_CONTRACTIONS = re.compile("|".join(map(re.escape, REPLACEMENTS)))
+RE_LINEBREAKS = re.compile(r"\n{2,}")
+EOS = "END-OF-SENTENCE"
+_SENTENCE_END = frozenset(("...", ".", "!", "?", EOS))
+_SENTENCE_TAIL = frozenset(("'", '"', "”", "’", "...", ".", "!", "?", ")", EOS))
+NEGATIONS = ("no", "not", "n't", "never")
+
+# Lower-cased emoticon -> polarity; the first face listing it wins, as in pattern
+EMOTICON_POLARITY: Dict[str, float] = {}
+for (_face, _score), _faces in EMOTICONS.items():
+    for _e in _faces:
+        EMOTICON_POLARITY.setdefault(_e.lower(), _score)
+
+
+def _join_emoticon(match) -> str:
+    return match.group(1).replace(" ", "") + match.group(2)
+
+
+def find_tokens(string: str) -> List[str]:
+    """pattern.text.find_tokens with its default arguments: sentences of space-separated tokens."""
+    if "'" in string:
+        string = RE_CONTRACTIONS.sub(lambda m: REPLACEMENTS[m.group()], string)
+    string = (
+        string.replace("“", " “ ").replace("”", " ” ").replace("‘", " ‘ ")
+        .replace("’", " ’ ").replace("'", " ' ").replace('"', ' " ')
+    )
+    if "\n" in string:
+        string = RE_LINEBREAKS.sub(" %s " % EOS, string.replace("\r\n", "\n"))
+
+    # Punctuation is all single characters, so set lookups on t[0]/t[-1]
+    # stand in for pattern's startswith/endswith over the tuple
+    tokens: List[str] = []
+    append = tokens.append
+    # str.split() and pattern's \s+ collapse agree on what counts as whitespace
+    for t in string.split():
+        if t[0] not in _LEADING_CHARS and t[-1] not in _TRAILING_CHARS:
+            append(t)
+            continue
+        tail = []
+        while t[:1] in _LEADING_CHARS and t not in REPLACEMENTS:
+            append(t[0])
+            t = t[1:]
+        while t[-1:] in _TRAILING_CHARS and t not in REPLACEMENTS:
+            if t[-1:] in _LEADING_CHARS:
+                tail.append(t[-1])
+                t = t[:-1]
+            if t.endswith("..."):
+                tail.append("...")
+                t = t[:-3].rstrip(".")
+            if t.endswith("."):
+                if t in ABBREVIATIONS or RE_ABBR1.match(t) or RE_ABBR2.match(t) or RE_ABBR3.match(t):
+                    break
+                tail.append(t[-1])
+                t = t[:-1]
+        if t != "":
+            append(t)
+        tokens.extend(reversed(tail))
+
+    sentences: List[List[str]] = [[]]
+    i = j = 0
+    while j < len(tokens):
+        if tokens[j] in _SENTENCE_END:
+            while j < len(tokens) and tokens[j] in _SENTENCE_TAIL:
+                if tokens[j] in ("'", '"') and sentences[-1].count(tokens[j]) % 2 == 0:
+                    break  # balanced quotes
+                j += 1
+            sentences[-1].extend(t for t in tokens[i:j] if t != EOS)
+            sentences.append([])
+            i = j
+        j += 1
+    sentences[-1].extend(tokens[i:j])
+    out = []
+    for s in sentences:
+        if s:
+            s = " ".join(s)
+            if "!" in s:
+                s = RE_SARCASM.sub("(!)", s)
+            out.append(RE_EMOTICONS.sub(_join_emoticon, s))
+    return out
+
+
+# === Lexicon ===
+# word -> (polarity, intensity, is_modifier)
+LexiconEntry = Tuple[float, float, bool]
+
+
+def default_sentiment_path() -> Optional[str]:
+    """textblob's bundled en-sentiment.xml, located without importing textblob."""
+    spec = importlib.util.find_spec("textblob")
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    return os.path.join(list(spec.submodule_search_locations)[0], "en", "en-sentiment.xml")
+
+
+def _avg(values) -> float:
+    return sum(values) / float(len(values) or 1)
+
+
+def load_sentiment_lexicon(path: str) -> Dict[str, LexiconEntry]:
+    """pattern.en's Sentiment.load, flattened to the POS-agnostic scores a plain string is scored with."""
+    from xml.etree import ElementTree
+
+    words: Dict[str, Dict[Optional[str], list]] = {}
+    for node in ElementTree.parse(path).getroot().findall("word"):
+        form = node.attrib.get("form")
+        if not form:
+            continue
+        psi = (
+            float(node.attrib.get("polarity", 0.0)),
+            float(node.attrib.get("subjectivity", 0.0)),
+            float(node.attrib.get("intensity", 1.0)),
+        )
+        words.setdefault(form, {}).setdefault(node.attrib.get("pos"), []).append(psi)
+    # Average the senses of each POS, then the POS tags themselves
+    for form, by_pos in words.items():
+        by_pos = {pos: [_avg(col) for col in zip(*psis)] for pos, psis in by_pos.items()}
+        by_pos[None] = [_avg(col) for col in zip(*by_pos.values())]
+        words[form] = by_pos
+    # pattern.en maps adjective "terrible" to adverb "terribly"
+    for form, by_pos in list(words.items()):
+        if "JJ" in by_pos:
+            if form.endswith("y"):
+                form = form[:-1] + "i"
+            if form.endswith("le"):
+                form = form[:-2]
+            entry = words.setdefault(form + "ly", {})
+            entry["RB"] = entry[None] = tuple(by_pos["JJ"])
+    return {
+        form: (by_pos[None][0], by_pos[None][2], "RB" in by_pos)
+        for form, by_pos in words.items()
+    }
+
+
+class LexiconBackend(PolarityBackend):
+    """TextBlob's PatternAnalyzer polarity without building blob objects."""
+    name = "lexicon"
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or default_sentiment_path()
+        self._lexicon: Optional[Dict[str, LexiconEntry]] = None
+
+    @property
+    def lexicon(self) -> Dict[str, LexiconEntry]:
+        if self._lexicon is None:
+            if not self.path or not os.path.isfile(self.path):
+                raise FileNotFoundError(f"sentiment lexicon not found: {self.path!r}")
+            self._lexicon = load_sentiment_lexicon(self.path)
+        return self._lexicon
+
+    def polarity(self, text: str) -> float:
+        words = " ".join(find_tokens(text)).lower().split()
+        return self.score_tokens(words)
+
+    def score_tokens(self, words: List[str]) -> float:
+        """pattern's Sentiment.assessments + average, over lower-cased tokens."""
+        lexicon = self.lexicon
+        assessed: List[list] = []   # [polarity, intensity, negated]
+        modifier: Optional[str] = None
+        negation: Optional[str] = None
+        for w in words:
+            entry = lexicon.get(w)
+            if entry is not None:
+                p, i, is_modifier = entry
+                if modifier is None:
+                    assessed.append([p, i, False])
+                else:
+                    last = assessed[-1]
+                    last[0] = max(-1.0, min(p * last[1], +1.0))
+                    last[1] = i
+                if negation is not None:
+                    last = assessed[-1]
+                    last[1] = 1.0 / last[1]
+                    last[2] = True
+                modifier = w if is_modifier else None
+                negation = w if w in NEGATIONS else None
+                continue
+            if w in NEGATIONS:
+                negation = w
+            elif negation and len(w.strip("'")) > 1:
+                negation = None
+            if negation is not None and modifier is not None and modifier.endswith("ly"):
+                assessed[-1][2] = True
+                negation = None
+            elif modifier and len(w) > 2:
+                modifier = None
+            if w == "!" and assessed:
+                assessed[-1][0] = max(-1.0, min(assessed[-1][0] * 1.25, +1.0))
+            if w == "(!)":
+                assessed.append([0.0, 1.0, False])
+            emoticon = EMOTICON_POLARITY.get(w)
+            if emoticon is not None and w.isalpha() is False and len(w) <= 5 and w not in PUNCTUATION:
+                assessed.append([emoticon, 1.0, False])
+
+        total = 0
+        for p, _, negated in assessed:
+            total += p * -0.5 if negated else p
+        return total / float(len(assessed) or 1)
+
+
+# === Registry ===
+POLARITY_BACKENDS = {
+    TextBlobBackend.name: TextBlobBackend,
+    LexiconBackend.name: LexiconBackend,
+}
+_BACKEND: PolarityBackend = TextBlobBackend()
+
+
+def get_polarity_backend() -> PolarityBackend:
+    return _BACKEND
+
+
+def set_polarity_backend(backend: Union[str, PolarityBackend]) -> PolarityBackend:
+    """Route polarity scoring through ``backend`` (a name in POLARITY_BACKENDS or an instance).
+
+    The in-memory polarity cache is cleared so no score from the previous
+    backend is served. A persistent cache file keys its rows by backend, so
+    it can be shared across backends.
+    """
+    global _BACKEND
+    if isinstance(backend, str):
+        if backend not in POLARITY_BACKENDS:
+            raise ValueError(f"unknown polarity backend {backend!r}; choose from {sorted(POLARITY_BACKENDS)}")
+        backend = POLARITY_BACKENDS[backend]()
+    _BACKEND = backend
+    POLARITY_CACHE.clear()
+    return backend
+
+
+def backend_polarity(text: str) -> float:
+    return _BACKEND.polarity(text)
+
+
+_WORD_SCORER: Optional[LexiconBackend] = None
+
+
+def word_lexicon() -> Dict[str, LexiconEntry]:
+    """Word → (polarity, intensity, is_modifier), shared with the active backend when it is the lexicon one.
+
+    Empty when the pattern lexicon file is not available.
+    """
+    global _WORD_SCORER
+    scorer = _BACKEND if isinstance(_BACKEND, LexiconBackend) else _WORD_SCORER
+    if scorer is None:
+        scorer = _WORD_SCORER = LexiconBackend()
+    try:
+        return scorer.lexicon
+    except FileNotFoundError:
+        return {}
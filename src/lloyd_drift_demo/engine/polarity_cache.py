@@ -0,0 +1,211 @@
+import os
+import atexit
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import sqlite3
+
+# === Defaults ===
+DEFAULT_MAXSIZE = 50_000
+MAX_KEY_LENGTH = 4096  # longer texts are scored but never cached
+DISK_COMMIT_EVERY = 256
+
+
+def _backend_key() -> str:
+    # Imported here: polarity_backends imports this module
+    from lloyd_drift_demo.engine.polarity_backends import get_polarity_backend
+
+    backend = get_polarity_backend()
+    path = getattr(backend, "path", None)
+    return backend.name if path is None else f"{backend.name}:{path}"
+
+
+class PolarityCache:
+    """Process-wide, size-bounded LRU cache of text → polarity.
+
+    Thread-safe. Scoring happens outside the lock, so two threads racing on
+    the same uncached text may both compute it; the result is identical.
+    An optional sqlite file backs the cache so a restarted worker comes up warm.
+    A process forked with persistence on reconnects to the file on first use
+    rather than sharing the parent's connection. Writes go in short batches,
+    so several processes can share one file. Rows are keyed by polarity
+    backend as well as text, so one file can serve every backend.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, path: Optional[str] = None):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.path: Optional[str] = None
+        self._db: Optional["sqlite3.Connection"] = None
+        self._db_pid: Optional[int] = None
+        self._pending: List[Tuple[str, str, float]] = []   # written to sqlite in one short transaction
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_hits = 0
+        if path:
+            self.enable_persistence(path)
+
+    # === Lookup ===
+    def get_or_compute(self, text: str, compute: Callable[[str], float]) -> float:
+        if len(text) > MAX_KEY_LENGTH:
+            return compute(text)
+
+        with self._lock:
+            value = self._data.get(text)
+            if value is not None:
+                self._data.move_to_end(text)
+                self.hits += 1
+                return value
+            self.misses += 1
+            value = self._disk_get(text)
+
+        if value is None:
+            value = compute(text)
+            with self._lock:
+                self._disk_put(text, value)
+        with self._lock:
+            self._insert(text, value)
+        return value
+
+    def _insert(self, text: str, value: float):
+        self._data[text] = value
+        self._data.move_to_end(text)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    # === Persistence (opt-in) ===
+    def enable_persistence(self, path: str, preload: bool = True):
+        """Back the cache with a sqlite file, optionally preloading the newest entries."""
+        with self._lock:
+            self._forget_inherited_db()
+            self._close_db()
+            db = self._connect(path)
+            if preload:
+                rows = db.execute(
+                    "SELECT text, score FROM polarity_scores WHERE backend = ? ORDER BY rowid DESC LIMIT ?",
+                    (_backend_key(), self.maxsize),
+                ).fetchall()
+                for text, score in reversed(rows):
+                    self._insert(text, score)
+
+    def _connect(self, path: str) -> "sqlite3.Connection":
+        import sqlite3
+
+        db = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS polarity_scores "
+            "(backend TEXT NOT NULL, text TEXT NOT NULL, score REAL NOT NULL, PRIMARY KEY (backend, text))"
+        )
+        self._db = db
+        self._db_pid = os.getpid()
+        self.path = path
+        return db
+
+    def _forget_inherited_db(self):
+        if self._db is not None and self._db_pid != os.getpid():
+            self._db = None     # inherited across fork; the parent still owns that connection
+            self._pending = []
+
+    def _live_db(self) -> Optional["sqlite3.Connection"]:
+        # Caller holds the lock. A forked child opens its own connection to the same file.
+        if self._db is not None and self._db_pid != os.getpid():
+            self._forget_inherited_db()
+            self._connect(self.path)
+        return self._db
+
+    def _disk_get(self, text: str) -> Optional[float]:
+        if self._live_db() is None:
+            return None
+        row = self._db.execute("SELECT score FROM polarity_scores WHERE backend = ? AND text = ?",
+                               (_backend_key(), text)).fetchone()
+        if row is None:
+            return None
+        self.disk_hits += 1
+        return row[0]
+
+    def _disk_put(self, text: str, value: float):
+        if self._live_db() is None:
+            return
+        self._pending.append((_backend_key(), text, value))
+        if len(self._pending) >= DISK_COMMIT_EVERY:
+            self._write_pending()
+
+    def _write_pending(self):
+        # Other processes may write to the same file, so the write lock is only held for this batch
+        import sqlite3
+
+        if self._db is None or not self._pending:
+            return
+        try:
+            with self._db:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO polarity_scores (backend, text, score) VALUES (?, ?, ?)", self._pending)
+        except sqlite3.OperationalError:
+            pass    # still locked after the timeout; these scores stay in memory only
+        self._pending = []
+
+    def flush(self):
+        with self._lock:
+            self._forget_inherited_db()
+            self._write_pending()
+
+    def _close_db(self):
+        if self._db is not None:
+            self._write_pending()
+            self._db.close()
+            self._db = None
+
+    def close(self):
+        with self._lock:
+            self._forget_inherited_db()
+            self._close_db()
+
+    def settings(self) -> dict:
+        """Keyword arguments for configure_polarity_cache that reproduce this cache elsewhere (e.g. in a worker)."""
+        return {"maxsize": self.maxsize, "path": self.path if self._db is not None else None}
+
+    # === Introspection ===
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = self.disk_hits = 0
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "disk_hits": self.disk_hits,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+POLARITY_CACHE = PolarityCache()
+atexit.register(POLARITY_CACHE.close)
+
+
+def configure_polarity_cache(maxsize: Optional[int] = None, path: Optional[str] = None) -> PolarityCache:
+    """Resize the shared cache and/or attach an on-disk sqlite backing."""
+    if maxsize is not None:
+        with POLARITY_CACHE._lock:
+            POLARITY_CACHE.maxsize = maxsize
+            while len(POLARITY_CACHE._data) > maxsize:
+                POLARITY_CACHE._data.popitem(last=False)
+                POLARITY_CACHE.evictions += 1
+    if path is not None:
+        POLARITY_CACHE.enable_persistence(path)
+    return POLARITY_CACHE
@@ -0,0 +1,286 @@
+"""Column-wise storage for large numbers of DriftResults.
+
+A ``DriftResultBatch`` keeps one typed ``array`` per field instead of one
+object per result:
+
+=============  ========  =====================================================
+column         type      contents
+=============  ========  =====================================================
+drift_score    float64   ``DriftResult.drift_score``
+tier           int16     ``int(DriftResult.tier)``; ``TIER_NONE`` when unset
+flags          uint8     bit 0 drift, bit 1 drift_detected, bit 2 drift unset
+label          int16     code into ``batch.labels``
+rationale      int32     code into ``batch.rationales``
+=============  ========  =====================================================
+
+Labels and rationales repeat heavily, so each distinct string is stored once
+and rows hold its code. That comes to 17 bytes per result. ``tone_badge`` is
+derived from the label when a row is read back. ``phrase`` and ``polarity``
+are not stored; the engine leaves them at their defaults.
+
+A batch can be saved two ways:
+
+- ``save(path)`` writes a flat binary file. ``load(path)`` memory-maps it
+  by default, so the columns are views onto the page cache and nothing is
+  read until it is touched.
+- ``to_parquet(path)`` and ``from_parquet(path)`` use the same columns,
+  with label and rationale dictionary-encoded. They need ``pyarrow``.
+
+Aggregates (``label_counts``, ``drift_count``, ``mean_score``) read the
+columns directly. ``batch[i]`` and iteration build DriftResult objects on
+demand.
+"""
+
+import sys
+import json
+import mmap
+from array import array
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from lloyd_drift_demo.drift_types import DriftResult
+from .drift_engine import compute_tone_badge
+
+# === Layout ===
+MAGIC = b"LLOYDRB1"
+ALIGN = 8
+TIER_NONE = -32768
+
+DRIFT = 1
+DETECTED = 2
+DRIFT_UNSET = 4
+
+COLUMNS = (
+    ("drift_score", "d"),
+    ("tier", "h"),
+    ("flags", "B"),
+    ("label", "h"),
+    ("rationale", "i"),
+)
+
+
+def _pad(length: int) -> int:
+    return -length % ALIGN
+
+
+class DriftResultBatch:
+    """Column-wise DriftResults; see the module docstring for the layout."""
+
+    def __init__(self, results: Iterable[DriftResult] = ()):
+        self.columns: Dict[str, array] = {name: array(code) for name, code in COLUMNS}
+        self.labels: List[str] = []
+        self.rationales: List[str] = []
+        self._label_codes: Dict[str, int] = {}
+        self._rationale_codes: Dict[str, int] = {}
+        self._mmap: Optional[mmap.mmap] = None
+        self.extend(results)
+
+    # === Building ===
+    def _code(self, table: List[str], codes: Dict[str, int], value: str) -> int:
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(table)
+            table.append(value)
+        return code
+
+    def append(self, result: DriftResult):
+        if self._mmap is not None:
+            raise ValueError("a memory-mapped batch is read-only; load(..., use_mmap=False) to extend it")
+        flags = DETECTED if result.drift_detected else 0
+        if result.drift is None:
+            flags |= DRIFT_UNSET
+        elif result.drift:
+            flags |= DRIFT
+        columns = self.columns
+        columns["drift_score"].append(result.drift_score)
+        columns["tier"].append(TIER_NONE if result.tier is None else int(result.tier))
+        columns["flags"].append(flags)
+        columns["label"].append(self._code(self.labels, self._label_codes, result.label))
+        columns["rationale"].append(self._code(self.rationales, self._rationale_codes, result.rationale))
+
+    def extend(self, results: Iterable[DriftResult]):
+        for result in results:
+            self.append(result)
+
+    # === Access ===
+    def __len__(self) -> int:
+        return len(self.columns["drift_score"])
+
+    def __getitem__(self, index: int) -> DriftResult:
+        columns = self.columns
+        flags = columns["flags"][index]
+        tier = columns["tier"][index]
+        label = self.labels[columns["label"][index]]
+        drift = None if flags & DRIFT_UNSET else bool(flags & DRIFT)
+        return DriftResult(
+            drift_detected=bool(flags & DETECTED),
+            drift=drift,
+            label=label,
+            rationale=self.rationales[columns["rationale"][index]],
+            drift_score=columns["drift_score"][index],
+            tone_badge=compute_tone_badge(label, bool(drift)),
+            tier=None if tier == TIER_NONE else str(tier),
+        )
+
+    def __iter__(self) -> Iterator[DriftResult]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def label_counts(self) -> Dict[str, int]:
+        counts = Counter(self.columns["label"])
+        return {self.labels[code]: n for code, n in counts.most_common()}
+
+    def drift_count(self) -> int:
+        return sum(1 for flags in self.columns["flags"] if flags & DRIFT)
+
+    def mean_score(self) -> float:
+        n = len(self)
+        return sum(self.columns["drift_score"]) / n if n else 0.0
+
+    # === Binary file ===
+    def save(self, path: str):
+        """Write a flat file, in native byte order, that ``load`` can memory-map."""
+        lengths = {name: len(self.columns[name]) * self.columns[name].itemsize for name, _ in COLUMNS}
+        offsets, position = {}, 0
+        for name, _ in COLUMNS:
+            offsets[name] = position
+            position += lengths[name] + _pad(lengths[name])
+        header = json.dumps({
+            "count": len(self),
+            "byteorder": sys.byteorder,
+            "labels": self.labels,
+            "rationales": self.rationales,
+            "columns": [
+                {"name": name, "type": code, "itemsize": self.columns[name].itemsize, "offset": offsets[name]}
+                for name, code in COLUMNS
+            ],
+        }, ensure_ascii=False).encode("utf-8")
+        prefix = len(MAGIC) + 8
+        header += b" " * _pad(prefix + len(header))
+
+        with open(path, "wb") as f:
+            f.write(MAGIC)
+            f.write(len(header).to_bytes(8, "little"))
+            f.write(header)
+            for name, _ in COLUMNS:
+                f.write(memoryview(self.columns[name]).cast("B"))
+                f.write(b"\0" * _pad(lengths[name]))
+
+    @classmethod
+    def load(cls, path: str, use_mmap: bool = True) -> "DriftResultBatch":
+        """Open a file written by ``save``; with ``use_mmap`` the columns are read-only views."""
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a drift result batch file")
+            header_length = int.from_bytes(f.read(8), "little")
+            header = json.loads(f.read(header_length).decode("utf-8"))
+            data_start = f.tell()
+            swap = header["byteorder"] != sys.byteorder
+            if use_mmap and swap:
+                raise ValueError(f"{path} was written on a {header['byteorder']}-endian machine; load with use_mmap=False")
+            if use_mmap:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                buffer = f.read()
+                data_start = 0
+
+        batch = cls()
+        count = header["count"]
+        view = memoryview(buffer)
+        for column in header["columns"]:
+            name, code = column["name"], column["type"]
+            if array(code).itemsize != column["itemsize"]:
+                raise ValueError(f"{path}: column {name} has {column['itemsize']}-byte items, expected {array(code).itemsize}")
+            start = data_start + column["offset"]
+            raw = view[start: start + count * column["itemsize"]]
+            if use_mmap:
+                batch.columns[name] = raw.cast(code)
+            else:
+                values = array(code)
+                values.frombytes(raw)
+                if swap:
+                    values.byteswap()
+                batch.columns[name] = values
+        batch._set_tables(header["labels"], header["rationales"])
+        if use_mmap:
+            batch._mmap = buffer
+        return batch
+
+    def _set_tables(self, labels: List[str], rationales: List[str]):
+        self.labels, self.rationales = list(labels), list(rationales)
+        self._label_codes = {value: code for code, value in enumerate(self.labels)}
+        self._rationale_codes = {value: code for code, value in enumerate(self.rationales)}
+
+    def close(self):
+        """Release a memory-mapped file; the batch is empty afterwards."""
+        if self._mmap is None:
+            return
+        for column in self.columns.values():
+            column.release()
+        self._mmap.close()
+        self._mmap = None
+        self.columns = {name: array(code) for name, code in COLUMNS}
+
+    # === Parquet ===
+    def to_parquet(self, path: str, **kwargs):
+        """Write the columns as a Parquet file, label and rationale dictionary-encoded."""
+        pa, pq = _pyarrow()
+        arrays, names = [], []
+        for name, code in COLUMNS:
+            values = pa.Array.from_buffers(_ARROW_TYPES[code](pa), len(self), [None, pa.py_buffer(self.columns[name])])
+            if name == "label":
+                values = pa.DictionaryArray.from_arrays(values, pa.array(self.labels, pa.string()))
+            elif name == "rationale":
+                values = pa.DictionaryArray.from_arrays(values, pa.array(self.rationales, pa.string()))
+            arrays.append(values)
+            names.append(name)
+        pq.write_table(pa.Table.from_arrays(arrays, names=names), path, **kwargs)
+
+    @classmethod
+    def from_parquet(cls, path: str) -> "DriftResultBatch":
+        """Read a file written by ``to_parquet`` straight into columns."""
+        pa, pq = _pyarrow()
+        table = pq.read_table(path, columns=[name for name, _ in COLUMNS], read_dictionary=["label", "rationale"])
+        batch = cls()
+        for name, code in COLUMNS:
+            target = batch.columns[name]
+            for chunk in table.column(name).chunks:
+                if name in ("label", "rationale"):
+                    strings, codes = ((batch.labels, batch._label_codes) if name == "label"
+                                      else (batch.rationales, batch._rationale_codes))
+                    remap = [batch._code(strings, codes, value) for value in chunk.dictionary.to_pylist()]
+                    # Parquet hands indices back as int32 whatever was written; narrow before viewing
+                    local = _arrow_values(chunk.indices.cast(_ARROW_TYPES[code](pa)), code)
+                    if remap == list(range(len(remap))):
+                        target.extend(local)
+                    else:
+                        target.extend(remap[i] for i in local)
+                else:
+                    target.extend(_arrow_values(chunk, code))
+        return batch
+
+
+# === pyarrow (optional) ===
+_ARROW_TYPES = {
+    "d": lambda pa: pa.float64(),
+    "h": lambda pa: pa.int16(),
+    "B": lambda pa: pa.uint8(),
+    "i": lambda pa: pa.int32(),
+}
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError("Parquet export needs pyarrow (pip install pyarrow)") from e
+    return pyarrow, pyarrow.parquet
+
+
+def _arrow_values(values, code: str) -> memoryview:
+    """The data buffer of a null-free primitive Arrow array, as a typed view."""
+    if values.null_count:
+        raise ValueError("unexpected nulls in a drift result column")
+    view = memoryview(values.buffers()[1]).cast(code)
+    return view[values.offset: values.offset + len(values)]
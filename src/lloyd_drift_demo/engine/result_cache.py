@@ -0,0 +1,246 @@
+"""Opt-in memoization of stateless analyze_drift results.
+
+Without a memory or conversation_id, a drift result depends only on the two
+texts and the engine configuration. Traffic repeats itself ("ok", canned
+replies, bot messages), so those results are worth keeping. Entries are
+keyed by a 16-byte BLAKE2b digest of the exact (baseline, incoming) pair
+plus a fingerprint of the configuration that was active. Changing the
+polarity backend, rules, lexicons or similarity cap therefore misses rather
+than serving stale results.
+
+The in-memory LRU is bounded by entry count and by an estimate of its size
+in bytes. It is disabled until ``configure_result_cache(enabled=True)``.
+With a ``path``, entries are also written to a sqlite file in WAL mode, in
+short batches so no process holds the write lock for long. Processes that
+open the same file (e.g. ParallelDriftEngine workers) see each other's
+written results. A process forked with persistence on reconnects to the
+file on its first disk access, rather than using the parent's connection.
+"""
+
+import os
+import atexit
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import sqlite3
+
+# === Defaults ===
+DEFAULT_MAX_ENTRIES = 100_000
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+ENTRY_OVERHEAD = 240       # approximate bytes per entry besides its strings
+DISK_COMMIT_EVERY = 256
+
+# DriftResult's fields, in declaration order
+CachedResult = Tuple
+
+
+def result_key(baseline: str, incoming: str, fingerprint: bytes) -> bytes:
+    """Content hash of one scoring call; the length prefix keeps (a, bc) and (ab, c) apart."""
+    digest = hashlib.blake2b(fingerprint, digest_size=16)
+    encoded = baseline.encode("utf-8", "surrogatepass")
+    digest.update(len(encoded).to_bytes(8, "little"))
+    digest.update(encoded)
+    digest.update(incoming.encode("utf-8", "surrogatepass"))
+    return digest.digest()
+
+
+class ResultCache:
+    """Process-wide LRU of result key → DriftResult fields, with optional sqlite backing.
+
+    Thread-safe. As with PolarityCache, scoring happens outside the lock.
+    Two threads racing on the same pair may both score it; the result is
+    identical.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES,
+                 path: Optional[str] = None, enabled: bool = False):
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.path: Optional[str] = None
+        self.bytes = 0
+        self._data: "OrderedDict[bytes, CachedResult]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional["sqlite3.Connection"] = None
+        self._db_pid: Optional[int] = None
+        self._pending: List[Tuple[bytes, str]] = []   # written to sqlite in one short transaction
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_hits = 0
+        if path:
+            self.enable_persistence(path)
+
+    # === Lookup ===
+    def get(self, key: bytes) -> Optional[CachedResult]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return value
+            value = self._disk_get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._insert(key, value)
+            return value
+
+    def put(self, key: bytes, value: CachedResult):
+        with self._lock:
+            if key in self._data:
+                return
+            self._insert(key, value)
+            self._disk_put(key, value)
+
+    @staticmethod
+    def _size(value: CachedResult) -> int:
+        return ENTRY_OVERHEAD + sum(len(field) for field in value if isinstance(field, str))
+
+    def _insert(self, key: bytes, value: CachedResult):
+        self._data[key] = value
+        self.bytes += self._size(value)
+        self._evict()
+
+    def _evict(self):
+        while self._data and (len(self._data) > self.max_entries or self.bytes > self.max_bytes):
+            _, value = self._data.popitem(last=False)
+            self.bytes -= self._size(value)
+            self.evictions += 1
+
+    # === Persistence (opt-in) ===
+    def enable_persistence(self, path: str):
+        """Write through to a sqlite file shared by every process that opens it."""
+        with self._lock:
+            self._forget_inherited_db()
+            self._close_db()
+            self._connect(path)
+
+    def _connect(self, path: str):
+        import sqlite3
+
+        db = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute("CREATE TABLE IF NOT EXISTS results (key BLOB PRIMARY KEY, result TEXT NOT NULL)")
+        self._db = db
+        self._db_pid = os.getpid()
+        self.path = path
+
+    def _forget_inherited_db(self):
+        if self._db is not None and self._db_pid != os.getpid():
+            self._db = None     # inherited across fork; the parent still owns that connection
+            self._pending = []
+
+    def _live_db(self) -> Optional["sqlite3.Connection"]:
+        # Caller holds the lock. A forked child opens its own connection to the same file.
+        if self._db is not None and self._db_pid != os.getpid():
+            self._forget_inherited_db()
+            self._connect(self.path)
+        return self._db
+
+    def _disk_get(self, key: bytes) -> Optional[CachedResult]:
+        if self._live_db() is None:
+            return None
+        row = self._db.execute("SELECT result FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        self.disk_hits += 1
+        return tuple(json.loads(row[0]))
+
+    def _disk_put(self, key: bytes, value: CachedResult):
+        if self._live_db() is None:
+            return
+        self._pending.append((key, json.dumps(value, ensure_ascii=False)))
+        if len(self._pending) >= DISK_COMMIT_EVERY:
+            self._write_pending()
+
+    def _write_pending(self):
+        # Other processes write to the same file, so the write lock is only held for this batch
+        import sqlite3
+
+        if self._db is None or not self._pending:
+            return
+        try:
+            with self._db:
+                self._db.executemany("INSERT OR IGNORE INTO results (key, result) VALUES (?, ?)", self._pending)
+        except sqlite3.OperationalError:
+            pass    # still locked after the timeout; these results stay in memory only
+        self._pending = []
+
+    def flush(self):
+        with self._lock:
+            self._forget_inherited_db()
+            self._write_pending()
+
+    def _close_db(self):
+        if self._db is not None:
+            self._write_pending()
+            self._db.close()
+            self._db = None
+            self.path = None
+
+    def close(self):
+        with self._lock:
+            self._forget_inherited_db()
+            self._close_db()
+
+    # === Introspection ===
+    def settings(self) -> dict:
+        """Keyword arguments for configure_result_cache that reproduce this cache elsewhere (e.g. in a worker)."""
+        return {"enabled": self.enabled, "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes, "path": self.path}
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.bytes = 0
+            self.hits = self.misses = self.evictions = self.disk_hits = 0
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "size": len(self._data),
+                "approx_bytes": self.bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "disk_hits": self.disk_hits,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+RESULT_CACHE = ResultCache()
+atexit.register(RESULT_CACHE.close)
+
+
+def configure_result_cache(
+    enabled: Optional[bool] = None,
+    max_entries: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    path: Optional[str] = None,
+) -> ResultCache:
+    """Turn memoization of stateless calls on or off, resize it, and/or attach a shared sqlite file."""
+    if enabled is not None:
+        RESULT_CACHE.enabled = enabled
+    with RESULT_CACHE._lock:
+        if max_entries is not None:
+            RESULT_CACHE.max_entries = max_entries
+        if max_bytes is not None:
+            RESULT_CACHE.max_bytes = max_bytes
+        RESULT_CACHE._evict()
+    if path is not None and path != RESULT_CACHE.path:
+        RESULT_CACHE.enable_persistence(path)
+    return RESULT_CACHE
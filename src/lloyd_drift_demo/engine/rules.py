@@ -0,0 +1,117 @@
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Tuple
+
+# (label, weight, rationale) — what an override rule contributes when it fires
+Candidate = Tuple[str, float, str]
+
+_UNSET = object()
+
+
+@dataclass(frozen=True)
+class Rule:
+    """One override check with the weight it can win with and a rough cost.
+
+    ``check(baseline, incoming, memory)`` returns ``True`` to fire with the
+    rule's own label/weight/rationale, a ``Candidate`` for rules whose
+    outcome varies (``weight`` is then its upper bound), or a falsy value.
+    ``cost`` is a relative estimate: ~1 for string tests, ~10 for difflib,
+    ~50 for a sentiment parse. An ``incoming_only`` rule reads nothing but
+    the incoming text. Its outcome is memoized on that text's feature
+    bundle, so it is evaluated once per message even when the message is
+    scored against many baselines.
+    """
+    name: str
+    weight: float
+    cost: float
+    check: Callable[..., Any]
+    label: Optional[str] = None
+    rationale: Optional[str] = None
+    index: int = 0  # registration order; breaks weight ties like max() over a list did
+    incoming_only: bool = False
+
+
+class RuleRegistry:
+    """Override rules, evaluated exhaustively or by a short-circuiting planner.
+
+    The planner runs rules by descending weight, cheapest first within a
+    weight, and stops as soon as no remaining rule could beat the current
+    best. Ties go to the earlier-registered rule, so both modes select the
+    same winner.
+    """
+
+    def __init__(self):
+        self._rules: List[Rule] = []
+        self._plan: List[Rule] = []
+        self.version = 0  # bumped on every registration; lets result caches notice rule changes
+
+    def rule(self, name: str, weight: float, cost: float = 1.0,
+             label: Optional[str] = None, rationale: Optional[str] = None, incoming_only: bool = False):
+        """Decorator registering ``check`` as a rule."""
+        def decorator(check: Callable[..., Any]) -> Callable[..., Any]:
+            self.register(Rule(name, weight, cost, check, label, rationale, incoming_only=incoming_only))
+            return check
+        return decorator
+
+    def register(self, rule: Rule):
+        self._rules = [r for r in self._rules if r.name != rule.name]
+        self._rules.append(rule)
+        self._rules = [
+            Rule(r.name, r.weight, r.cost, r.check, r.label, r.rationale, index, r.incoming_only)
+            for index, r in enumerate(self._rules)
+        ]
+        self._plan = sorted(self._rules, key=lambda r: (-r.weight, r.cost, r.index))
+        self.version += 1
+
+    @property
+    def rules(self) -> List[Rule]:
+        return list(self._rules)
+
+    @property
+    def plan(self) -> List[Rule]:
+        return list(self._plan)
+
+    @staticmethod
+    def _fire(rule: Rule, baseline, incoming, memory) -> Optional[Candidate]:
+        outcomes = getattr(incoming, "rule_outcomes", None) if rule.incoming_only else None
+        if outcomes is None:
+            outcome = rule.check(baseline, incoming, memory)
+        else:
+            outcome = outcomes.get(rule.check, _UNSET)
+            if outcome is _UNSET:
+                outcome = outcomes[rule.check] = rule.check(baseline, incoming, memory)
+        if not outcome:
+            return None
+        if outcome is True:
+            return rule.label or rule.name, rule.weight, rule.rationale or ""
+        return outcome
+
+    def evaluate_all(self, baseline, incoming, memory=None, fire=None) -> List[Candidate]:
+        """Every firing rule's candidate, in registration order.
+
+        ``fire`` replaces ``_fire`` for every rule, e.g. with a timing wrapper.
+        """
+        fire = fire or self._fire
+        candidates = []
+        for rule in self._rules:
+            candidate = fire(rule, baseline, incoming, memory)
+            if candidate is not None:
+                candidates.append(candidate)
+        return candidates
+
+    def best(self, baseline, incoming, memory=None, fire=None) -> Optional[Candidate]:
+        """The candidate ``max(evaluate_all(...), key=weight)`` would pick, evaluating as few rules as possible."""
+        fire = fire or self._fire
+        best: Optional[Candidate] = None
+        best_index = -1
+        for rule in self._plan:
+            if best is not None:
+                if rule.weight < best[1]:
+                    break
+                if rule.weight == best[1] and rule.index > best_index:
+                    continue
+            candidate = fire(rule, baseline, incoming, memory)
+            if candidate is None:
+                continue
+            if best is None or candidate[1] > best[1] or (candidate[1] == best[1] and rule.index < best_index):
+                best, best_index = candidate, rule.index
+        return best
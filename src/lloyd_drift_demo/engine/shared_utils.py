@@ -1,30 +1,36 @@
-import difflib
-import re
-from textblob import TextBlob
 from typing import Optional
 
+from .polarity_cache import POLARITY_CACHE
+from .polarity_backends import backend_polarity
+from .similarity import overlap_exceeds
+from .lexicon import LEXICON_MATCHER
+from . import patterns
+
 # === Constants ===
 EMPHASIS_OVERRIDE = 2.5
 EMPHASIS_ECHO_MARGIN = 1.0
 DRIFT_THRESHOLD = 0.5
+SHARED_ROOT_THRESHOLD = 0.6
 
 # === Emphasis Scoring ===
 def symbolic_emphasis_score(text: str) -> float:
     caps = sum(1 for c in text if c.isupper())
     excl = text.count("!")
     qmark = text.count("?")
-    emoji = len(re.findall(r"[😂🤣😡😢😍😭❤️]", text))
+    emoji = patterns.count_emoji(text, patterns.EMPHASIS_EMOJI)
     return 0.3 * caps + 0.5 * excl + 0.5 * qmark + 0.5 * emoji
 
 # === Polarity ===
+def raw_polarity_score(text: str) -> float:
+    """Unrounded polarity from the active backend (TextBlob by default), served from the shared LRU cache."""
+    return POLARITY_CACHE.get_or_compute(text, backend_polarity)
+
 def get_polarity_score(text: str) -> float:
-    blob = TextBlob(text)
-    polarity = float(blob.sentiment.polarity)  # type: ignore[attr-defined]
-    return round(polarity, 3)
+    return round(raw_polarity_score(text), 3)
 
 # === Symbolic Override ===
 def detect_symbolic_override(text: str) -> Optional[str]:
-    if re.search(r"\b(OMG|WTF|awe|wonder|divine|miracle|sacred|heavens?)\b", text.lower()):
+    if patterns.SYMBOLIC_OVERRIDE.search(text.lower()):
         return "symbolic_override"
     return None
 
@@ -52,27 +58,20 @@ def is_emphasis_override(baseline: str, incoming: str) -> bool:
 
 # === Emoji Emphasis Override ===
 def is_emoji_override(baseline: str,incoming: str) -> bool:
-    emoji_count = len(re.findall(r"[😂🤣😡😢😍😭❤️]", incoming))
+    emoji_count = patterns.count_emoji(incoming, patterns.EMPHASIS_EMOJI)
     return emoji_count >= 2
 
 # === Negation Amplified ===
 def is_negation_amplified(baseline: str, incoming: str) -> bool:
-    neg = re.search(r"\b(don’t|not|never)\b", incoming.lower())
-    blob_base = TextBlob(baseline)
-    blob_inc = TextBlob(incoming)
-    return bool(neg) and (float(blob_base.sentiment.polarity) > 0 and float(blob_inc.sentiment.polarity) <= 0)  # type: ignore[attr-defined]
+    neg = patterns.NEGATORS_STRICT.search(incoming.lower())
+    return bool(neg) and (raw_polarity_score(baseline) > 0 and raw_polarity_score(incoming) <= 0)
 
 def is_gray_zone_ambiguous(baseline: str, incoming: str, slope: float = 0.0) -> bool:
-    gray_zone_terms = [
-        "dead right", "i'm dying", "kill me", "rip me", "drop dead", "just shoot me", 
-        "lol i'm dead", "dead inside", "bury me", "i'm toast", "end me", "rip my soul",
-        "you're killing me", "he's killing me", "this is killing me"
-    ]
     direction = get_directional_target(incoming)
     norm_inc = normalize(incoming)
 
     return (
-        any(phrase in norm_inc for phrase in gray_zone_terms)
+        bool(LEXICON_MATCHER.match(norm_inc)["gray_zone"])
         and direction in {"self", "other"}
         and slope < -0.2
     )
@@ -85,7 +84,7 @@ def is_rhetorical_drift(baseline: str, incoming: str) -> bool:
 
 # === Sarcasm Hint ===
 def has_sarcasm_hint(incoming: str) -> bool:
-    return re.search(r"/s\b|🙃|sure\.", incoming.lower()) is not None
+    return patterns.SARCASM_MARKERS.search(incoming.lower()) is not None
 
 def compute_emphasis_score(text: str) -> float:
     return symbolic_emphasis_score(text)
@@ -94,23 +93,22 @@ def compute_polarity_score(text: str) -> float:
     return get_polarity_score(text)
 
 def shared_root(text1: str, text2: str) -> bool:
-    seq = difflib.SequenceMatcher(None, text1.lower(), text2.lower())
-    return seq.quick_ratio() > 0.6
+    return overlap_exceeds(text1.lower(), text2.lower(), SHARED_ROOT_THRESHOLD)
 
 def is_uppercase_yelling(text: str) -> bool:
     return text.isupper() and len(text) >= 4
 
 def get_directional_target(text: str) -> str:
     text = text.lower()
-    if re.search(r"\b(i|me|myself)\b", text):
+    if patterns.TARGET_SELF.search(text):
         return "self"
-    elif re.search(r"\b(you|your|you're|u)\b", text):
+    elif patterns.TARGET_OTHER.search(text):
         return "other"
-    elif re.search(r"\b(he|she|they|this|that|it)\b", text):
+    elif patterns.TARGET_AMBIENT.search(text):
         return "ambient"
     return "unknown"
 
 def normalize(text: str) -> str:
-    return re.sub(r"[^\w\s]", "", text.lower()).strip()
+    return patterns.NON_WORD.sub("", text.lower()).strip()
 
 get_sentiment_polarity = get_polarity_score
\ No newline at end of file
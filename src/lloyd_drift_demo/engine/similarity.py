@@ -0,0 +1,119 @@
+"""Bounded-cost string similarity for the mirror and shared-root checks.
+
+``SequenceMatcher.ratio()`` is quadratic in the worst case, so a single
+pasted 20 KB message can stall a worker. The helpers here reach the same
+decisions as the bare difflib calls more cheaply:
+
+1. Length bound. ``ratio() = 2M / (len(a) + len(b))`` and the matched
+   characters M are at most ``min(len(a), len(b))``. If that bound is not
+   above the threshold, the answer is already no.
+2. Character-overlap bound. The multiset intersection of characters
+   (difflib's ``quick_ratio``) is linear and is also an upper bound on
+   ``ratio()``.
+3. Exact ``ratio()``. It runs only when both bounds pass and the two texts
+   together fit in ``max_length``.
+
+Both bounds are exact, so decisions below the cap match difflib.
+
+Above the cap, the result is approximate. ``ratio()`` is replaced by the
+Dice coefficient of character trigram sets (derived from their Jaccard
+index). That score is computed over evenly spaced windows totalling at most
+``max_length`` characters per text, so the cost stays linear in
+``max_length`` however long the input is. The approximation tracks
+``ratio()`` closely for near-duplicates and drops faster for reordered
+text, so borderline long texts can land on either side of the threshold.
+"""
+
+from collections import Counter
+from typing import Optional, Set
+
+# === Defaults ===
+DEFAULT_MAX_LENGTH = 4000   # combined characters above which the approximate path is used
+NGRAM_SIZE = 3
+SAMPLE_WINDOW = 256         # characters per window when sampling an over-cap text
+
+SIMILARITY_MAX_LENGTH = DEFAULT_MAX_LENGTH
+
+
+# === Bounds ===
+def length_bound(a: str, b: str) -> float:
+    """Upper bound on ``SequenceMatcher(None, a, b).ratio()`` from lengths alone."""
+    total = len(a) + len(b)
+    return 2.0 * min(len(a), len(b)) / total if total else 1.0
+
+
+def char_overlap(a: str, b: str) -> float:
+    """``SequenceMatcher(None, a, b).quick_ratio()`` without building difflib's index."""
+    total = len(a) + len(b)
+    if not total:
+        return 1.0
+    counts = Counter(a)
+    matches = 0
+    for ch in b:
+        left = counts.get(ch, 0)
+        if left > 0:
+            counts[ch] = left - 1
+            matches += 1
+    return 2.0 * matches / total
+
+
+# === Approximation ===
+def sample(text: str, budget: int, window: int = SAMPLE_WINDOW) -> str:
+    """``text`` itself if it fits in ``budget``, else evenly spaced windows totalling ``budget``."""
+    if len(text) <= budget:
+        return text
+    count = max(1, budget // window)
+    window = budget // count
+    stride = (len(text) - window) / max(1, count - 1)
+    return "".join(text[int(i * stride): int(i * stride) + window] for i in range(count))
+
+
+def ngrams(text: str, n: int = NGRAM_SIZE) -> Set[str]:
+    if len(text) < n:
+        return {text} if text else set()
+    return {text[i: i + n] for i in range(len(text) - n + 1)}
+
+
+def ngram_jaccard(a: str, b: str, n: int = NGRAM_SIZE) -> float:
+    grams_a, grams_b = ngrams(a, n), ngrams(b, n)
+    union = len(grams_a | grams_b)
+    return len(grams_a & grams_b) / union if union else 1.0
+
+
+def approximate_ratio(a: str, b: str, max_length: int = DEFAULT_MAX_LENGTH) -> float:
+    """Trigram Dice coefficient over bounded samples — stands in for ``ratio()`` above the cap."""
+    jaccard = ngram_jaccard(sample(a, max_length // 2), sample(b, max_length // 2))
+    return 2 * jaccard / (1 + jaccard)
+
+
+# === Decisions ===
+def ratio_exceeds(a: str, b: str, threshold: float, max_length: Optional[int] = None) -> bool:
+    """``SequenceMatcher(None, a, b).ratio() > threshold`` with bounded cost; see the module docstring."""
+    max_length = SIMILARITY_MAX_LENGTH if max_length is None else max_length
+    if length_bound(a, b) <= threshold:
+        return False
+    if len(a) + len(b) > max_length:
+        return approximate_ratio(a, b, max_length) > threshold
+    if char_overlap(a, b) <= threshold:
+        return False
+    import difflib
+
+    return difflib.SequenceMatcher(None, a, b).ratio() > threshold
+
+
+def overlap_exceeds(a: str, b: str, threshold: float, max_length: Optional[int] = None) -> bool:
+    """``SequenceMatcher(None, a, b).quick_ratio() > threshold``; over the cap, on sampled windows."""
+    max_length = SIMILARITY_MAX_LENGTH if max_length is None else max_length
+    if length_bound(a, b) <= threshold:
+        return False
+    if len(a) + len(b) > max_length:
+        a, b = sample(a, max_length // 2), sample(b, max_length // 2)
+    return char_overlap(a, b) > threshold
+
+
+def configure_similarity(max_length: Optional[int] = None) -> int:
+    """Set the combined-length cap above which similarity checks are approximate."""
+    global SIMILARITY_MAX_LENGTH
+    if max_length is not None:
+        SIMILARITY_MAX_LENGTH = max_length
+    return SIMILARITY_MAX_LENGTH
@@ -0,0 +1,36 @@
+import os
+
+import pytest
+
+from lloyd_drift_demo.engine.drift_engine import analyze_drift_batch
+from lloyd_drift_demo.engine.result_batch import DriftResultBatch
+
+PAIRS = [
+    ("I love this.", "I hate this!"),
+    ("I'm fine.", "I SAID I'M FINE!!!"),
+    ("Great job.", "Great job..."),
+    ("You helped a lot.", "You helped a lot?"),
+    ("Sure", "Sure 😂😂"),
+    ("AI", "GPT"),
+    ("I'm doing fine.", "Maybe not."),
+] * 3
+
+
+def test_parquet_round_trip(tmp_path):
+    pytest.importorskip("pyarrow")
+    batch = DriftResultBatch(analyze_drift_batch(PAIRS))
+    path = os.path.join(tmp_path, "results.parquet")
+    batch.to_parquet(path)
+    loaded = DriftResultBatch.from_parquet(path)
+    assert list(loaded) == list(batch)
+    assert loaded.label_counts() == batch.label_counts()
+
+
+def test_binary_round_trip(tmp_path):
+    batch = DriftResultBatch(analyze_drift_batch(PAIRS))
+    path = os.path.join(tmp_path, "results.bin")
+    batch.save(path)
+    for use_mmap in (True, False):
+        loaded = DriftResultBatch.load(path, use_mmap=use_mmap)
+        assert list(loaded) == list(batch)
+        loaded.close()
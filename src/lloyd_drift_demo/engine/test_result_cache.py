@@ -0,0 +1,42 @@
+import pytest
+
+from lloyd_drift_demo.drift_types import DriftMemory
+from lloyd_drift_demo.engine.config import DriftEngineConfig
+from lloyd_drift_demo.engine.drift_engine import DriftEngine, analyze_drift, config_fingerprint
+from lloyd_drift_demo.engine.memory_store import MemoryStore
+from lloyd_drift_demo.engine.result_cache import RESULT_CACHE, configure_result_cache
+
+
+@pytest.fixture
+def result_cache():
+    configure_result_cache(enabled=True)
+    RESULT_CACHE.clear()
+    yield RESULT_CACHE
+    configure_result_cache(enabled=False)
+    RESULT_CACHE.clear()
+
+
+def test_repeat_call_hits(result_cache):
+    first = analyze_drift("I love this.", "I hate this!")
+    assert result_cache.stats()["misses"] == 1
+    assert analyze_drift("I love this.", "I hate this!") == first
+    stats = result_cache.stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+    analyze_drift("I love this.", "I hate that!")
+    assert result_cache.stats()["misses"] == 2
+
+
+def test_stateful_calls_bypass(result_cache):
+    analyze_drift("I'm fine.", "I SAID I'M FINE!!!", memory=DriftMemory())
+    analyze_drift("I'm fine.", "I SAID I'M FINE!!!", conversation_id="c1", store=MemoryStore())
+    stats = result_cache.stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (0, 0, 0)
+
+
+def test_rare_tags_leave_fingerprint_unchanged(result_cache):
+    before = config_fingerprint()
+    analyze_drift("Great job.", "Great job...")
+    DriftEngine(DriftEngineConfig(rare_tags={"zzz"}))
+    assert config_fingerprint() == before
+    analyze_drift("Great job.", "Great job...")
+    assert result_cache.stats()["hits"] == 1
@@ -3,10 +3,10 @@
 """
 ⚠️ SKETCH MODULE — NOT IN USE ⚠️
 
-This module demonstrates a *mocked* token-level sentiment heatmap.
-It's not part of the active LLOYD pipeline. The 'transformers' and 'nltk' imports
-will fail unless the libraries are installed. Real implementation would require
-integrating with a proper model and tokenizer.
+This module sketched a *mocked* token-level sentiment heatmap. The engine's
+heatmap now lives in engine/heatmap.py and generate_token_heatmap delegates
+to it. A model-based version would still need the 'transformers' and 'nltk'
+imports below and a proper tokenizer.
 """
 
 # Mock sketch, comment out below if not installed:
@@ -15,16 +15,12 @@ integrating with a proper model and tokenizer.
 # nltk.download("punkt", quiet=True)
 # from nltk.tokenize import word_tokenize
 
-import re
-from typing import List, Dict
-import string
+from typing import Dict, List
 
-def generate_token_heatmap(text: str) -> dict:
-    # Placeholder token scoring
-    tokens = text.split()  # no nltk
-    scored_tokens = []
-    for word in tokens:
-        clean_word = word.strip(string.punctuation)
-        score = 1.0 if clean_word.lower() in ["disgusting", "outrageous", "horrible"] else 0.3
-        scored_tokens.append({"word": word, "score": round(score, 2)})
-    return {"tokens": scored_tokens}
\ No newline at end of file
+
+def generate_token_heatmap(text: str) -> Dict[str, List[dict]]:
+    # Placeholder keyword scoring has been replaced by the engine's heatmap
+    # (engine/heatmap.py); kept so older notebooks importing this still work.
+    from lloyd_drift_demo.engine.drift_engine import attach_token_heatmap
+
+    return attach_token_heatmap(text)
@@ -7,6 +7,10 @@ OVERRIDE_WEIGHTS = {
     "sarcasm_hint": 80,
     "negation_amplified": 75,
     "emphasis_override": 70,
+    # Ties with emphasis_override on purpose: the weight is also the reported
+    # drift_score, and 70 is the drift threshold. On a tie the earlier-registered
+    # rule wins (sign_flip is registered first in drift_engine).
+    "sign_flip": 70,
     "stable_rationale": 65,
     "emoji_emphasis_override": 60,
 }
@@ -0,0 +1,419 @@
+"""Local HTTP/JSON scoring service with dynamic micro-batching.
+
+    lloyd-drift serve --port 8765 --max-batch 64 --max-wait-ms 5
+
+    POST /drift   {"baseline": "...", "incoming": "...", "conversation_id": "optional"}
+    POST /chunks  {"text": "..."}
+    GET  /stats   queue depth, batch sizes, shed count, p50/p99 latency
+    GET  /metrics engine counters in Prometheus text format (rule timings with --metrics)
+    GET  /alerts  recent escalation alerts (with --escalation)
+    GET  /healthz
+
+Handler threads only parse and enqueue. A single scoring thread drains the
+queue into micro-batches — up to ``max_batch`` requests, waiting at most
+``max_wait`` for the batch to fill — and scores each batch with one
+``analyze_texts`` pass, so texts repeated across concurrent requests are
+analyzed once. Turns of a conversation are scored in arrival order. When
+``max_queue`` requests are already waiting, new ones get 429 immediately
+instead of queueing without bound. Connections are HTTP/1.1 keep-alive.
+
+A request that times out while still queued is cancelled and never scored,
+so a client retrying after a 504 does not record its turn twice. One that
+has already started is waited for and answered normally. ``/chunks`` texts
+are capped at ``MAX_CHUNKS_CHARS`` because they are scored on the same
+thread as every queued turn.
+
+With ``--escalation``, every turn that carries a conversation_id is fed to an
+EscalationMonitor as soon as it is scored. The alerts it fires come back in
+that turn's response under ``"alerts"``.
+"""
+
+import sys
+import json
+import time
+import queue
+import argparse
+import threading
+from collections import deque
+from dataclasses import asdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+from lloyd_drift_demo.engine.drift_engine import analyze_drift, analyze_chunks, analyze_texts, warm_up
+from lloyd_drift_demo.engine.escalation import DEFAULT_WINDOW, EscalationMonitor
+from lloyd_drift_demo.engine.instrumentation import INSTRUMENTS, enable_instrumentation
+from lloyd_drift_demo.engine.result_cache import DEFAULT_MAX_BYTES, configure_result_cache
+
+# === Defaults ===
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_MAX_BATCH = 64
+DEFAULT_MAX_WAIT = 0.005        # seconds a batch waits to fill once its first request arrives
+DEFAULT_MAX_QUEUE = 1024        # waiting requests beyond this are shed with 429
+DEFAULT_REQUEST_TIMEOUT = 10.0
+MAX_BODY_BYTES = 1 << 20
+MAX_CHUNKS_CHARS = 100_000      # /chunks text beyond this is rejected with 413
+LATENCY_WINDOW = 10_000         # most recent requests kept for percentiles
+
+
+class Overloaded(Exception):
+    """Raised when the scoring queue is full."""
+
+
+# Job states; transitions happen under MicroBatcher._lock
+_QUEUED, _RUNNING, _CANCELLED = range(3)
+
+
+class _Job:
+    __slots__ = ("kind", "payload", "done", "result", "error", "state")
+
+    def __init__(self, kind: str, payload: dict):
+        self.kind = kind
+        self.payload = payload
+        self.state = _QUEUED
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+# ——————————————
+# Latency tracking
+# ——————————————
+class LatencyTracker:
+    """Sliding window of request latencies with percentile summaries."""
+
+    def __init__(self, window: int = LATENCY_WINDOW):
+        self._samples: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentiles(self, *ps: float) -> Dict[str, float]:
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return {f"p{p:g}_ms": 0.0 for p in ps}
+        last = len(samples) - 1
+        return {f"p{p:g}_ms": round(samples[min(last, int(p / 100 * len(samples)))] * 1000, 3) for p in ps}
+
+
+# ——————————————
+# Micro-batcher
+# ——————————————
+class MicroBatcher:
+    """Bounded request queue drained by one scoring thread in micro-batches."""
+
+    def __init__(
+        self,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_wait: float = DEFAULT_MAX_WAIT,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        escalation: Optional[EscalationMonitor] = None,
+    ):
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max(0.0, max_wait)
+        self._queue: "queue.Queue[Optional[_Job]]" = queue.Queue(maxsize=max_queue)
+        self.escalation = escalation
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.scored = 0
+        self.shed = 0
+        self.cancelled = 0
+        self.largest_batch = 0
+        self._thread = threading.Thread(target=self._run, name="drift-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, kind: str, payload: dict, timeout: float = DEFAULT_REQUEST_TIMEOUT) -> Any:
+        """Queue one request and block until its batch has been scored."""
+        job = _Job(kind, payload)
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            with self._lock:
+                self.shed += 1
+            raise Overloaded("scoring queue is full")
+        if not job.done.wait(timeout):
+            with self._lock:
+                if job.state == _QUEUED:
+                    job.state = _CANCELLED
+                    self.cancelled += 1
+                    raise TimeoutError("scoring did not finish in time")
+            # Already scoring: its turn is being recorded, so answer with it rather than a 504
+            job.done.wait()
+        if job.error is not None:
+            raise job.error
+        return job.result
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            batch = [job]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    job = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if job is None:
+                    self._process(batch)
+                    return
+                batch.append(job)
+            self._process(batch)
+
+    def _process(self, batch: List[_Job]):
+        drift_jobs = [job for job in batch if job.kind == "drift"]
+        analyzed = analyze_texts(
+            text for job in drift_jobs for text in (job.payload["baseline"], job.payload["incoming"])
+        )
+        # Jobs run in arrival order so each conversation's memory sees its turns in order.
+        for job in batch:
+            with self._lock:
+                if job.state == _CANCELLED:
+                    continue
+                job.state = _RUNNING
+            try:
+                if job.kind == "drift":
+                    payload = job.payload
+                    conversation_id = payload.get("conversation_id")
+                    result = analyze_drift(
+                        analyzed[payload["baseline"]],
+                        analyzed[payload["incoming"]],
+                        conversation_id=conversation_id,
+                    )
+                    job.result = asdict(result)
+                    if self.escalation is not None and conversation_id is not None:
+                        job.result["alerts"] = [
+                            alert.to_dict() for alert in self.escalation.observe(conversation_id, result)
+                        ]
+                else:
+                    job.result = {"chunks": analyze_chunks(job.payload["text"])}
+            except Exception as e:
+                job.error = e
+            job.done.set()
+        with self._lock:
+            self.batches += 1
+            self.scored += len(batch)
+            self.largest_batch = max(self.largest_batch, len(batch))
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "queued": self._queue.qsize(),
+                "batches": self.batches,
+                "scored": self.scored,
+                "shed": self.shed,
+                "cancelled": self.cancelled,
+                "mean_batch": round(self.scored / self.batches, 2) if self.batches else 0.0,
+                "largest_batch": self.largest_batch,
+            }
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+
+
+# ——————————————
+# HTTP layer
+# ——————————————
+def _require_str(payload: dict, *fields: str):
+    for name in fields:
+        if not isinstance(payload.get(name), str):
+            raise ValueError(f"'{name}' must be a string")
+
+
+def _check_conversation_id(payload: dict):
+    # Conversation ids key the MemoryStore and EscalationMonitor: hashable, and snapshot-able
+    conversation_id = payload.get("conversation_id")
+    if conversation_id is not None and not (isinstance(conversation_id, str) or type(conversation_id) is int):
+        raise ValueError("'conversation_id' must be a string or an integer")
+
+
+class DriftRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # keep-alive
+    disable_nagle_algorithm = True  # headers and body go out as separate writes
+    server: "DriftServer"
+
+    def do_GET(self):
+        if self.path == "/healthz":
+            self._send(200, {"status": "ok"})
+        elif self.path == "/stats":
+            self._send(200, self.server.stats())
+        elif self.path == "/metrics":
+            self._send_bytes(200, INSTRUMENTS.prometheus().encode("utf-8"), "text/plain; version=0.0.4; charset=utf-8")
+        elif self.path == "/alerts" and self.server.batcher.escalation is not None:
+            self._send(200, {"alerts": [alert.to_dict() for alert in list(self.server.batcher.escalation.recent)]})
+        else:
+            self._send(404, {"error": "not found"})
+
+    def do_POST(self):
+        started = time.perf_counter()
+        kind = {"/drift": "drift", "/chunks": "chunks"}.get(self.path)
+        header = self.headers.get("Content-Length")
+        if header is None:
+            self.close_connection = True
+            self._send(411, {"error": "Content-Length required"})
+            return
+        try:
+            length = int(header)
+        except ValueError:
+            length = -1
+        if length < 0:
+            # The body's extent is unknown, so the connection cannot be reused
+            self.close_connection = True
+            self._send(400, {"error": "invalid Content-Length"})
+            return
+        if length > MAX_BODY_BYTES:
+            self.close_connection = True
+            self._send(413, {"error": "request body too large"})
+            return
+        body = self.rfile.read(length)
+        if kind is None:
+            self._send(404, {"error": "not found"})
+            return
+
+        try:
+            payload = json.loads(body or b"{}")
+            if not isinstance(payload, dict):
+                raise ValueError("request body must be a JSON object")
+            if kind == "drift":
+                _require_str(payload, "baseline", "incoming")
+                _check_conversation_id(payload)
+            else:
+                _require_str(payload, "text")
+        except ValueError as e:
+            self._send(400, {"error": str(e)})
+            return
+        if kind == "chunks" and len(payload["text"]) > MAX_CHUNKS_CHARS:
+            self._send(413, {"error": f"'text' is longer than {MAX_CHUNKS_CHARS} characters"})
+            return
+
+        try:
+            result = self.server.batcher.submit(kind, payload, self.server.request_timeout)
+        except Overloaded as e:
+            self._send(429, {"error": str(e)}, {"Retry-After": "1"})
+            return
+        except TimeoutError as e:
+            self._send(504, {"error": str(e)})
+            return
+        except Exception as e:
+            self._send(500, {"error": f"{type(e).__name__}: {e}"})
+            return
+        self._send(200, result)
+        self.server.latency.record(time.perf_counter() - started)
+
+    def _send(self, status: int, payload: dict, headers: Optional[Dict[str, str]] = None):
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self._send_bytes(status, data, "application/json; charset=utf-8", headers)
+
+    def _send_bytes(self, status: int, data: bytes, content_type: str, headers: Optional[Dict[str, str]] = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class DriftServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128        # listen backlog; socketserver's default of 5 resets bursts of connects
+
+    def __init__(
+        self,
+        address=(DEFAULT_HOST, DEFAULT_PORT),
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_wait: float = DEFAULT_MAX_WAIT,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+        verbose: bool = False,
+        escalation: Optional[EscalationMonitor] = None,
+    ):
+        super().__init__(address, DriftRequestHandler)
+        self.batcher = MicroBatcher(max_batch, max_wait, max_queue, escalation)
+        self.latency = LatencyTracker()
+        self.request_timeout = request_timeout
+        self.verbose = verbose
+
+    def stats(self) -> dict:
+        stats = self.batcher.stats()
+        stats.update(self.latency.percentiles(50, 99))
+        if self.batcher.escalation is not None:
+            stats["escalation"] = self.batcher.escalation.stats()
+        return stats
+
+    def server_close(self):
+        super().server_close()
+        self.batcher.close()
+
+
+# ——————————————
+# Entry point
+# ——————————————
+def build_parser(parser: Optional[argparse.ArgumentParser] = None) -> argparse.ArgumentParser:
+    parser = parser or argparse.ArgumentParser(description="Serve analyze_drift/analyze_chunks over HTTP.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH, help="requests scored per micro-batch")
+    parser.add_argument("--max-wait-ms", type=float, default=DEFAULT_MAX_WAIT * 1000,
+                        help="how long a batch waits to fill after its first request")
+    parser.add_argument("--max-queue", type=int, default=DEFAULT_MAX_QUEUE,
+                        help="waiting requests before new ones are rejected with 429")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_REQUEST_TIMEOUT, help="per-request timeout in seconds")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    parser.add_argument("--metrics", action="store_true", help="record per-rule timings and label/tier counters for /metrics")
+    parser.add_argument("--trace-rate", type=float, default=0.0,
+                        help="with --metrics, fraction of calls traced in full (kept in memory, not printed)")
+    parser.add_argument("--result-cache", action="store_true",
+                        help="memoize results of requests without a conversation_id")
+    parser.add_argument("--result-cache-path", help="with --result-cache, sqlite file shared with other processes")
+    parser.add_argument("--result-cache-mb", type=float, default=DEFAULT_MAX_BYTES / 2**20,
+                        help="with --result-cache, approximate memory budget in MiB")
+    parser.add_argument("--escalation", action="store_true",
+                        help="return windowed escalation alerts with each conversation turn")
+    parser.add_argument("--escalation-window", type=int, default=DEFAULT_WINDOW,
+                        help="with --escalation, turns in the sliding window")
+    return parser
+
+
+def run(args: argparse.Namespace) -> int:
+    server = DriftServer(
+        (args.host, args.port),
+        max_batch=args.max_batch,
+        max_wait=args.max_wait_ms / 1000,
+        max_queue=args.max_queue,
+        request_timeout=args.timeout,
+        verbose=args.verbose,
+        escalation=EscalationMonitor(window=args.escalation_window) if args.escalation else None,
+    )
+    warm_up()
+    if args.metrics:
+        enable_instrumentation(trace_rate=args.trace_rate)
+    if args.result_cache:
+        configure_result_cache(enabled=True, max_bytes=int(args.result_cache_mb * 2**20), path=args.result_cache_path)
+    host, port = server.server_address[:2]
+    print(f"[lloyd-drift] serving on http://{host}:{port}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+def main(argv: Optional[list] = None) -> int:
+    return run(build_parser().parse_args(argv))
+
+
+if __name__ == "__main__":
+    sys.exit(main())